@@ -1,33 +1,106 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
+from app.core.executors import Workload, executors
 from app.core.response import ResponseMessage
 from app.core.status import CommonCode
 from app.schemas.annotation.hierarchical_response_model import HierarchicalDBMSAnnotation
 from app.schemas.annotation.request_model import AnnotationCreateRequest
-from app.schemas.annotation.response_model import AnnotationDeleteResponse, FullAnnotationResponse
+from app.schemas.annotation.response_model import (
+    AnnotationDeleteResponse,
+    AnnotationJobResponse,
+    FullAnnotationResponse,
+)
+from app.services.annotation_job_service import AnnotationJobService, annotation_job_service
 from app.services.annotation_service import AnnotationService, annotation_service
 
 annotation_service_dependency = Depends(lambda: annotation_service)
+annotation_job_service_dependency = Depends(lambda: annotation_job_service)
 
 router = APIRouter()
 
 
 @router.post(
     "/create",
-    response_model=ResponseMessage[FullAnnotationResponse],
+    response_model=ResponseMessage[FullAnnotationResponse | AnnotationJobResponse],
     summary="새로운 어노테이션 생성",
 )
 async def create_annotation(
     request: AnnotationCreateRequest,
+    job: bool = Query(False, description="백그라운드 작업으로 생성할지 여부"),
     service: AnnotationService = annotation_service_dependency,
-) -> ResponseMessage[FullAnnotationResponse]:
+    job_service: AnnotationJobService = annotation_job_service_dependency,
+) -> ResponseMessage[FullAnnotationResponse | AnnotationJobResponse]:
     """
     `db_profile_id`를 받아 AI를 통해 DB 스키마를 분석하고 어노테이션을 생성하여 반환합니다.
+
+    `job=true`이면 생성 작업을 백그라운드로 등록하고 작업 정보를 바로 반환합니다.
+    진행 상황은 `GET /annotations/job/{job_id}`(폴링) 또는 `GET /annotations/job/{job_id}/events`(SSE)로 확인합니다.
     """
+    if job:
+        annotation_job = await executors.run(Workload.LOCAL_STORAGE, job_service.submit, request)
+        return ResponseMessage.success(value=annotation_job, code=CommonCode.SUCCESS_SUBMIT_ANNOTATION_JOB)
+
     new_annotation = await service.create_annotation(request)
     return ResponseMessage.success(value=new_annotation, code=CommonCode.SUCCESS_CREATE_ANNOTATION)
 
 
+@router.get(
+    "/job/{job_id}",
+    response_model=ResponseMessage[AnnotationJobResponse],
+    summary="어노테이션 생성 작업 상태 조회",
+)
+def find_annotation_job(
+    job_id: str,
+    job_service: AnnotationJobService = annotation_job_service_dependency,
+) -> ResponseMessage[AnnotationJobResponse]:
+    """
+    작업 상태와 진행 단계(scan → sample → ai → persist), 진행률을 조회합니다.
+    완료되면 생성된 `annotation_id`를, 실패하면 실패 코드와 사유를 함께 반환합니다.
+    """
+    annotation_job = job_service.find_job(job_id)
+    return ResponseMessage.success(value=annotation_job, code=CommonCode.SUCCESS_FIND_ANNOTATION_JOB)
+
+
+@router.get(
+    "/job/{job_id}/events",
+    summary="어노테이션 생성 작업 진행 상황 구독 (SSE)",
+)
+async def watch_annotation_job(
+    job_id: str,
+    job_service: AnnotationJobService = annotation_job_service_dependency,
+) -> StreamingResponse:
+    """
+    작업 상태가 바뀔 때마다 `progress` 이벤트로 작업 정보를 전송하고, 작업이 끝나면 `done` 이벤트 후 연결을 종료합니다.
+    """
+    # 작업이 없으면 스트림을 열기 전에 404 로 응답합니다.
+    await executors.run(Workload.LOCAL_STORAGE, job_service.find_job, job_id)
+
+    async def events():
+        async for annotation_job in job_service.watch(job_id):
+            event = "done" if annotation_job.status.is_finished else "progress"
+            yield f"event: {event}\ndata: {annotation_job.model_dump_json()}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+@router.post(
+    "/job/{job_id}/resume",
+    response_model=ResponseMessage[AnnotationJobResponse],
+    summary="어노테이션 생성 작업 재개",
+)
+def resume_annotation_job(
+    job_id: str,
+    job_service: AnnotationJobService = annotation_job_service_dependency,
+) -> ResponseMessage[AnnotationJobResponse]:
+    """
+    실패했거나 서버 종료로 중단된 작업을 다시 실행합니다.
+    AI 응답을 이미 받은 작업은 AI 요청 없이 저장 단계부터 진행합니다.
+    """
+    annotation_job = job_service.resume(job_id)
+    return ResponseMessage.success(value=annotation_job, code=CommonCode.SUCCESS_SUBMIT_ANNOTATION_JOB)
+
+
 @router.get(
     "/find/{annotation_id}",
     response_model=ResponseMessage[FullAnnotationResponse],
@@ -1,9 +1,15 @@
 # app/api/health_api.py
 from fastapi import APIRouter
 
+from app.core.readiness import readiness
+
 router = APIRouter(tags=["Health"])
 
 
 @router.get("/health")
 async def health_check():
-    return {"status": "ok", "message": "Service is healthy"}
+    """
+    서버 상태와 시작 단계별 진행 상황을 반환합니다.
+    프로세스가 살아 있으면 항상 200을 반환하며, 준비 여부는 `readiness.status`로 확인합니다.
+    """
+    return {"status": "ok", "message": "Service is healthy", "readiness": readiness.snapshot()}
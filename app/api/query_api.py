@@ -3,54 +3,268 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response, StreamingResponse
+from starlette.background import BackgroundTask
 
+from app.core import serialization
+from app.core.enum.result_format import ResultFormatEnum
+from app.core.enum.stream_format import StreamFormatEnum
 from app.core.exceptions import APIException
 from app.core.response import ResponseMessage
+from app.core.status import CommonCode
+from app.db.query_handles import RunningQuery
 from app.schemas.query.query_model import QueryInfo, RequestExecutionQuery
-from app.services.query_service import QueryService, query_service
+from app.schemas.query.result_model import QueryJob, QueryPlan, QuerySessionPage, ScriptResult
+from app.services.query_job_service import QueryJobService, query_job_service
+from app.services.query_service import DEFAULT_STREAM_FETCH_SIZE, QueryService, query_service
+from app.services.query_session_service import DEFAULT_PAGE_SIZE, QuerySessionService, query_session_service
 from app.services.user_db_service import UserDbService, user_db_service
 
 query_service_dependency = Depends(lambda: query_service)
 user_db_service_dependency = Depends(lambda: user_db_service)
+query_session_service_dependency = Depends(lambda: query_session_service)
+query_job_service_dependency = Depends(lambda: query_job_service)
 
 router = APIRouter()
 
 
 @router.post(
     "/execute",
-    response_model=ResponseMessage[dict | str | None],
+    response_model=ResponseMessage[QueryJob | dict | int | str | None],
     summary="쿼리 실행",
+    description="`format`으로 결과 행 형식을 지정합니다. dict(기본값) | rows(행 배열) | columns(열 배열) | "
+    "arrow(Apache Arrow IPC 스트림, pyarrow 필요)\n\n"
+    "`job=true`이면 쿼리를 백그라운드 작업으로 등록하고 작업 정보를 바로 반환합니다. "
+    "상태와 결과는 `GET /query/job/{job_id}`로 조회합니다.\n\n"
+    "`cache=true`이면 같은 프로필/DB에서 최근 실행한 같은 조회 쿼리의 결과를 재사용합니다. "
+    "데이터를 바꾸는 쿼리가 실행되면 해당 프로필의 캐시는 비워집니다.",
 )
 def execution(
     query_info: RequestExecutionQuery,
+    format: ResultFormatEnum = ResultFormatEnum.dict,
+    job: bool = Query(False, description="비동기 작업으로 실행할지 여부"),
+    cache: bool = Query(False, description="캐시된 조회 결과 재사용 여부"),
     service: QueryService = query_service_dependency,
     userDbservice: UserDbService = user_db_service_dependency,
-) -> ResponseMessage[dict | str | None]:
+    job_service: QueryJobService = query_job_service_dependency,
+) -> ResponseMessage[QueryJob | dict | int | str | None]:
     db_info = userDbservice.find_profile(query_info.user_db_id)
-    result = service.execution(query_info, db_info)
+    if job:
+        query_job = job_service.submit(query_info, db_info, format, cache)
+        return ResponseMessage.success(value=query_job, code=CommonCode.SUCCESS_SUBMIT_QUERY_JOB)
+
+    result = service.execution(query_info, db_info, format, cache)
 
     if not result.is_successful:
         raise APIException(result.code)
+    if format is ResultFormatEnum.arrow and isinstance(result.data, dict):
+        return _arrow_response(result.data)
     return ResponseMessage.success(value=result.data, code=result.code)
 
 
+@router.get(
+    "/job/{job_id}",
+    response_model=ResponseMessage[QueryJob],
+    summary="쿼리 실행 작업 상태/결과 조회",
+    description="작업이 끝나면(`succeeded`) `result`에 실행 결과가 포함됩니다. 완료된 작업은 일정 시간 후 삭제됩니다.",
+)
+def find_query_job(
+    job_id: str,
+    job_service: QueryJobService = query_job_service_dependency,
+) -> ResponseMessage[QueryJob]:
+    query_job = job_service.find_job(job_id)
+
+    return ResponseMessage.success(value=query_job, code=CommonCode.SUCCESS_FIND_QUERY_JOB)
+
+
+@router.delete(
+    "/job/{job_id}",
+    response_model=ResponseMessage[QueryJob],
+    summary="쿼리 실행 작업 취소",
+    description="대기 중인 작업은 실행하지 않고, 실행 중인 작업은 DB에서 쿼리를 중단시킵니다.",
+)
+def cancel_query_job(
+    job_id: str,
+    job_service: QueryJobService = query_job_service_dependency,
+) -> ResponseMessage[QueryJob]:
+    query_job = job_service.cancel_job(job_id)
+
+    return ResponseMessage.success(value=query_job, code=CommonCode.SUCCESS)
+
+
+@router.post(
+    "/execute/script",
+    response_model=ResponseMessage[ScriptResult],
+    summary="스크립트 실행",
+    description="여러 문장으로 된 스크립트를 문장 단위로 나누어 하나의 트랜잭션으로 실행하고, "
+    "문장별 결과(행 수, 결과 행, 실행 시간)를 반환합니다. 한 문장이라도 실패하면 전체를 롤백합니다. "
+    "`format`은 dict(기본값) | rows | columns 를 지원합니다.",
+)
+def execute_script(
+    query_info: RequestExecutionQuery,
+    format: ResultFormatEnum = ResultFormatEnum.dict,
+    service: QueryService = query_service_dependency,
+    userDbservice: UserDbService = user_db_service_dependency,
+) -> ResponseMessage[ScriptResult]:
+    db_info = userDbservice.find_profile(query_info.user_db_id)
+    result = service.execute_script(query_info, db_info, format)
+
+    return ResponseMessage.success(value=result.data, code=result.code)
+
+
+@router.post(
+    "/execute/stream",
+    response_class=StreamingResponse,
+    summary="쿼리 실행 (결과 스트리밍)",
+    description="결과를 서버 측 커서로 나누어 읽으며 바로 전송합니다. 결과 크기와 관계없이 메모리 사용량이 일정합니다. "
+    "`format=ndjson`은 컬럼 헤더 줄 뒤에 한 줄에 한 행(배열)을, `format=json`은 기존 응답 형태에 "
+    "`data.rows` 배열을 나누어 전송합니다.",
+)
+def execution_stream(
+    query_info: RequestExecutionQuery,
+    format: StreamFormatEnum = StreamFormatEnum.ndjson,
+    fetch_size: int = Query(DEFAULT_STREAM_FETCH_SIZE, ge=1, le=50000, description="한 번에 읽어 전송할 행 수"),
+    service: QueryService = query_service_dependency,
+    userDbservice: UserDbService = user_db_service_dependency,
+) -> StreamingResponse:
+    db_info = userDbservice.find_profile(query_info.user_db_id)
+    stream = service.execution_stream(query_info, db_info, fetch_size)
+
+    return StreamingResponse(
+        service.render_stream(stream, format),
+        media_type=format.media_type,
+        # 클라이언트가 도중에 연결을 끊어도 커넥션이 반납되도록 응답 종료 후 한 번 더 정리합니다.
+        background=BackgroundTask(stream.close),
+    )
+
+
+@router.post(
+    "/session",
+    response_model=ResponseMessage[QuerySessionPage],
+    summary="쿼리 실행 (결과 세션)",
+    description="쿼리를 한 번 실행하고 첫 페이지를 반환합니다. 남은 결과는 `session_id`로 이어서 조회합니다.",
+)
+def open_query_session(
+    query_info: RequestExecutionQuery,
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=10000, description="페이지당 행 수"),
+    session_service: QuerySessionService = query_session_service_dependency,
+    userDbservice: UserDbService = user_db_service_dependency,
+) -> ResponseMessage[QuerySessionPage]:
+    db_info = userDbservice.find_profile(query_info.user_db_id)
+    page = session_service.open_session(query_info, db_info, page_size)
+
+    return ResponseMessage.success(value=page, code=CommonCode.SUCCESS_EXECUTION)
+
+
+@router.get(
+    "/session/{session_id}/next",
+    response_model=ResponseMessage[QuerySessionPage],
+    summary="결과 세션의 다음 페이지 조회",
+)
+def fetch_query_session_page(
+    session_id: str,
+    page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=10000, description="페이지당 행 수"),
+    session_service: QuerySessionService = query_session_service_dependency,
+) -> ResponseMessage[QuerySessionPage]:
+    page = session_service.fetch_next_page(session_id, page_size)
+
+    return ResponseMessage.success(value=page, code=CommonCode.SUCCESS)
+
+
+@router.delete(
+    "/session/{session_id}",
+    response_model=ResponseMessage[bool],
+    summary="결과 세션 닫기",
+)
+def close_query_session(
+    session_id: str,
+    session_service: QuerySessionService = query_session_service_dependency,
+) -> ResponseMessage[bool]:
+    closed = session_service.close_session(session_id)
+
+    return ResponseMessage.success(value=closed, code=CommonCode.SUCCESS)
+
+
 @router.post(
     "/execute/test",
     response_model=ResponseMessage[Any],
     summary="쿼리 실행",
+    description="`format`으로 결과 행 형식을 지정합니다. dict(기본값) | rows(행 배열) | columns(열 배열) | "
+    "arrow(Apache Arrow IPC 스트림, pyarrow 필요)\n\n"
+    "조회 결과는 `max_rows`행 / `max_bytes`바이트까지만 읽고 나머지는 DB에서 가져오지 않습니다. "
+    "잘린 경우 결과의 `truncated`가 true입니다. (arrow 형식은 `X-Result-Truncated` 헤더)",
 )
 def execution_test(
     query_info: QueryInfo,
+    format: ResultFormatEnum = ResultFormatEnum.dict,
+    max_rows: int | None = Query(
+        None, ge=1, le=100000, description="반환할 최대 행 수 (기본값: ENV_QUERY_TEST_MAX_ROWS, 없으면 1000)"
+    ),
+    max_bytes: int | None = Query(
+        None, ge=1, description="반환할 결과의 최대 크기(바이트) (기본값: ENV_QUERY_TEST_MAX_BYTES, 없으면 5MiB)"
+    ),
     service: QueryService = query_service_dependency,
     userDbservice: UserDbService = user_db_service_dependency,
 ) -> ResponseMessage[Any]:
     db_info = userDbservice.find_profile(query_info.user_db_id)
-    result = service.execution_test(query_info, db_info)
+    result = service.execution_test(query_info, db_info, format, max_rows, max_bytes)
 
+    if format is ResultFormatEnum.arrow and result.is_successful and isinstance(result.data, dict):
+        response = _arrow_response(result.data)
+        response.headers["X-Result-Truncated"] = str(result.data["truncated"]).lower()
+        return response
     return ResponseMessage.success(value=result.data, code=result.code)
 
 
+@router.post(
+    "/explain",
+    response_model=ResponseMessage[QueryPlan | str],
+    summary="쿼리 실행 계획 조회",
+    description="쿼리를 실행하지 않고 DB의 실행 계획을 조회합니다. 결과는 DB 종류와 관계없이 연산 트리"
+    "(연산, 대상, 예상 행 수, 예상 비용)로 정규화되며 원본 계획(`raw`)도 함께 반환합니다. "
+    "계획을 세울 수 없는 쿼리는 오류 메시지를 반환하므로, 전체 실행 없이 쿼리를 검증하는 데 사용할 수 있습니다.",
+)
+def explain_query(
+    query_info: QueryInfo,
+    service: QueryService = query_service_dependency,
+    userDbservice: UserDbService = user_db_service_dependency,
+) -> ResponseMessage[QueryPlan | str]:
+    db_info = userDbservice.find_profile(query_info.user_db_id)
+    result = service.explain(query_info, db_info)
+
+    return ResponseMessage.success(value=result.data, code=result.code)
+
+
+@router.post(
+    "/cancel/{handle_id}",
+    response_model=ResponseMessage[bool],
+    summary="실행 중인 쿼리 취소",
+    description="실행 요청 시 지정한 `handle_id`로 실행 중인 쿼리를 DB에서 중단시킵니다.",
+)
+def cancel_query(
+    handle_id: str,
+    service: QueryService = query_service_dependency,
+) -> ResponseMessage[bool]:
+    service.cancel(handle_id)
+
+    return ResponseMessage.success(value=True, code=CommonCode.SUCCESS)
+
+
+@router.get(
+    "/running",
+    response_model=ResponseMessage[list[RunningQuery]],
+    summary="실행 중인 쿼리 목록 조회",
+)
+def find_running_queries(
+    profile_id: str | None = None,
+    service: QueryService = query_service_dependency,
+) -> ResponseMessage[list[RunningQuery]]:
+    running_queries = service.find_running(profile_id)
+
+    return ResponseMessage.success(value=running_queries, code=CommonCode.SUCCESS)
+
+
 @router.get(
     "/find/{chat_tab_id}",
     response_model=ResponseMessage[dict],
@@ -65,3 +279,11 @@ def find_query_history(
     if not result.is_successful:
         raise APIException(result.code)
     return ResponseMessage.success(value=result.data, code=result.code)
+
+
+def _arrow_response(result: dict) -> Response:
+    """조회 결과({"columns", "data"})를 Arrow IPC 스트림 응답으로 변환합니다."""
+    return Response(
+        content=serialization.encode_arrow_ipc(result["columns"], result["data"]),
+        media_type=serialization.ARROW_STREAM_MEDIA_TYPE,
+    )
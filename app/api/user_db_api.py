@@ -7,7 +7,7 @@ from app.core.exceptions import APIException
 from app.core.response import ResponseMessage
 from app.core.status import CommonCode
 from app.schemas.user_db.db_profile_model import DBProfileInfo, UpdateOrCreateDBProfile
-from app.schemas.user_db.result_model import ColumnInfo, DBDetail, DBProfile, TableInfo
+from app.schemas.user_db.result_model import ColumnInfo, DBDetail, DBProfile, SchemaChangeSet, TableInfo
 from app.services.user_db_service import UserDbService, user_db_service
 
 user_db_service_dependency = Depends(lambda: user_db_service)
@@ -102,9 +102,11 @@ def find_all_profile(
     response_model=ResponseMessage[list[str]],
     summary="특정 DB의 전체 스키마 조회",
 )
-def find_schemas(profile_id: str, service: UserDbService = user_db_service_dependency) -> ResponseMessage[list[str]]:
+def find_schemas(
+    profile_id: str, refresh: bool = False, service: UserDbService = user_db_service_dependency
+) -> ResponseMessage[list[str]]:
     db_info = service.find_profile(profile_id)
-    result = service.find_schemas(db_info)
+    result = service.find_schemas(db_info, refresh)
 
     if not result.is_successful:
         raise APIException(result.code)
@@ -117,10 +119,10 @@ def find_schemas(profile_id: str, service: UserDbService = user_db_service_depen
     summary="특정 스키마의 전체 테이블 조회",
 )
 def find_tables(
-    profile_id: str, schema_name: str, service: UserDbService = user_db_service_dependency
+    profile_id: str, schema_name: str, refresh: bool = False, service: UserDbService = user_db_service_dependency
 ) -> ResponseMessage[list[str]]:
     db_info = service.find_profile(profile_id)
-    result = service.find_tables(db_info, schema_name)
+    result = service.find_tables(db_info, schema_name, refresh)
 
     if not result.is_successful:
         raise APIException(result.code)
@@ -133,10 +135,14 @@ def find_tables(
     summary="특정 테이블의 전체 컬럼 조회",
 )
 def find_columns(
-    profile_id: str, schema_name: str, table_name: str, service: UserDbService = user_db_service_dependency
+    profile_id: str,
+    schema_name: str,
+    table_name: str,
+    refresh: bool = False,
+    service: UserDbService = user_db_service_dependency,
 ) -> ResponseMessage[list[ColumnInfo]]:
     db_info = service.find_profile(profile_id)
-    result = service.find_columns(db_info, schema_name, table_name)
+    result = service.find_columns(db_info, schema_name, table_name, refresh)
 
     if not result.is_successful:
         raise APIException(result.code)
@@ -147,13 +153,14 @@ def find_columns(
     "/find/all-schemas/{profile_id}",
     response_model=ResponseMessage[list[TableInfo]],
     summary="특정 DB의 전체 스키마의 상세 정보 조회",
-    description="테이블, 컬럼, 제약조건, 인덱스를 포함한 모든 스키마 정보를 반환합니다.",
+    description="테이블, 컬럼, 제약조건, 인덱스를 포함한 모든 스키마 정보를 반환합니다. "
+    "스키마가 바뀌지 않았다면 캐시된 결과를 반환하며, `refresh=true`로 다시 조회할 수 있습니다.",
 )
 def find_all_schema_info(
-    profile_id: str, service: UserDbService = user_db_service_dependency
+    profile_id: str, refresh: bool = False, service: UserDbService = user_db_service_dependency
 ) -> ResponseMessage[list[TableInfo]]:
     db_info = service.find_profile(profile_id)
-    full_schema_info = service.get_full_schema_info(db_info)
+    full_schema_info = service.get_full_schema_info(db_info, refresh)
 
     return ResponseMessage.success(value=full_schema_info, code=CommonCode.SUCCESS)
 
@@ -165,9 +172,26 @@ def find_all_schema_info(
     description="스키마, 테이블, 컬럼, 제약조건, 인덱스를 포함한 모든 스키마 정보를 계층 구조로 반환합니다.",
 )
 def find_hierarchical_schema_info(
-    profile_id: str, service: UserDbService = user_db_service_dependency
+    profile_id: str, refresh: bool = False, service: UserDbService = user_db_service_dependency
 ) -> ResponseMessage[list[DBDetail]]:
     db_info = service.find_profile(profile_id)
-    hierarchical_schema_info = service.get_hierarchical_schema_info(db_info)
+    hierarchical_schema_info = service.get_hierarchical_schema_info(db_info, refresh)
 
     return ResponseMessage.success(value=hierarchical_schema_info, code=CommonCode.SUCCESS)
+
+
+@router.get(
+    "/find/schema-changes/{profile_id}",
+    response_model=ResponseMessage[list[SchemaChangeSet]],
+    summary="특정 DB의 스키마 변경 내역 조회",
+    description="이 API를 직전에 호출한 이후 추가/변경/삭제된 테이블 목록을 스키마별로 반환합니다. "
+    "변경된 테이블만 다시 조회하며, 조회 결과는 다음 비교의 기준이 됩니다. "
+    "(다른 스키마 조회 API는 이 기준을 바꾸지 않습니다)",
+)
+def find_schema_changes(
+    profile_id: str, service: UserDbService = user_db_service_dependency
+) -> ResponseMessage[list[SchemaChangeSet]]:
+    db_info = service.find_profile(profile_id)
+    rescan_result = service.rescan_schema(db_info)
+
+    return ResponseMessage.success(value=rescan_result.changes, code=CommonCode.SUCCESS)
@@ -0,0 +1,38 @@
+from enum import Enum
+
+
+class AnnotationJobStatusEnum(str, Enum):
+    """어노테이션 생성 작업 상태"""
+
+    pending = "pending"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+    # 실행 도중 서버가 종료되어 중단된 작업 (재개 가능)
+    interrupted = "interrupted"
+
+    @property
+    def is_finished(self) -> bool:
+        return self in (
+            AnnotationJobStatusEnum.succeeded,
+            AnnotationJobStatusEnum.failed,
+            AnnotationJobStatusEnum.interrupted,
+        )
+
+    @property
+    def is_resumable(self) -> bool:
+        return self in (AnnotationJobStatusEnum.failed, AnnotationJobStatusEnum.interrupted)
+
+
+class AnnotationJobPhaseEnum(str, Enum):
+    """어노테이션 생성 단계 (값 순서대로 진행)"""
+
+    scan = "scan"
+    sample = "sample"
+    ai = "ai"
+    persist = "persist"
+
+    @property
+    def start_progress(self) -> int:
+        """단계가 시작될 때의 진행률(%)"""
+        return {"scan": 0, "sample": 30, "ai": 45, "persist": 90}[self.value]
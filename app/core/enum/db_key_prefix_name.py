@@ -10,6 +10,8 @@ class DBSaveIdEnum(Enum):
     api_key = "API-KEY"
     chat_tab = "CHAT-TAB"
     query = "QUERY"
+    query_session = "QUERY-SESSION"
+    query_job = "QUERY-JOB"
     chat_message = "CHAT-MESSAGE"
 
     database_annotation = "DB-ANNO"
@@ -20,3 +22,4 @@ class DBSaveIdEnum(Enum):
     index_annotation = "IDX-ANNO"
     index_column = "IC-ANNO"
     table_relationship = "TR-ANNO"
+    annotation_job = "ANNO-JOB"
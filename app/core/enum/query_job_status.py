@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class QueryJobStatusEnum(str, Enum):
+    """비동기 쿼리 실행 작업 상태"""
+
+    pending = "pending"
+    running = "running"
+    succeeded = "succeeded"
+    failed = "failed"
+    canceled = "canceled"
+
+    @property
+    def is_finished(self) -> bool:
+        return self in (QueryJobStatusEnum.succeeded, QueryJobStatusEnum.failed, QueryJobStatusEnum.canceled)
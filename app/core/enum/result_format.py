@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class ResultFormatEnum(str, Enum):
+    """쿼리 실행 결과의 행 표현 형식"""
+
+    dict = "dict"  # [{컬럼: 값, ...}, ...] (기본값)
+    rows = "rows"  # [[값, ...], ...] 컬럼 순서를 따르는 행 배열
+    columns = "columns"  # [[컬럼1 값들], [컬럼2 값들], ...] 열 단위 배열
+    arrow = "arrow"  # Apache Arrow IPC 스트림 (pyarrow 필요)
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class StreamFormatEnum(str, Enum):
+    """쿼리 결과 스트리밍 응답 형식"""
+
+    ndjson = "ndjson"
+    json = "json"
+
+    @property
+    def media_type(self) -> str:
+        return "application/x-ndjson" if self is StreamFormatEnum.ndjson else "application/json"
@@ -28,9 +28,10 @@ class APIException(Exception):
     API 로직 내에서 발생하는 모든 예상된 오류에 사용할 기본 예외 클래스입니다.
     """
 
-    def __init__(self, code: CommonCode, *args):
+    def __init__(self, code: CommonCode, *args, detail: str | None = None):
         self.code_enum = code
         self.message = code.message
+        self.detail = detail
         self.args = args
         super().__init__(self.message)
 
@@ -0,0 +1,149 @@
+# app/core/executors.py
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from enum import Enum
+from itertools import islice
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Workload(Enum):
+    """
+    작업 종류별 스레드 풀 구분과 기본 크기입니다.
+    (값: 최대 워커 수를 덮어쓸 환경 변수 이름, 기본 워커 수)
+    """
+
+    SCHEMA_SCAN = ("ENV_SCHEMA_SCAN_MAX_WORKERS", 8)
+    QUERY_JOB = ("ENV_QUERY_JOB_MAX_WORKERS", 4)
+    ANNOTATION_JOB = ("ENV_ANNOTATION_JOB_MAX_WORKERS", 2)
+    # 비동기 엔드포인트에서 호출하는 동기 작업
+    # - LOCAL_STORAGE: 로컬 저장소(SQLite) 조회/저장
+    # - CATALOG: 사용자 DB 스키마/샘플 조회 (테이블별 하위 조회는 SCHEMA_SCAN 풀에서 실행)
+    LOCAL_STORAGE = ("ENV_LOCAL_STORAGE_MAX_WORKERS", 4)
+    CATALOG = ("ENV_CATALOG_MAX_WORKERS", 4)
+
+    @property
+    def max_workers(self) -> int:
+        env_name, default = self.value
+        try:
+            return max(1, int(os.getenv(env_name, default)))
+        except ValueError:
+            logging.warning(f"환경 변수 '{env_name}' 값이 숫자가 아니어서 기본값 {default}을 사용합니다.")
+            return default
+
+
+class WorkloadExecutors:
+    """
+    작업 종류별로 크기가 제한된 스레드 풀을 관리합니다.
+    - 풀은 처음 사용할 때 생성되며, 같은 종류의 작업은 요청이 달라도 같은 풀을 공유합니다.
+    - 풀 안에서 다시 같은 풀에 작업을 넣고 기다리면 교착될 수 있으므로, 작업은 평탄화하여 제출해야 합니다.
+    """
+
+    def __init__(self):
+        self._executors: dict[Workload, ThreadPoolExecutor] = {}
+        self._lock = threading.Lock()
+
+    def get(self, workload: Workload) -> ThreadPoolExecutor:
+        with self._lock:
+            executor = self._executors.get(workload)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=workload.max_workers, thread_name_prefix=f"{workload.name.lower()}-worker"
+                )
+                self._executors[workload] = executor
+            return executor
+
+    def submit(self, workload: Workload, func: Callable[..., R], *args: Any, **kwargs: Any) -> Future:
+        """`func`를 작업 종류별 풀에 제출합니다."""
+        return self.get(workload).submit(func, *args, **kwargs)
+
+    async def run(self, workload: Workload, func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+        """
+        동기 함수 `func`를 작업 종류별 풀에서 실행하고 결과를 기다립니다.
+        비동기 엔드포인트에서 이벤트 루프를 막지 않고 DB 조회 등 블로킹 작업을 호출할 때 사용합니다.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        call = functools.partial(context.run, func, *args, **kwargs)
+        return await loop.run_in_executor(self.get(workload), call)
+
+    def facade(self, target: Any, workload: Workload) -> "AsyncFacade":
+        """`target`의 메서드를 `workload` 풀에서 실행하는 비동기 래퍼를 반환합니다."""
+        return AsyncFacade(target, workload, self)
+
+    def map_ordered(
+        self,
+        workload: Workload,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        max_concurrency: int | None = None,
+    ) -> list[R]:
+        """
+        `items` 각각에 `func`를 병렬로 실행하고, 결과를 입력 순서대로 반환합니다.
+        - 한 호출이 동시에 실행하는 작업 수는 `max_concurrency`(기본: 풀 크기)로 제한됩니다.
+        - 작업 중 하나라도 예외가 발생하면 아직 시작하지 않은 작업은 취소하고 해당 예외를 다시 발생시킵니다.
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        executor = self.get(workload)
+        limit = max(1, min(max_concurrency or workload.max_workers, workload.max_workers))
+        results: list[Any] = [None] * len(items)
+        remaining = iter(enumerate(items))
+        pending: dict[Future, int] = {executor.submit(func, item): index for index, item in islice(remaining, limit)}
+
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    results[index] = future.result()
+                    for next_index, next_item in islice(remaining, 1):
+                        pending[executor.submit(func, next_item)] = next_index
+        except BaseException:
+            for future in pending:
+                future.cancel()
+            raise
+        return results
+
+    def shutdown(self) -> None:
+        """모든 풀을 종료합니다. (애플리케이션 종료 시 사용)"""
+        with self._lock:
+            executors, self._executors = list(self._executors.values()), {}
+        for executor in executors:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+class AsyncFacade:
+    """
+    동기 객체(레포지토리, 서비스 등)의 메서드를 비동기로 호출할 수 있도록 감싼 래퍼입니다.
+    `await facade.method(...)`는 원래 메서드를 지정한 작업 풀에서 실행합니다.
+    """
+
+    def __init__(self, target: Any, workload: Workload, workload_executors: WorkloadExecutors):
+        self._target = target
+        self._workload = workload
+        self._executors = workload_executors
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self._executors.run(self._workload, attr, *args, **kwargs)
+
+        call.__name__ = name
+        return call
+
+
+executors = WorkloadExecutors()
@@ -0,0 +1,131 @@
+# app/core/readiness.py
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+from app.core.exceptions import APIException
+from app.core.status import CommonCode
+
+PhaseStatus = Literal["pending", "running", "done", "failed", "skipped"]
+
+# 요청이 로컬 저장소 초기화 완료를 기다리는 최대 시간(초)
+READY_WAIT_TIMEOUT = 30.0
+
+
+class StartupPhase(BaseModel):
+    """시작 파이프라인의 단계별 진행 상태입니다."""
+
+    name: str = Field(..., description="단계 이름")
+    status: PhaseStatus = Field("pending", description="진행 상태")
+    required: bool = Field(True, description="API 요청 처리에 반드시 필요한 단계인지 여부")
+    started_at: datetime | None = Field(None, description="시작 시각")
+    duration_ms: float | None = Field(None, description="소요 시간 (ms)")
+    error: str | None = Field(None, description="실패 사유")
+
+
+class ReadinessState:
+    """
+    애플리케이션 시작 단계(마이그레이션, 워밍업 등)의 진행 상태를 관리합니다.
+    - 각 단계는 블로킹 함수를 스레드에서 실행하므로, 그동안에도 `/health`는 응답할 수 있습니다.
+    - 필수 단계가 모두 끝나면 `ready` 상태가 되고, 대기 중인 요청들이 처리됩니다.
+    - 필수 단계가 하나라도 실패하면 나머지 단계를 기다리지 않고 `degraded` 상태가 되며,
+      대기 중인 요청과 이후 요청은 SERVICE_DEGRADED 예외로 바로 거절됩니다.
+    """
+
+    def __init__(self):
+        self._phases: dict[str, StartupPhase] = {}
+        self._ready = asyncio.Event()
+        self._started = time.perf_counter()
+
+    def register(self, name: str, required: bool = True) -> None:
+        """시작 단계를 등록합니다. 등록된 필수 단계가 모두 끝나야 준비 완료로 판단합니다."""
+        self._phases[name] = StartupPhase(name=name, required=required)
+
+    async def run_phase(self, name: str, func: Callable[[], Any]) -> bool:
+        """
+        등록된 단계를 스레드에서 실행하고 소요 시간과 결과를 기록합니다. 성공 여부를 반환합니다.
+        실행 중에 취소되면 스레드는 중단할 수 없으므로, 단계가 끝날 때까지 기다린 뒤 취소를 전파합니다.
+        """
+        phase = self._phases.get(name)
+        if phase is None:
+            self.register(name)
+            phase = self._phases[name]
+
+        phase.status = "running"
+        phase.started_at = datetime.now()
+        started = time.perf_counter()
+        worker = asyncio.ensure_future(asyncio.to_thread(func))
+        try:
+            try:
+                await asyncio.shield(worker)
+            except asyncio.CancelledError:
+                # 종료 처리가 이 단계가 사용하는 자원을 정리하기 전에 단계가 끝나도록 기다립니다.
+                await asyncio.wait({worker})
+                raise
+            phase.status = "done"
+            return True
+        except Exception as e:
+            phase.status = "failed"
+            phase.error = str(e)
+            logging.error(f"시작 단계 '{name}' 실행 중 오류가 발생했습니다: {e}", exc_info=True)
+            return False
+        finally:
+            phase.duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            logging.info(f"시작 단계 '{name}' {phase.status} ({phase.duration_ms}ms)")
+            self._update_ready()
+
+    def skip_phase(self, name: str, reason: str) -> None:
+        """선행 단계가 실패하여 실행하지 않는 단계를 건너뜀(skipped)으로 기록합니다."""
+        phase = self._phases.get(name)
+        if phase is None:
+            self.register(name)
+            phase = self._phases[name]
+        phase.status = "skipped"
+        phase.error = reason
+        logging.warning(f"시작 단계 '{name}' skipped: {reason}")
+        self._update_ready()
+
+    @property
+    def status(self) -> str:
+        """전체 상태: starting(진행 중) / ready(준비 완료) / degraded(필수 단계 실패 또는 건너뜀)"""
+        if any(p.required and p.status in ("failed", "skipped") for p in self._phases.values()):
+            return "degraded"
+        return "ready" if self._ready.is_set() else "starting"
+
+    async def wait_until_ready(self) -> None:
+        """
+        필수 단계가 끝날 때까지 기다립니다. 시간 초과 시 SERVICE_NOT_READY 예외를,
+        필수 단계가 실패했거나 건너뛰어졌으면 SERVICE_DEGRADED 예외를 발생시킵니다.
+        (라우터 의존성으로 사용되므로 별도의 인자를 받지 않습니다.)
+        """
+        if not self._ready.is_set():
+            try:
+                await asyncio.wait_for(self._ready.wait(), READY_WAIT_TIMEOUT)
+            except TimeoutError as e:
+                raise APIException(CommonCode.SERVICE_NOT_READY) from e
+        if self.status == "degraded":
+            raise APIException(CommonCode.SERVICE_DEGRADED)
+
+    def snapshot(self) -> dict:
+        """`/health` 응답에 사용할 현재 상태를 반환합니다."""
+        return {
+            "status": self.status,
+            "uptime_ms": round((time.perf_counter() - self._started) * 1000, 2),
+            "phases": [phase.model_dump(mode="json") for phase in self._phases.values()],
+        }
+
+    def _update_ready(self) -> None:
+        required = [p for p in self._phases.values() if p.required]
+        # 필수 단계가 실패하면 나머지 단계가 남아 있어도 대기 중인 요청이 시간 초과까지 멈춰 있지 않도록 바로 종료합니다.
+        if any(p.status == "failed" for p in required) or all(
+            p.status in ("done", "failed", "skipped") for p in required
+        ):
+            self._ready.set()
+
+
+readiness = ReadinessState()
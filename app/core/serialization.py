@@ -0,0 +1,98 @@
+import base64
+import datetime
+import decimal
+import json
+import uuid
+from typing import Any
+
+from app.core.enum.result_format import ResultFormatEnum
+from app.core.exceptions import APIException
+from app.core.status import CommonCode
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+
+def to_json_value(value: Any) -> Any:
+    """
+    DB 드라이버가 반환하는 값 중 JSON으로 바로 표현할 수 없는 값을 변환합니다.
+    (`json.dumps`의 `default`로 사용합니다.)
+    """
+    if isinstance(value, datetime.datetime | datetime.date | datetime.time):
+        return value.isoformat()
+    if isinstance(value, decimal.Decimal):
+        # 정밀도 손실을 피하기 위해 정수가 아니면 문자열로 보냅니다.
+        return int(value) if value == value.to_integral_value() else str(value)
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, bytes | bytearray | memoryview):
+        return base64.b64encode(bytes(value)).decode("ascii")
+    if hasattr(value, "read"):
+        # Oracle LOB 등 지연 로딩 객체
+        return value.read()
+    return str(value)
+
+
+def dumps(value: Any) -> str:
+    """DB 조회 값을 포함한 객체를 공백 없는 JSON 문자열로 직렬화합니다."""
+    return json.dumps(value, default=to_json_value, ensure_ascii=False, separators=(",", ":"))
+
+
+def encode_ndjson_lines(values: list[Any]) -> bytes:
+    """객체 목록을 NDJSON(줄 단위 JSON) 바이트로 직렬화합니다."""
+    return "".join(f"{dumps(value)}\n" for value in values).encode()
+
+
+def encode_json_rows(rows: list[Any], leading_comma: bool) -> bytes:
+    """
+    행 목록을 JSON 배열 안에 이어 붙일 수 있는 조각(`[..],[..]`)으로 직렬화합니다.
+    앞선 조각이 있으면 `leading_comma`로 구분자를 붙입니다.
+    """
+    if not rows:
+        return b""
+    body = ",".join(dumps(row) for row in rows)
+    return f",{body}".encode() if leading_comma else body.encode()
+
+
+def shape_rows(columns: list[str], rows: list[Any], result_format: ResultFormatEnum) -> list[Any]:
+    """
+    조회한 행(튜플) 목록을 요청한 형식으로 변환합니다.
+    Arrow 형식은 응답 직전에 `encode_arrow_ipc`로 변환하므로 행 배열 그대로 반환합니다.
+    """
+    if result_format is ResultFormatEnum.dict:
+        return [dict(zip(columns, row, strict=False)) for row in rows]
+    if result_format is ResultFormatEnum.columns:
+        if not rows:
+            return [[] for _ in columns]
+        return [list(values) for values in zip(*rows, strict=True)]
+    return [list(row) for row in rows]
+
+
+def encode_arrow_ipc(columns: list[str], rows: list[Any]) -> bytes:
+    """
+    행 목록을 Apache Arrow IPC 스트림으로 직렬화합니다.
+    타입을 추론할 수 없는 열(값의 타입이 섞인 열 등)은 문자열 열로 변환합니다.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        raise APIException(CommonCode.UNSUPPORTED_RESULT_FORMAT) from e
+
+    column_values = zip(*rows, strict=True) if rows else ([] for _ in columns)
+    arrays = []
+    for values in column_values:
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays.append(pa.array([None if value is None else _to_text(value) for value in values]))
+
+    table = pa.Table.from_arrays(arrays, names=list(columns))
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def _to_text(value: Any) -> str:
+    return value if isinstance(value, str) else str(to_json_value(value))
@@ -0,0 +1,267 @@
+# app/core/sql_classifier.py
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+# 문자열 안의 역슬래시를 이스케이프로 해석하는 드라이버 (MySQL/MariaDB 기본 설정)
+BACKSLASH_ESCAPE_DRIVERS = ("mysql.connector", "pymysql")
+
+# 결과 행을 반환하는 조회용 문장의 첫 키워드 (예외로 처리하는 경우를 빼면 데이터를 바꾸지 않습니다)
+ROW_RETURNING_KEYWORDS = frozenset({"SELECT", "VALUES", "TABLE", "SHOW", "EXPLAIN", "DESCRIBE", "DESC", "PRAGMA"})
+# 서버 측 커서로 읽을 수 있는 순수 조회문의 키워드
+QUERY_KEYWORDS = frozenset({"SELECT", "VALUES", "TABLE"})
+# WITH 절 뒤에 올 수 있는 본문 키워드
+MAIN_KEYWORDS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "MERGE", "VALUES", "TABLE"})
+# 데이터를 바꾸는 문장 키워드 (CTE 본문에 오면 본문 키워드와 관계없이 쓰기 문장입니다)
+MODIFYING_KEYWORDS = frozenset({"INSERT", "UPDATE", "DELETE", "MERGE"})
+# 본문에 세미콜론이 들어가는 저장 프로시저류 객체
+ROUTINE_OBJECTS = frozenset({"PROCEDURE", "FUNCTION", "TRIGGER", "PACKAGE"})
+# `BEGIN` 뒤에 오면 블록이 아닌 트랜잭션 시작으로 보는 키워드
+TRANSACTION_BEGIN_WORDS = frozenset({"WORK", "TRANSACTION", "TRAN", "DEFERRED", "IMMEDIATE", "EXCLUSIVE", "ISOLATION"})
+# 트랜잭션을 끝내는 문장의 첫 키워드 (BEGIN/START 는 뒤따르는 단어로 판단합니다)
+TRANSACTION_END_KEYWORDS = frozenset({"COMMIT", "ROLLBACK", "END", "ABORT"})
+# `END` 뒤에 와서 BEGIN/CASE 블록을 닫지 않는 키워드 (END IF, END LOOP 등)
+NON_BLOCK_END_WORDS = frozenset({"IF", "LOOP", "WHILE", "REPEAT", "FOR"})
+# 루틴 헤더의 AS/IS 뒤에 와도 본문 블록이 시작되지 않는 키워드 (SQL Server, 외부 루틴 등)
+INLINE_BODY_WORDS = frozenset({"RETURN", "SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "LANGUAGE", "EXTERNAL"})
+
+_COMMON_TOKENS = (
+    r"(?P<space>\s+)"
+    r"|(?P<comment>--[^\n]*|/\*.*?(?:\*/|\Z))"
+    r"|(?P<quoted>"
+    r"[Ee]'(?:[^'\\]|\\.|'')*(?:'|\Z)"  # PostgreSQL E'' 문자열
+    r"|\$(?P<tag>(?:[^\W\d]\w*)?)\$.*?(?:\$(?P=tag)\$|\Z)"  # PostgreSQL 달러 인용
+    r"|\"(?:[^\"]|\"\")*(?:\"|\Z)"
+    r"|`(?:[^`]|``)*(?:`|\Z)"
+    r"|{string})"
+    r"|(?P<word>[^\W\d]\w*)"
+    r"|(?P<punct>.)"
+)
+_STANDARD_TOKEN = re.compile(_COMMON_TOKENS.format(string=r"'(?:[^']|'')*(?:'|\Z)"), re.DOTALL)
+_BACKSLASH_TOKEN = re.compile(_COMMON_TOKENS.format(string=r"'(?:[^'\\]|\\.|'')*(?:'|\Z)"), re.DOTALL)
+
+
+class SqlToken(NamedTuple):
+    kind: str  # word | quoted | punct
+    value: str  # word는 대문자로 변환한 값
+    start: int
+    end: int
+    depth: int  # 괄호 깊이
+
+
+class SqlStatement(NamedTuple):
+    """스크립트를 구성하는 문장 하나의 분류 결과"""
+
+    text: str
+    keyword: str  # 주 동작 키워드 (WITH 절은 본문 키워드, 예: WITH ... SELECT → SELECT)
+    returns_rows: bool  # 결과 행을 반환하는지 여부 (RETURNING 포함)
+    is_read_only: bool  # 데이터/스키마를 바꾸지 않는지 여부
+    is_query: bool  # 서버 측 커서로 읽을 수 있는 순수 조회문인지 여부
+    is_transaction_control: bool  # BEGIN/COMMIT/ROLLBACK 등 트랜잭션 제어문인지 여부
+
+
+class SqlScript(NamedTuple):
+    """쿼리 텍스트 전체의 분류 결과"""
+
+    statements: tuple[SqlStatement, ...]
+
+    @property
+    def returns_rows(self) -> bool:
+        """실행 결과로 행을 받게 되는지 여부 (여러 문장이면 드라이버는 마지막 문장의 결과를 반환합니다)"""
+        return bool(self.statements) and self.statements[-1].returns_rows
+
+    @property
+    def is_read_only(self) -> bool:
+        return bool(self.statements) and all(statement.is_read_only for statement in self.statements)
+
+    @property
+    def is_query(self) -> bool:
+        return len(self.statements) == 1 and self.statements[0].is_query
+
+
+@lru_cache(maxsize=512)
+def classify(query_text: str, driver_name: str | None = None) -> SqlScript:
+    """
+    쿼리 텍스트를 문장 단위로 나누고 각 문장의 종류를 분류합니다.
+    주석과 문자열/식별자 리터럴, 달러 인용, 프로시저 본문 안의 세미콜론은 문장 구분자로 보지 않습니다.
+    같은 쿼리가 반복 실행되는 경우가 많아 결과를 캐시합니다.
+    """
+    tokens = tokenize(query_text, driver_name in BACKSLASH_ESCAPE_DRIVERS)
+    statements = []
+    for statement_tokens in _split(tokens):
+        text = query_text[statement_tokens[0].start : statement_tokens[-1].end].strip()
+        statements.append(_classify_statement(text, statement_tokens))
+    return SqlScript(tuple(statements))
+
+
+def split_statements(query_text: str, driver_name: str | None = None) -> list[str]:
+    """쿼리 텍스트를 실행할 문장 목록으로 나눕니다. (끝의 세미콜론과 빈 문장은 제외)"""
+    return [statement.text for statement in classify(query_text, driver_name).statements]
+
+
+def tokenize(query_text: str, backslash_escapes: bool = False) -> list[SqlToken]:
+    """공백과 주석을 제외한 토큰 목록을 반환합니다."""
+    pattern = _BACKSLASH_TOKEN if backslash_escapes else _STANDARD_TOKEN
+    tokens = []
+    depth = 0
+    for match in pattern.finditer(query_text):
+        kind = match.lastgroup if match.lastgroup != "tag" else "quoted"
+        if kind in ("space", "comment"):
+            continue
+        value = match.group()
+        if value == ")":
+            depth = max(0, depth - 1)
+        tokens.append(SqlToken(kind, value.upper() if kind == "word" else value, match.start(), match.end(), depth))
+        if value == "(":
+            depth += 1
+    return tokens
+
+
+def _split(tokens: list[SqlToken]) -> list[list[SqlToken]]:
+    statements: list[list[SqlToken]] = []
+    current: list[SqlToken] = []
+    block = _BlockTracker()
+    for index, token in enumerate(tokens):
+        if token.value == ";" and token.kind == "punct" and not block.is_open:
+            if current:
+                statements.append(current)
+            current, block = [], _BlockTracker()
+            continue
+        current.append(token)
+        block.feed(current, tokens[index + 1] if index + 1 < len(tokens) else None)
+    if current:
+        statements.append(current)
+    return statements
+
+
+class _BlockTracker:
+    """
+    프로시저/익명 블록 본문처럼 세미콜론이 문장의 끝이 아닌 구간을 추적합니다.
+    - BEGIN/CASE ... END 의 깊이를 세고, 루틴 헤더의 AS/IS 또는 DECLARE 이후 선언부도 본문으로 봅니다.
+    - 일반 문장(SELECT 안의 CASE 등)은 추적하지 않습니다.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.pending_body = False
+        self.tracking = False
+        self._skip_next = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.depth > 0 or self.pending_body
+
+    def feed(self, current: list[SqlToken], next_token: SqlToken | None) -> None:
+        token = current[-1]
+        if token.kind != "word":
+            return
+        if self._skip_next:
+            self._skip_next = False
+            return
+        if len(current) == 1:
+            self._start(token.value, next_token)
+        elif token.value in ROUTINE_OBJECTS and current[0].value == "CREATE" and len(current) <= 6:
+            self.tracking = True
+        elif self.tracking:
+            self._track(token, next_token)
+
+    def _start(self, word: str, next_token: SqlToken | None) -> None:
+        if word == "DECLARE":
+            self.tracking = self.pending_body = True
+        elif word == "BEGIN" and next_token is not None and next_token.kind == "word":
+            if next_token.value not in TRANSACTION_BEGIN_WORDS:
+                self.tracking = True
+                self.depth = 1
+
+    def _track(self, token: SqlToken, next_token: SqlToken | None) -> None:
+        next_word = next_token.value if next_token is not None and next_token.kind == "word" else None
+        if token.value in ("AS", "IS", "DECLARE") and self.depth == 0 and token.depth == 0:
+            is_inline = next_token is not None and (next_token.kind == "quoted" or next_word in INLINE_BODY_WORDS)
+            self.pending_body = self.pending_body or not is_inline
+        elif token.value in ("BEGIN", "CASE"):
+            self.depth += 1
+        elif token.value == "END" and next_word in NON_BLOCK_END_WORDS:
+            self._skip_next = True
+        elif token.value == "END" and self.depth > 0:
+            self.depth -= 1
+            self._skip_next = next_word == "CASE"
+            if self.depth == 0:
+                self.pending_body = False
+
+
+def _classify_statement(text: str, tokens: list[SqlToken]) -> SqlStatement:
+    words = [token.value for token in tokens if token.kind == "word" and token.depth == 0]
+    first_word = next((token.value for token in tokens if token.kind == "word"), "")
+    keyword = _main_keyword(words) if first_word == "WITH" else first_word
+
+    returns_rows = keyword in ROW_RETURNING_KEYWORDS or (keyword in MAIN_KEYWORDS and "RETURNING" in words)
+    is_read_only = keyword in ROW_RETURNING_KEYWORDS
+    # WITH d AS (DELETE ... RETURNING *) SELECT ... 처럼 CTE 가 데이터를 바꾸면 본문이 조회문이어도 쓰기 문장입니다.
+    has_modifying_cte = first_word == "WITH" and _has_modifying_cte(tokens)
+    if has_modifying_cte:
+        is_read_only = False
+    elif keyword == "SELECT" and "INTO" in words:
+        # SELECT ... INTO 는 테이블 생성/변수 대입으로, 결과 행을 반환하지 않습니다.
+        returns_rows = is_read_only = False
+    elif keyword == "SELECT" and _has_locking_clause(words):
+        is_read_only = False
+    elif keyword == "EXPLAIN":
+        is_read_only = _is_read_only_explain(tokens)
+    elif keyword == "PRAGMA":
+        is_read_only = not any(token.value == "=" for token in tokens)
+
+    return SqlStatement(
+        text=text,
+        keyword=keyword,
+        returns_rows=returns_rows,
+        is_read_only=is_read_only,
+        is_query=keyword in QUERY_KEYWORDS and returns_rows and not has_modifying_cte,
+        is_transaction_control=_is_transaction_control(words),
+    )
+
+
+def _main_keyword(words: list[str]) -> str:
+    """WITH 절 뒤의 본문 키워드를 찾습니다. CTE 본문은 괄호 안에 있으므로 괄호 밖의 첫 동작 키워드가 본문입니다."""
+    return next((word for word in words[1:] if word in MAIN_KEYWORDS), words[0] if words else "")
+
+
+def _has_modifying_cte(tokens: list[SqlToken]) -> bool:
+    """괄호로 시작하는 CTE 본문(중첩 포함)의 첫 키워드가 INSERT/UPDATE/DELETE/MERGE 인지 확인합니다."""
+    return any(
+        token.kind == "word"
+        and token.value in MODIFYING_KEYWORDS
+        and previous.kind == "punct"
+        and previous.value == "("
+        for previous, token in zip(tokens, tokens[1:], strict=False)
+    )
+
+
+def _is_transaction_control(words: list[str]) -> bool:
+    if not words:
+        return False
+    if words[0] in TRANSACTION_END_KEYWORDS:
+        return True
+    if words[0] == "BEGIN":
+        return len(words) == 1 or words[1] in TRANSACTION_BEGIN_WORDS
+    return words[0] == "START" and len(words) > 1 and words[1] == "TRANSACTION"
+
+
+def _has_locking_clause(words: list[str]) -> bool:
+    return any(
+        word == "FOR" and following in ("UPDATE", "SHARE") for word, following in zip(words, words[1:], strict=False)
+    )
+
+
+def _is_read_only_explain(tokens: list[SqlToken]) -> bool:
+    """EXPLAIN ANALYZE 는 문장을 실제로 실행하므로, 설명 대상이 조회문일 때만 읽기 전용입니다."""
+    all_words = [token.value for token in tokens if token.kind == "word"]
+    if "ANALYZE" not in all_words and "ANALYSE" not in all_words:
+        return True
+    words = [token.value for token in tokens if token.kind == "word" and token.depth == 0]
+    start = next((index for index, word in enumerate(words) if word in MAIN_KEYWORDS or word == "WITH"), None)
+    if start is None:
+        return True
+    explained = words[start:]
+    if explained[0] != "WITH":
+        return explained[0] in QUERY_KEYWORDS
+    return _main_keyword(explained) in QUERY_KEYWORDS and not _has_modifying_cte(tokens)
@@ -45,11 +45,16 @@ class CommonCode(Enum):
     SUCCESS_CREATE_ANNOTATION = (status.HTTP_201_CREATED, "2400", "어노테이션을 성공적으로 생성하였습니다.")
     SUCCESS_FIND_ANNOTATION = (status.HTTP_200_OK, "2401", "어노테이션 정보를 성공적으로 조회하였습니다.")
     SUCCESS_DELETE_ANNOTATION = (status.HTTP_200_OK, "2402", "어노테이션을 성공적으로 삭제하였습니다.")
+    SUCCESS_SUBMIT_ANNOTATION_JOB = (status.HTTP_202_ACCEPTED, "2405", "어노테이션 생성을 요청하였습니다.")
+    SUCCESS_FIND_ANNOTATION_JOB = (status.HTTP_200_OK, "2404", "어노테이션 생성 작업 상태 조회를 성공하였습니다.")
 
     """ SQL 성공 코드 - 25xx """
     SUCCESS_EXECUTION = (status.HTTP_201_CREATED, "2400", "쿼리를 성공적으로 수행하였습니다.")
     SUCCESS_FIND_QUERY_HISTORY = (status.HTTP_200_OK, "2102", "쿼리 이력 조회를 성공하였습니다.")
     SUCCESS_EXECUTION_TEST = (status.HTTP_201_CREATED, "2400", "쿼리 TEST를 성공적으로 수행하였습니다.")
+    SUCCESS_SUBMIT_QUERY_JOB = (status.HTTP_202_ACCEPTED, "2501", "쿼리 실행을 요청하였습니다.")
+    SUCCESS_EXPLAIN = (status.HTTP_200_OK, "2503", "실행 계획 조회를 성공하였습니다.")
+    SUCCESS_FIND_QUERY_JOB = (status.HTTP_200_OK, "2502", "쿼리 실행 상태 조회를 성공하였습니다.")
 
     """ ChAT MESSAGE 성공 코드 - 26xx """
     SUCCESS_CREATE_CHAT_MESSAGES = (status.HTTP_201_CREATED, "2600", "메시지를 성공적으로 요청하였습니다.")
@@ -95,10 +100,46 @@ class CommonCode(Enum):
     """ ANNOTATION 클라이언트 에러 코드 - 44xx """
     INVALID_ANNOTATION_REQUEST = (status.HTTP_400_BAD_REQUEST, "4400", "어노테이션 요청 데이터가 유효하지 않습니다.")
     NO_ANNOTATION_FOR_PROFILE = (status.HTTP_404_NOT_FOUND, "4401", "해당 DB 프로필에 연결된 어노테이션이 없습니다.")
+    NO_ANNOTATION_JOB = (status.HTTP_404_NOT_FOUND, "4402", "어노테이션 생성 작업을 찾을 수 없습니다.")
+    ANNOTATION_JOB_NOT_RESUMABLE = (
+        status.HTTP_409_CONFLICT,
+        "4403",
+        "실패했거나 중단된 어노테이션 생성 작업만 재개할 수 있습니다.",
+    )
 
     """ SQL 클라이언트 에러 코드 - 45xx """
     NO_CHAT_KEY = (status.HTTP_400_BAD_REQUEST, "4501", "CHAT 키는 필수 값입니다.")
     NO_QUERY = (status.HTTP_400_BAD_REQUEST, "4500", "쿼리는 필수 값입니다.")
+    NO_QUERY_SESSION = (status.HTTP_404_NOT_FOUND, "4502", "쿼리 결과 세션이 없거나 만료되었습니다.")
+    QUERY_CANCELED = (status.HTTP_409_CONFLICT, "4504", "쿼리 실행이 취소되었습니다.")
+    QUERY_TIMEOUT = (status.HTTP_408_REQUEST_TIMEOUT, "4505", "쿼리 실행이 제한 시간을 초과하여 중단되었습니다.")
+    NO_RUNNING_QUERY = (status.HTTP_404_NOT_FOUND, "4506", "실행 중인 쿼리를 찾을 수 없습니다.")
+    NO_QUERY_JOB = (status.HTTP_404_NOT_FOUND, "4507", "쿼리 실행 작업이 없거나 만료되었습니다.")
+    TOO_MANY_QUERY_JOBS = (
+        status.HTTP_429_TOO_MANY_REQUESTS,
+        "4508",
+        "대기 중인 쿼리 실행 작업이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+    )
+    ARROW_FORMAT_NOT_ALLOWED = (
+        status.HTTP_400_BAD_REQUEST,
+        "4509",
+        "비동기 실행과 스크립트 실행은 Arrow 형식을 지원하지 않습니다.",
+    )
+    EXPLAIN_SINGLE_STATEMENT = (
+        status.HTTP_400_BAD_REQUEST,
+        "4511",
+        "실행 계획은 한 번에 하나의 문장만 조회할 수 있습니다.",
+    )
+    SCRIPT_TRANSACTION_CONTROL = (
+        status.HTTP_400_BAD_REQUEST,
+        "4510",
+        "스크립트는 하나의 트랜잭션으로 실행되므로 BEGIN/COMMIT/ROLLBACK 문을 포함할 수 없습니다.",
+    )
+    UNSUPPORTED_RESULT_FORMAT = (
+        status.HTTP_400_BAD_REQUEST,
+        "4503",
+        "Arrow 형식으로 결과를 받으려면 서버에 pyarrow 패키지가 설치되어 있어야 합니다.",
+    )
 
     """ CHAT MESSAGE 에러 코드 - 46xx """
     INVALID_CHAT_MESSAGE_REQUEST = (status.HTTP_400_BAD_REQUEST, "4600", "AI 채팅 요청 데이터가 유효하지 않습니다.")
@@ -124,6 +165,16 @@ class CommonCode(Enum):
         "5004",
         "AI 서버가 요청을 처리하는 데 실패했습니다.",
     )
+    SERVICE_NOT_READY = (
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "5005",
+        "서버가 아직 시작 중입니다. 잠시 후 다시 시도해주세요.",
+    )
+    SERVICE_DEGRADED = (
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "5006",
+        "서버 초기화에 실패하여 요청을 처리할 수 없습니다. 자세한 내용은 /health 에서 확인해주세요.",
+    )
     """ DRIVER, DB 서버 에러 코드 - 51xx """
     FAIL_CONNECT_DB = (status.HTTP_500_INTERNAL_SERVER_ERROR, "5100", "디비 연결 중 에러가 발생했습니다.")
     FAIL_FIND_PROFILE = (status.HTTP_500_INTERNAL_SERVER_ERROR, "5101", "디비 정보 조회 중 에러가 발생했습니다.")
@@ -1,14 +1,23 @@
+import logging
+import os
 import uuid
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
+from typing import TypeVar
+
+T = TypeVar("T", int, float)
 
 # 앱 데이터를 저장할 폴더 이름
 APP_DATA_DIR_NAME = ".qgenie"
 
 
+@lru_cache(maxsize=1)
 def get_db_path() -> Path:
     """
     사용자 홈 디렉터리 내에 앱 데이터 폴더를 만들고,
     SQLite DB 파일의 전체 경로를 반환합니다.
+    폴더 생성과 경로 계산은 프로세스당 한 번만 수행되고 이후에는 캐시된 경로를 반환합니다.
     """
     home_dir = Path.home()
     app_data_dir = home_dir / APP_DATA_DIR_NAME
@@ -17,6 +26,21 @@ def get_db_path() -> Path:
     return db_path
 
 
+def get_env_number(name: str, cast: Callable[[str], T], default: T) -> T:
+    """
+    숫자 환경 변수를 읽습니다. 값이 없거나 숫자가 아니면 기본값을 반환합니다.
+    .env 로드가 모듈 import 이후에 일어나므로, 모듈 상수가 아니라 값을 사용하는 시점에 호출해야 합니다.
+    """
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return cast(raw)
+    except ValueError:
+        logging.warning(f"환경 변수 '{name}' 값 '{raw}'이(가) 숫자가 아니어서 기본값 {default}을 사용합니다.")
+        return default
+
+
 def generate_uuid() -> str:
     return uuid.uuid4().hex.upper()
 
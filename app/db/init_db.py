@@ -3,6 +3,73 @@ import logging
 import sqlite3
 
 from app.core.utils import get_db_path
+from app.db.local_storage import local_storage
+from app.db.migrations import Migration, run_migrations
+
+# 로컬 저장소에서 관리하는 보조 인덱스 목록입니다. ({인덱스 이름: (테이블, [컬럼, ...])})
+# 조회 조건(WHERE)과 조인에 사용되는 외래 키 컬럼에 인덱스를 둡니다.
+MANAGED_INDEX_PREFIX = "idx_"
+LOCAL_INDEXES = {
+    "idx_chat_message_tab_created": ("chat_message", ["chat_tab_id", "created_at"]),
+    "idx_query_history_chat_message": ("query_history", ["chat_message_id"]),
+    "idx_query_history_user_db": ("query_history", ["user_db_id"]),
+    "idx_database_annotation_profile": ("database_annotation", ["db_profile_id"]),
+    "idx_table_annotation_database": ("table_annotation", ["database_annotation_id"]),
+    "idx_column_annotation_table": ("column_annotation", ["table_annotation_id"]),
+    "idx_table_relationship_database": ("table_relationship", ["database_annotation_id"]),
+    "idx_table_relationship_from": ("table_relationship", ["from_table_id"]),
+    "idx_table_relationship_to": ("table_relationship", ["to_table_id"]),
+    "idx_table_constraint_table": ("table_constraint", ["table_annotation_id"]),
+    "idx_constraint_column_constraint": ("constraint_column", ["constraint_id"]),
+    "idx_constraint_column_column": ("constraint_column", ["column_annotation_id"]),
+    "idx_index_annotation_table": ("index_annotation", ["table_annotation_id"]),
+    "idx_index_column_index": ("index_column", ["index_id"]),
+    "idx_index_column_column": ("index_column", ["column_annotation_id"]),
+    "idx_annotation_job_profile_status": ("annotation_job", ["db_profile_id", "status"]),
+}
+
+
+def _synchronize_indexes(cursor, target_indexes: dict):
+    """
+    선언된 인덱스와 실제 인덱스를 비교하여 생성/재생성/삭제합니다.
+    테이블 재생성 시 기존 인덱스가 함께 삭제되므로, 모든 테이블 동기화 이후에 호출해야 합니다.
+    아직 생성되지 않은 테이블(이후 마이그레이션에서 생성)의 인덱스는 건너뛰며, 해당 마이그레이션에서 다시 동기화합니다.
+    """
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    existing_tables = {row[0] for row in cursor.fetchall()}
+    cursor.execute(
+        "SELECT name, tbl_name FROM sqlite_master WHERE type = 'index' AND name LIKE ?",
+        (f"{MANAGED_INDEX_PREFIX}%",),
+    )
+    current_indexes = {row[0]: row[1] for row in cursor.fetchall()}
+
+    # 더 이상 선언되지 않은 관리 대상 인덱스는 삭제합니다.
+    for index_name in current_indexes.keys() - target_indexes.keys():
+        cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+        logging.info(f"사용하지 않는 인덱스 '{index_name}'을(를) 삭제했습니다.")
+
+    for index_name, (table_name, columns) in target_indexes.items():
+        if table_name not in existing_tables:
+            continue
+        if index_name in current_indexes:
+            cursor.execute(f"PRAGMA index_info({index_name})")
+            current_columns = [row[2] for row in sorted(cursor.fetchall(), key=lambda row: row[0])]
+            if current_indexes[index_name] == table_name and current_columns == columns:
+                continue
+            logging.warning(f"'{index_name}' 인덱스 정의 변경을 감지했습니다. 인덱스를 재생성합니다.")
+            cursor.execute(f"DROP INDEX {index_name}")
+
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} ({', '.join(columns)})")
+
+
+def find_missing_indexes(conn: sqlite3.Connection) -> list[str]:
+    """선언된 인덱스 중 실제 DB에 존재하지 않는 인덱스 이름 목록을 반환합니다."""
+    rows = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE ?",
+        (f"{MANAGED_INDEX_PREFIX}%",),
+    ).fetchall()
+    existing = {row[0] for row in rows}
+    return [index_name for index_name in LOCAL_INDEXES if index_name not in existing]
 
 
 def _synchronize_table(cursor, table_name: str, target_columns: dict):
@@ -59,366 +126,510 @@ def _synchronize_table(cursor, table_name: str, target_columns: dict):
         cursor.execute("PRAGMA foreign_keys=on;")
 
 
-def initialize_database():
+def _create_baseline_schema(cursor):
     """
-    데이터베이스에 연결하고, 테이블 스키마를 최신 상태로 동기화합니다.
+    [마이그레이션 1] 기본 테이블과 updated_at 트리거를 생성합니다.
+    schema_version 도입 이전에 생성된 DB는 기존 방식대로 컬럼 구성을 비교하여 동기화합니다.
     """
-    db_path = get_db_path()
-    conn = None
-    try:
-        conn = sqlite3.connect(db_path)
-        conn.execute("BEGIN")
-        cursor = conn.cursor()
-
-        # --- db_profile 테이블 처리 ---
-        db_profile_cols = {
-            "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
-            "type": "VARCHAR(32) NOT NULL",
-            "host": "VARCHAR(255)",
-            "port": "INTEGER",
-            "name": "VARCHAR(64)",
-            "username": "VARCHAR(128)",
-            "password": "VARCHAR(128)",
-            "view_name": "VARCHAR(64)",
-            "annotation_id": "VARCHAR(64)",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "FOREIGN KEY (annotation_id)": "REFERENCES database_annotation(id) ON DELETE SET NULL",
-        }
-        create_sql = (
-            f"CREATE TABLE IF NOT EXISTS db_profile ({', '.join([f'{k} {v}' for k, v in db_profile_cols.items()])})"
-        )
-        cursor.execute(create_sql)
-        _synchronize_table(
-            cursor, "db_profile", {k: v for k, v in db_profile_cols.items() if not k.startswith("FOREIGN KEY")}
-        )
-
-        cursor.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS update_db_profile_updated_at
-            BEFORE UPDATE ON db_profile FOR EACH ROW
-            BEGIN UPDATE db_profile SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
-            """
-        )
-
-        # --- ai_credential 테이블 처리 ---
-        ai_credential_cols = {
-            "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
-            "service_name": "VARCHAR(32) NOT NULL UNIQUE",
-            "api_key": "VARCHAR(256) NOT NULL",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-        }
-        create_sql = f"CREATE TABLE IF NOT EXISTS ai_credential ({', '.join([f'{k} {v}' for k, v in ai_credential_cols.items()])})"
-        cursor.execute(create_sql)
-        _synchronize_table(cursor, "ai_credential", ai_credential_cols)
-
-        cursor.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS update_ai_credential_updated_at
-            BEFORE UPDATE ON ai_credential FOR EACH ROW
-            BEGIN UPDATE ai_credential SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
-            """
-        )
-
-        # --- chat_tab 테이블 처리 ---
-        chat_tab_cols = {
-            "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
-            "name": "VARCHAR(128)",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-        }
-        create_sql = (
-            f"CREATE TABLE IF NOT EXISTS chat_tab ({', '.join([f'{k} {v}' for k, v in chat_tab_cols.items()])})"
-        )
-        cursor.execute(create_sql)
-        _synchronize_table(cursor, "chat_tab", chat_tab_cols)
-        cursor.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS update_chat_tab_updated_at
-            BEFORE UPDATE ON chat_tab FOR EACH ROW
-            BEGIN UPDATE chat_tab SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
-            """
-        )
-
-        # --- chat_message 테이블 처리 ---
-        chat_message_cols = {
-            "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
-            "chat_tab_id": "VARCHAR(64) NOT NULL",
-            "sender": "VARCHAR(1) NOT NULL",
-            "message": "TEXT NOT NULL",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "FOREIGN KEY (chat_tab_id)": "REFERENCES chat_tab(id) ON DELETE CASCADE",
-        }
-        create_sql = (
-            f"CREATE TABLE IF NOT EXISTS chat_message ({', '.join([f'{k} {v}' for k, v in chat_message_cols.items()])})"
-        )
-        cursor.execute(create_sql)
-        _synchronize_table(
-            cursor, "chat_message", {k: v for k, v in chat_message_cols.items() if not k.startswith("FOREIGN KEY")}
+    # --- db_profile 테이블 처리 ---
+    db_profile_cols = {
+        "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
+        "type": "VARCHAR(32) NOT NULL",
+        "host": "VARCHAR(255)",
+        "port": "INTEGER",
+        "name": "VARCHAR(64)",
+        "username": "VARCHAR(128)",
+        "password": "VARCHAR(128)",
+        "view_name": "VARCHAR(64)",
+        "annotation_id": "VARCHAR(64)",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "FOREIGN KEY (annotation_id)": "REFERENCES database_annotation(id) ON DELETE SET NULL",
+    }
+    create_sql = (
+        f"CREATE TABLE IF NOT EXISTS db_profile ({', '.join([f'{k} {v}' for k, v in db_profile_cols.items()])})"
+    )
+    cursor.execute(create_sql)
+    _synchronize_table(
+        cursor, "db_profile", {k: v for k, v in db_profile_cols.items() if not k.startswith("FOREIGN KEY")}
+    )
+
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_db_profile_updated_at
+        BEFORE UPDATE ON db_profile FOR EACH ROW
+        BEGIN UPDATE db_profile SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+    # --- ai_credential 테이블 처리 ---
+    ai_credential_cols = {
+        "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
+        "service_name": "VARCHAR(32) NOT NULL UNIQUE",
+        "api_key": "VARCHAR(256) NOT NULL",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+    }
+    create_sql = (
+        f"CREATE TABLE IF NOT EXISTS ai_credential ({', '.join([f'{k} {v}' for k, v in ai_credential_cols.items()])})"
+    )
+    cursor.execute(create_sql)
+    _synchronize_table(cursor, "ai_credential", ai_credential_cols)
+
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_ai_credential_updated_at
+        BEFORE UPDATE ON ai_credential FOR EACH ROW
+        BEGIN UPDATE ai_credential SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+    # --- chat_tab 테이블 처리 ---
+    chat_tab_cols = {
+        "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
+        "name": "VARCHAR(128)",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+    }
+    create_sql = f"CREATE TABLE IF NOT EXISTS chat_tab ({', '.join([f'{k} {v}' for k, v in chat_tab_cols.items()])})"
+    cursor.execute(create_sql)
+    _synchronize_table(cursor, "chat_tab", chat_tab_cols)
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_chat_tab_updated_at
+        BEFORE UPDATE ON chat_tab FOR EACH ROW
+        BEGIN UPDATE chat_tab SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+    # --- chat_message 테이블 처리 ---
+    chat_message_cols = {
+        "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
+        "chat_tab_id": "VARCHAR(64) NOT NULL",
+        "sender": "VARCHAR(1) NOT NULL",
+        "message": "TEXT NOT NULL",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "FOREIGN KEY (chat_tab_id)": "REFERENCES chat_tab(id) ON DELETE CASCADE",
+    }
+    create_sql = (
+        f"CREATE TABLE IF NOT EXISTS chat_message ({', '.join([f'{k} {v}' for k, v in chat_message_cols.items()])})"
+    )
+    cursor.execute(create_sql)
+    _synchronize_table(
+        cursor, "chat_message", {k: v for k, v in chat_message_cols.items() if not k.startswith("FOREIGN KEY")}
+    )
+
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_chat_message_updated_at
+        BEFORE UPDATE ON chat_message FOR EACH ROW
+        BEGIN UPDATE chat_message SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+    # --- query_history 테이블 처리 ---
+    query_history_cols = {
+        "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
+        "user_db_id": "VARCHAR(64) NOT NULL",
+        "chat_message_id": "VARCHAR(64) NOT NULL",
+        "database": "VARCHAR(256) NOT NULL",
+        "query_text": "TEXT NOT NULL",
+        "type": "VARCHAR(32)",
+        "is_success": "VARCHAR(1)",
+        "error_message": "TEXT",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "FOREIGN KEY (chat_message_id)": "REFERENCES chat_message(id) ON DELETE CASCADE",
+        "FOREIGN KEY (user_db_id)": "REFERENCES db_profile(id) ON DELETE CASCADE",
+    }
+    create_sql = (
+        f"CREATE TABLE IF NOT EXISTS query_history ({', '.join([f'{k} {v}' for k, v in query_history_cols.items()])})"
+    )
+    cursor.execute(create_sql)
+    _synchronize_table(
+        cursor, "query_history", {k: v for k, v in query_history_cols.items() if not k.startswith("FOREIGN KEY")}
+    )
+
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_query_history_updated_at
+        BEFORE UPDATE ON query_history FOR EACH ROW
+        BEGIN UPDATE query_history SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+    # --- database_annotation 테이블 처리 ---
+    database_annotation_cols = {
+        "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
+        "db_profile_id": "VARCHAR(64) NOT NULL",
+        "database_name": "VARCHAR(255) NOT NULL",
+        "description": "TEXT",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "FOREIGN KEY (db_profile_id)": "REFERENCES db_profile(id) ON DELETE CASCADE",
+    }
+    create_sql = f"CREATE TABLE IF NOT EXISTS database_annotation ({', '.join([f'{k} {v}' for k, v in database_annotation_cols.items()])})"
+    cursor.execute(create_sql)
+    _synchronize_table(
+        cursor,
+        "database_annotation",
+        {k: v for k, v in database_annotation_cols.items() if not k.startswith("FOREIGN KEY")},
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_database_annotation_updated_at
+        BEFORE UPDATE ON database_annotation FOR EACH ROW
+        BEGIN UPDATE database_annotation SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+    # --- table_annotation 테이블 처리 ---
+    table_annotation_cols = {
+        "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
+        "database_annotation_id": "VARCHAR(64) NOT NULL",
+        "table_name": "VARCHAR(255) NOT NULL",
+        "description": "TEXT",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "FOREIGN KEY (database_annotation_id)": "REFERENCES database_annotation(id) ON DELETE CASCADE",
+    }
+    create_sql = f"CREATE TABLE IF NOT EXISTS table_annotation ({', '.join([f'{k} {v}' for k, v in table_annotation_cols.items()])})"
+    cursor.execute(create_sql)
+    _synchronize_table(
+        cursor,
+        "table_annotation",
+        {k: v for k, v in table_annotation_cols.items() if not k.startswith("FOREIGN KEY")},
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_table_annotation_updated_at
+        BEFORE UPDATE ON table_annotation FOR EACH ROW
+        BEGIN UPDATE table_annotation SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+    # --- column_annotation 테이블 처리 ---
+    column_annotation_cols = {
+        "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
+        "table_annotation_id": "VARCHAR(64) NOT NULL",
+        "column_name": "VARCHAR(255) NOT NULL",
+        "data_type": "VARCHAR(64)",
+        "is_nullable": "INTEGER NOT NULL DEFAULT 1",
+        "default_value": "TEXT",
+        "check_expression": "TEXT",
+        "ordinal_position": "INTEGER",
+        "description": "TEXT",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "FOREIGN KEY (table_annotation_id)": "REFERENCES table_annotation(id) ON DELETE CASCADE",
+    }
+    create_sql = f"CREATE TABLE IF NOT EXISTS column_annotation ({', '.join([f'{k} {v}' for k, v in column_annotation_cols.items()])})"
+    cursor.execute(create_sql)
+    _synchronize_table(
+        cursor,
+        "column_annotation",
+        {k: v for k, v in column_annotation_cols.items() if not k.startswith("FOREIGN KEY")},
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_column_annotation_updated_at
+        BEFORE UPDATE ON column_annotation FOR EACH ROW
+        BEGIN UPDATE column_annotation SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+    # --- table_relationship 테이블 처리 ---
+    table_relationship_cols = {
+        "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
+        "database_annotation_id": "VARCHAR(64) NOT NULL",
+        "from_table_id": "VARCHAR(64) NOT NULL",
+        "to_table_id": "VARCHAR(64) NOT NULL",
+        "relationship_type": "VARCHAR(32) NOT NULL",
+        "description": "TEXT",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "FOREIGN KEY (database_annotation_id)": "REFERENCES database_annotation(id) ON DELETE CASCADE",
+        "FOREIGN KEY (from_table_id)": "REFERENCES table_annotation(id) ON DELETE CASCADE",
+        "FOREIGN KEY (to_table_id)": "REFERENCES table_annotation(id) ON DELETE CASCADE",
+    }
+    create_sql = f"CREATE TABLE IF NOT EXISTS table_relationship ({', '.join([f'{k} {v}' for k, v in table_relationship_cols.items()])})"
+    cursor.execute(create_sql)
+    _synchronize_table(
+        cursor,
+        "table_relationship",
+        {k: v for k, v in table_relationship_cols.items() if not k.startswith("FOREIGN KEY")},
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_table_relationship_updated_at
+        BEFORE UPDATE ON table_relationship FOR EACH ROW
+        BEGIN UPDATE table_relationship SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+    # --- table_constraint 테이블 처리 ---
+    table_constraint_cols = {
+        "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
+        "table_annotation_id": "VARCHAR(64) NOT NULL",
+        "constraint_type": "VARCHAR(16) NOT NULL",
+        "name": "VARCHAR(255)",
+        "description": "TEXT",
+        "expression": "TEXT",
+        "ref_table": "VARCHAR(255)",
+        "on_update_action": "VARCHAR(16)",
+        "on_delete_action": "VARCHAR(16)",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "FOREIGN KEY (table_annotation_id)": "REFERENCES table_annotation(id) ON DELETE CASCADE",
+    }
+    create_sql = f"CREATE TABLE IF NOT EXISTS table_constraint ({', '.join([f'{k} {v}' for k, v in table_constraint_cols.items()])})"
+    cursor.execute(create_sql)
+    _synchronize_table(
+        cursor,
+        "table_constraint",
+        {k: v for k, v in table_constraint_cols.items() if not k.startswith("FOREIGN KEY")},
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_table_constraint_updated_at
+        BEFORE UPDATE ON table_constraint FOR EACH ROW
+        BEGIN UPDATE table_constraint SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+    # --- constraint_column 테이블 처리 ---
+    constraint_column_cols = {
+        "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
+        "constraint_id": "VARCHAR(64) NOT NULL",
+        "column_annotation_id": "VARCHAR(64) NOT NULL",
+        "position": "INTEGER",
+        "referenced_column_name": "VARCHAR(255)",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "FOREIGN KEY (constraint_id)": "REFERENCES table_constraint(id) ON DELETE CASCADE",
+        "FOREIGN KEY (column_annotation_id)": "REFERENCES column_annotation(id) ON DELETE CASCADE",
+    }
+    create_sql = f"CREATE TABLE IF NOT EXISTS constraint_column ({', '.join([f'{k} {v}' for k, v in constraint_column_cols.items()])})"
+    cursor.execute(create_sql)
+    _synchronize_table(
+        cursor,
+        "constraint_column",
+        {k: v for k, v in constraint_column_cols.items() if not k.startswith("FOREIGN KEY")},
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_constraint_column_updated_at
+        BEFORE UPDATE ON constraint_column FOR EACH ROW
+        BEGIN UPDATE constraint_column SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+    # --- index_annotation 테이블 처리 ---
+    index_annotation_cols = {
+        "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
+        "table_annotation_id": "VARCHAR(64) NOT NULL",
+        "name": "VARCHAR(255)",
+        "is_unique": "INTEGER NOT NULL DEFAULT 0",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "FOREIGN KEY (table_annotation_id)": "REFERENCES table_annotation(id) ON DELETE CASCADE",
+    }
+    create_sql = f"CREATE TABLE IF NOT EXISTS index_annotation ({', '.join([f'{k} {v}' for k, v in index_annotation_cols.items()])})"
+    cursor.execute(create_sql)
+    _synchronize_table(
+        cursor,
+        "index_annotation",
+        {k: v for k, v in index_annotation_cols.items() if not k.startswith("FOREIGN KEY")},
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_index_annotation_updated_at
+        BEFORE UPDATE ON index_annotation FOR EACH ROW
+        BEGIN UPDATE index_annotation SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+    # --- index_column 테이블 처리 ---
+    index_column_cols = {
+        "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
+        "index_id": "VARCHAR(64) NOT NULL",
+        "column_annotation_id": "VARCHAR(64) NOT NULL",
+        "position": "INTEGER",
+        "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
+        "FOREIGN KEY (index_id)": "REFERENCES index_annotation(id) ON DELETE CASCADE",
+        "FOREIGN KEY (column_annotation_id)": "REFERENCES column_annotation(id) ON DELETE CASCADE",
+    }
+    create_sql = (
+        f"CREATE TABLE IF NOT EXISTS index_column ({', '.join([f'{k} {v}' for k, v in index_column_cols.items()])})"
+    )
+    cursor.execute(create_sql)
+    _synchronize_table(
+        cursor, "index_column", {k: v for k, v in index_column_cols.items() if not k.startswith("FOREIGN KEY")}
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_index_column_updated_at
+        BEFORE UPDATE ON index_column FOR EACH ROW
+        BEGIN UPDATE index_column SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+
+def _create_local_indexes(cursor):
+    """[마이그레이션 2] 조회 조건과 조인에 사용되는 보조 인덱스를 생성합니다."""
+    _synchronize_indexes(cursor, LOCAL_INDEXES)
+
+
+def _create_schema_cache(cursor):
+    """[마이그레이션 3] 사용자 DB 카탈로그 조회 결과를 저장하는 스키마 캐시 테이블을 생성합니다."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_cache (
+            db_profile_id VARCHAR(64) NOT NULL,
+            object_key TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (db_profile_id, object_key),
+            FOREIGN KEY (db_profile_id) REFERENCES db_profile(id) ON DELETE CASCADE
         )
-
-        cursor.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS update_chat_message_updated_at
-            BEFORE UPDATE ON chat_message FOR EACH ROW
-            BEGIN UPDATE chat_message SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
-            """
+        """
+    )
+
+
+def _create_schema_snapshot(cursor):
+    """[마이그레이션 4] 증분 재조회를 위해 테이블 단위 DDL 지문과 상세 정보를 저장하는 스냅샷 테이블을 생성합니다."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_snapshot (
+            db_profile_id VARCHAR(64) NOT NULL,
+            db_name TEXT NOT NULL,
+            schema_name TEXT NOT NULL,
+            table_name TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (db_profile_id, db_name, schema_name, table_name),
+            FOREIGN KEY (db_profile_id) REFERENCES db_profile(id) ON DELETE CASCADE
         )
+        """
+    )
 
-        # --- query_history 테이블 처리 ---
-        query_history_cols = {
-            "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
-            "user_db_id": "VARCHAR(64) NOT NULL",
-            "chat_message_id": "VARCHAR(64) NOT NULL",
-            "database": "VARCHAR(256) NOT NULL",
-            "query_text": "TEXT NOT NULL",
-            "type": "VARCHAR(32)",
-            "is_success": "VARCHAR(1)",
-            "error_message": "TEXT",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "FOREIGN KEY (chat_message_id)": "REFERENCES chat_message(id) ON DELETE CASCADE",
-            "FOREIGN KEY (user_db_id)": "REFERENCES db_profile(id) ON DELETE CASCADE",
-        }
-        create_sql = f"CREATE TABLE IF NOT EXISTS query_history ({', '.join([f'{k} {v}' for k, v in query_history_cols.items()])})"
-        cursor.execute(create_sql)
-        _synchronize_table(
-            cursor, "query_history", {k: v for k, v in query_history_cols.items() if not k.startswith("FOREIGN KEY")}
-        )
 
-        cursor.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS update_query_history_updated_at
-            BEFORE UPDATE ON query_history FOR EACH ROW
-            BEGIN UPDATE query_history SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
-            """
-        )
+def _add_profile_query_timeout(cursor):
+    """[마이그레이션 5] DB 프로필별 쿼리 제한 시간(초) 컬럼을 추가합니다. (NULL이면 기본값 사용)"""
+    cursor.execute("PRAGMA table_info(db_profile)")
+    if "query_timeout_sec" not in {row[1] for row in cursor.fetchall()}:
+        cursor.execute("ALTER TABLE db_profile ADD COLUMN query_timeout_sec INTEGER")
 
-        # --- database_annotation 테이블 처리 ---
-        database_annotation_cols = {
-            "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
-            "db_profile_id": "VARCHAR(64) NOT NULL",
-            "database_name": "VARCHAR(255) NOT NULL",
-            "description": "TEXT",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "FOREIGN KEY (db_profile_id)": "REFERENCES db_profile(id) ON DELETE CASCADE",
-        }
-        create_sql = f"CREATE TABLE IF NOT EXISTS database_annotation ({', '.join([f'{k} {v}' for k, v in database_annotation_cols.items()])})"
-        cursor.execute(create_sql)
-        _synchronize_table(
-            cursor,
-            "database_annotation",
-            {k: v for k, v in database_annotation_cols.items() if not k.startswith("FOREIGN KEY")},
-        )
-        cursor.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS update_database_annotation_updated_at
-            BEFORE UPDATE ON database_annotation FOR EACH ROW
-            BEGIN UPDATE database_annotation SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
-            """
-        )
 
-        # --- table_annotation 테이블 처리 ---
-        table_annotation_cols = {
-            "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
-            "database_annotation_id": "VARCHAR(64) NOT NULL",
-            "table_name": "VARCHAR(255) NOT NULL",
-            "description": "TEXT",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "FOREIGN KEY (database_annotation_id)": "REFERENCES database_annotation(id) ON DELETE CASCADE",
-        }
-        create_sql = f"CREATE TABLE IF NOT EXISTS table_annotation ({', '.join([f'{k} {v}' for k, v in table_annotation_cols.items()])})"
-        cursor.execute(create_sql)
-        _synchronize_table(
-            cursor,
-            "table_annotation",
-            {k: v for k, v in table_annotation_cols.items() if not k.startswith("FOREIGN KEY")},
+def _create_annotation_job(cursor):
+    """
+    [마이그레이션 6] 백그라운드 어노테이션 생성 작업의 상태/진행률을 저장하는 테이블을 생성합니다.
+    AI 응답(ai_response)을 함께 보관하여, 중단된 작업을 재개할 때 AI 요청을 다시 보내지 않습니다.
+    """
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS annotation_job (
+            id VARCHAR(64) PRIMARY KEY NOT NULL,
+            db_profile_id VARCHAR(64) NOT NULL,
+            status VARCHAR(32) NOT NULL,
+            phase VARCHAR(32),
+            progress INTEGER NOT NULL DEFAULT 0,
+            message TEXT,
+            annotation_id VARCHAR(64),
+            error_code VARCHAR(16),
+            error_message TEXT,
+            ai_response TEXT,
+            started_at DATETIME,
+            finished_at DATETIME,
+            created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (db_profile_id) REFERENCES db_profile(id) ON DELETE CASCADE
         )
-        cursor.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS update_table_annotation_updated_at
-            BEFORE UPDATE ON table_annotation FOR EACH ROW
-            BEGIN UPDATE table_annotation SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
-            """
+        """
+    )
+    _synchronize_indexes(cursor, LOCAL_INDEXES)
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS update_annotation_job_updated_at
+        BEFORE UPDATE ON annotation_job FOR EACH ROW
+        BEGIN UPDATE annotation_job SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
+        """
+    )
+
+
+def _add_annotation_job_incremental(cursor):
+    """[마이그레이션 7] 어노테이션 작업이 바뀐 테이블만 다시 요청하는 증분 작업인지 여부 컬럼을 추가합니다."""
+    cursor.execute("PRAGMA table_info(annotation_job)")
+    if "incremental" not in {row[1] for row in cursor.fetchall()}:
+        cursor.execute("ALTER TABLE annotation_job ADD COLUMN incremental INTEGER NOT NULL DEFAULT 0")
+
+
+def _create_annotation_cache(cursor):
+    """
+    [마이그레이션 8] AI 서버가 생성한 테이블 단위 어노테이션을 테이블 정의 해시로 저장하는 캐시 테이블을 생성합니다.
+    프로필에 묶이지 않으므로, 같은 정의의 테이블은 다른 프로필에서도 AI 요청 없이 설명을 재사용합니다.
+    """
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS annotation_cache (
+            table_hash CHAR(64) PRIMARY KEY NOT NULL,
+            table_name TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+            updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
         )
+        """
+    )
 
-        # --- column_annotation 테이블 처리 ---
-        column_annotation_cols = {
-            "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
-            "table_annotation_id": "VARCHAR(64) NOT NULL",
-            "column_name": "VARCHAR(255) NOT NULL",
-            "data_type": "VARCHAR(64)",
-            "is_nullable": "INTEGER NOT NULL DEFAULT 1",
-            "default_value": "TEXT",
-            "check_expression": "TEXT",
-            "ordinal_position": "INTEGER",
-            "description": "TEXT",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "FOREIGN KEY (table_annotation_id)": "REFERENCES table_annotation(id) ON DELETE CASCADE",
-        }
-        create_sql = f"CREATE TABLE IF NOT EXISTS column_annotation ({', '.join([f'{k} {v}' for k, v in column_annotation_cols.items()])})"
-        cursor.execute(create_sql)
-        _synchronize_table(
-            cursor,
-            "column_annotation",
-            {k: v for k, v in column_annotation_cols.items() if not k.startswith("FOREIGN KEY")},
-        )
-        cursor.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS update_column_annotation_updated_at
-            BEFORE UPDATE ON column_annotation FOR EACH ROW
-            BEGIN UPDATE column_annotation SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
-            """
-        )
 
-        # --- table_relationship 테이블 처리 ---
-        table_relationship_cols = {
-            "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
-            "database_annotation_id": "VARCHAR(64) NOT NULL",
-            "from_table_id": "VARCHAR(64) NOT NULL",
-            "to_table_id": "VARCHAR(64) NOT NULL",
-            "relationship_type": "VARCHAR(32) NOT NULL",
-            "description": "TEXT",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "FOREIGN KEY (database_annotation_id)": "REFERENCES database_annotation(id) ON DELETE CASCADE",
-            "FOREIGN KEY (from_table_id)": "REFERENCES table_annotation(id) ON DELETE CASCADE",
-            "FOREIGN KEY (to_table_id)": "REFERENCES table_annotation(id) ON DELETE CASCADE",
-        }
-        create_sql = f"CREATE TABLE IF NOT EXISTS table_relationship ({', '.join([f'{k} {v}' for k, v in table_relationship_cols.items()])})"
-        cursor.execute(create_sql)
-        _synchronize_table(
-            cursor,
-            "table_relationship",
-            {k: v for k, v in table_relationship_cols.items() if not k.startswith("FOREIGN KEY")},
-        )
-        cursor.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS update_table_relationship_updated_at
-            BEFORE UPDATE ON table_relationship FOR EACH ROW
-            BEGIN UPDATE table_relationship SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
-            """
-        )
+def _rename_annotation_job_index(cursor):
+    """
+    [마이그레이션 9] 관리 대상 이름 규칙(idx_) 없이 만들어졌던 어노테이션 작업 인덱스를 LOCAL_INDEXES 의 인덱스로 교체합니다.
+    """
+    cursor.execute("DROP INDEX IF EXISTS annotation_job_profile_status")
+    _synchronize_indexes(cursor, LOCAL_INDEXES)
 
-        # --- table_constraint 테이블 처리 ---
-        table_constraint_cols = {
-            "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
-            "table_annotation_id": "VARCHAR(64) NOT NULL",
-            "constraint_type": "VARCHAR(16) NOT NULL",
-            "name": "VARCHAR(255)",
-            "description": "TEXT",
-            "expression": "TEXT",
-            "ref_table": "VARCHAR(255)",
-            "on_update_action": "VARCHAR(16)",
-            "on_delete_action": "VARCHAR(16)",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "FOREIGN KEY (table_annotation_id)": "REFERENCES table_annotation(id) ON DELETE CASCADE",
-        }
-        create_sql = f"CREATE TABLE IF NOT EXISTS table_constraint ({', '.join([f'{k} {v}' for k, v in table_constraint_cols.items()])})"
-        cursor.execute(create_sql)
-        _synchronize_table(
-            cursor,
-            "table_constraint",
-            {k: v for k, v in table_constraint_cols.items() if not k.startswith("FOREIGN KEY")},
-        )
-        cursor.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS update_table_constraint_updated_at
-            BEFORE UPDATE ON table_constraint FOR EACH ROW
-            BEGIN UPDATE table_constraint SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
-            """
-        )
 
-        # --- constraint_column 테이블 처리 ---
-        constraint_column_cols = {
-            "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
-            "constraint_id": "VARCHAR(64) NOT NULL",
-            "column_annotation_id": "VARCHAR(64) NOT NULL",
-            "position": "INTEGER",
-            "referenced_column_name": "VARCHAR(255)",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "FOREIGN KEY (constraint_id)": "REFERENCES table_constraint(id) ON DELETE CASCADE",
-            "FOREIGN KEY (column_annotation_id)": "REFERENCES column_annotation(id) ON DELETE CASCADE",
-        }
-        create_sql = f"CREATE TABLE IF NOT EXISTS constraint_column ({', '.join([f'{k} {v}' for k, v in constraint_column_cols.items()])})"
-        cursor.execute(create_sql)
-        _synchronize_table(
-            cursor,
-            "constraint_column",
-            {k: v for k, v in constraint_column_cols.items() if not k.startswith("FOREIGN KEY")},
-        )
-        cursor.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS update_constraint_column_updated_at
-            BEFORE UPDATE ON constraint_column FOR EACH ROW
-            BEGIN UPDATE constraint_column SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
-            """
-        )
+# 로컬 저장소 스키마 변경 이력입니다. 새로운 변경은 항상 마지막에 다음 버전으로 추가합니다.
+MIGRATIONS = [
+    Migration(1, "baseline tables and updated_at triggers", _create_baseline_schema),
+    Migration(2, "secondary indexes on lookup columns", _create_local_indexes),
+    Migration(3, "schema metadata cache", _create_schema_cache),
+    Migration(4, "per-table schema snapshots", _create_schema_snapshot),
+    Migration(5, "per-profile query timeout", _add_profile_query_timeout),
+    Migration(6, "background annotation jobs", _create_annotation_job),
+    Migration(7, "incremental annotation jobs", _add_annotation_job_incremental),
+    Migration(8, "content-addressed annotation cache", _create_annotation_cache),
+    Migration(9, "managed annotation job index", _rename_annotation_job_index),
+]
 
-        # --- index_annotation 테이블 처리 ---
-        index_annotation_cols = {
-            "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
-            "table_annotation_id": "VARCHAR(64) NOT NULL",
-            "name": "VARCHAR(255)",
-            "is_unique": "INTEGER NOT NULL DEFAULT 0",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "FOREIGN KEY (table_annotation_id)": "REFERENCES table_annotation(id) ON DELETE CASCADE",
-        }
-        create_sql = f"CREATE TABLE IF NOT EXISTS index_annotation ({', '.join([f'{k} {v}' for k, v in index_annotation_cols.items()])})"
-        cursor.execute(create_sql)
-        _synchronize_table(
-            cursor,
-            "index_annotation",
-            {k: v for k, v in index_annotation_cols.items() if not k.startswith("FOREIGN KEY")},
-        )
-        cursor.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS update_index_annotation_updated_at
-            BEFORE UPDATE ON index_annotation FOR EACH ROW
-            BEGIN UPDATE index_annotation SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
-            """
-        )
 
-        # --- index_column 테이블 처리 ---
-        index_column_cols = {
-            "id": "VARCHAR(64) PRIMARY KEY NOT NULL",
-            "index_id": "VARCHAR(64) NOT NULL",
-            "column_annotation_id": "VARCHAR(64) NOT NULL",
-            "position": "INTEGER",
-            "created_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "updated_at": "DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP",
-            "FOREIGN KEY (index_id)": "REFERENCES index_annotation(id) ON DELETE CASCADE",
-            "FOREIGN KEY (column_annotation_id)": "REFERENCES column_annotation(id) ON DELETE CASCADE",
-        }
-        create_sql = (
-            f"CREATE TABLE IF NOT EXISTS index_column ({', '.join([f'{k} {v}' for k, v in index_column_cols.items()])})"
-        )
-        cursor.execute(create_sql)
-        _synchronize_table(
-            cursor, "index_column", {k: v for k, v in index_column_cols.items() if not k.startswith("FOREIGN KEY")}
-        )
-        cursor.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS update_index_column_updated_at
-            BEFORE UPDATE ON index_column FOR EACH ROW
-            BEGIN UPDATE index_column SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id; END;
-            """
-        )
+def initialize_database():
+    """
+    데이터베이스에 연결하고, 적용되지 않은 마이그레이션을 순서대로 적용합니다.
+    이미 최신 버전이면 schema_version만 확인하고 바로 종료합니다.
+    """
+    db_path = get_db_path()
+    conn = None
+    try:
+        conn = sqlite3.connect(db_path)
+        # 저널 모드(WAL)는 트랜잭션 밖에서만 변경할 수 있으므로 마이그레이션 전에 적용합니다.
+        local_storage.apply_storage_profile(conn)
+        run_migrations(conn, MIGRATIONS)
 
-        conn.commit()
+        missing_indexes = find_missing_indexes(conn)
+        if missing_indexes:
+            logging.warning(f"로컬 저장소에 누락된 인덱스가 있습니다: {', '.join(missing_indexes)}")
 
     except sqlite3.Error as e:
-        logging.error(f"데이터베이스 초기화 중 오류 발생: {e}. 변경 사항을 롤백합니다.")
-        if conn:
-            conn.rollback()
+        logging.error(f"데이터베이스 초기화 중 오류 발생: {e}")
+        raise
     finally:
         if conn:
             conn.close()
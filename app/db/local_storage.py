@@ -0,0 +1,270 @@
+# app/db/local_storage.py
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+from app.core.utils import get_db_path
+
+# 풀에서 동시에 유지할 최대 커넥션 수 (FastAPI 스레드풀 워커들이 공유합니다)
+DEFAULT_POOL_SIZE = 8
+# 커넥션 대기 및 SQLite 잠금 대기 시간(초)
+DEFAULT_TIMEOUT = 10.0
+
+_JOURNAL_MODES = {"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"}
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+_TEMP_STORE_MODES = {"DEFAULT", "FILE", "MEMORY"}
+
+
+class StorageProfile(BaseModel):
+    """
+    로컬 저장소에 적용할 PRAGMA 설정 묶음입니다.
+    각 값은 `ENV_LOCAL_DB_*` 환경 변수로 덮어쓸 수 있습니다.
+    """
+
+    journal_mode: str = Field("WAL", description="저널 모드 (WAL이면 쓰기가 읽기를 막지 않음)")
+    synchronous: str = Field("NORMAL", description="동기화 수준 (WAL에서는 NORMAL로도 손상 위험 없음)")
+    mmap_size: int = Field(256 * 1024 * 1024, description="메모리 맵 I/O 크기 (bytes)")
+    cache_size: int = Field(-64000, description="페이지 캐시 크기 (음수면 KiB 단위)")
+    temp_store: str = Field("MEMORY", description="임시 테이블/인덱스 저장 위치")
+    busy_timeout_ms: int = Field(10000, description="잠금 대기 시간 (ms)")
+    maintenance_interval_sec: float = Field(300.0, description="WAL 체크포인트 및 optimize 주기 (초, 0이면 비활성)")
+
+    @classmethod
+    def from_env(cls) -> "StorageProfile":
+        """환경 변수에서 설정을 읽어 프로필을 생성합니다. 잘못된 값은 기본값으로 대체합니다."""
+        default = cls()
+
+        def _choice(name: str, allowed: set[str], fallback: str) -> str:
+            value = os.getenv(name, fallback).strip().upper()
+            if value not in allowed:
+                logging.warning(f"환경 변수 '{name}' 값 '{value}'은(는) 지원하지 않아 '{fallback}'을 사용합니다.")
+                return fallback
+            return value
+
+        def _number(name: str, cast: type, fallback):
+            raw = os.getenv(name)
+            if raw is None:
+                return fallback
+            try:
+                return cast(raw)
+            except ValueError:
+                logging.warning(f"환경 변수 '{name}' 값 '{raw}'이(가) 숫자가 아니어서 기본값을 사용합니다.")
+                return fallback
+
+        return cls(
+            journal_mode=_choice("ENV_LOCAL_DB_JOURNAL_MODE", _JOURNAL_MODES, default.journal_mode),
+            synchronous=_choice("ENV_LOCAL_DB_SYNCHRONOUS", _SYNCHRONOUS_MODES, default.synchronous),
+            mmap_size=_number("ENV_LOCAL_DB_MMAP_SIZE", int, default.mmap_size),
+            cache_size=_number("ENV_LOCAL_DB_CACHE_SIZE", int, default.cache_size),
+            temp_store=_choice("ENV_LOCAL_DB_TEMP_STORE", _TEMP_STORE_MODES, default.temp_store),
+            busy_timeout_ms=_number("ENV_LOCAL_DB_BUSY_TIMEOUT_MS", int, default.busy_timeout_ms),
+            maintenance_interval_sec=_number(
+                "ENV_LOCAL_DB_MAINTENANCE_INTERVAL_SEC", float, default.maintenance_interval_sec
+            ),
+        )
+
+    def pragma_statements(self) -> list[str]:
+        """커넥션에 실행할 PRAGMA 문 목록을 반환합니다."""
+        return [
+            f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}",
+            f"PRAGMA journal_mode = {self.journal_mode}",
+            f"PRAGMA synchronous = {self.synchronous}",
+            f"PRAGMA mmap_size = {int(self.mmap_size)}",
+            f"PRAGMA cache_size = {int(self.cache_size)}",
+            f"PRAGMA temp_store = {self.temp_store}",
+        ]
+
+
+class LocalStorageEngine:
+    """
+    로컬 저장소(~/.qgenie/local_storage.sqlite)에 대한 공용 커넥션 풀입니다.
+    - 커넥션은 한 번 열면 닫지 않고 재사용하며, 생성 시 PRAGMA를 한 번만 적용합니다.
+    - 한 커넥션은 동시에 하나의 스레드에서만 대여(checkout)되므로 스레드 간 공유가 안전합니다.
+    - 레포지토리는 `connection()`(조회) 또는 `transaction()`(변경) 컨텍스트를 사용합니다.
+    - `start_maintenance()`로 WAL 체크포인트와 `PRAGMA optimize`를 주기적으로 실행합니다.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        timeout: float = DEFAULT_TIMEOUT,
+        profile: StorageProfile | None = None,
+    ):
+        self._db_path = db_path
+        self._pool_size = pool_size
+        self._timeout = timeout
+        self._profile = profile
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._maintenance_stop = threading.Event()
+        self._maintenance_thread: threading.Thread | None = None
+
+    @property
+    def db_path(self) -> Path:
+        """DB 파일 경로를 최초 한 번만 계산하여 재사용합니다."""
+        if self._db_path is None:
+            self._db_path = get_db_path()
+        return self._db_path
+
+    @property
+    def profile(self) -> StorageProfile:
+        """
+        PRAGMA 프로필을 최초 사용 시점에 환경 변수에서 읽어옵니다.
+        (.env 로드가 모듈 import 이후에 일어나므로 생성자에서 읽지 않습니다.)
+        """
+        if self._profile is None:
+            self._profile = StorageProfile.from_env()
+        return self._profile
+
+    def apply_storage_profile(self, conn: sqlite3.Connection) -> None:
+        """저장소 프로필의 PRAGMA를 주어진 커넥션에 적용합니다. (초기화용 커넥션에서도 사용)"""
+        for statement in self.profile.pragma_statements():
+            conn.execute(statement).fetchall()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        풀에서 커넥션을 빌려주고, 블록이 끝나면 반납합니다.
+        반납 시 커밋되지 않은 트랜잭션은 롤백되므로, 데이터 변경은 `transaction()`을 사용해야 합니다.
+        """
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            self._release(conn)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        하나의 쓰기 트랜잭션을 제공합니다.
+        - 시작 시 쓰기 잠금을 먼저 획득(BEGIN IMMEDIATE)하여 잠금 승격 중 교착을 피합니다.
+        - 블록이 정상 종료되면 커밋, 예외가 발생하면 롤백 후 예외를 다시 발생시킵니다.
+        """
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+
+    def close_all(self) -> None:
+        """풀에 반납되어 있는 모든 커넥션을 닫습니다. (애플리케이션 종료 시 사용)"""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(conn)
+
+    def warm_up(self, count: int = 2) -> None:
+        """첫 요청에서 커넥션 생성 비용이 들지 않도록 커넥션을 미리 열어 풀에 넣어둡니다."""
+        conns = []
+        try:
+            for _ in range(min(count, self._pool_size)):
+                conns.append(self._acquire())
+        finally:
+            for conn in conns:
+                self._release(conn)
+
+    def run_maintenance(self) -> None:
+        """WAL 파일을 DB에 반영(체크포인트)하고, 쿼리 플래너 통계를 갱신합니다."""
+        with self.connection() as conn:
+            if self.profile.journal_mode == "WAL":
+                # PASSIVE: 진행 중인 읽기/쓰기를 기다리지 않고 가능한 만큼만 반영합니다.
+                conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchall()
+            conn.execute("PRAGMA optimize").fetchall()
+
+    def start_maintenance(self) -> None:
+        """주기적인 유지보수 작업을 백그라운드 스레드로 시작합니다."""
+        interval = self.profile.maintenance_interval_sec
+        if interval <= 0 or (self._maintenance_thread and self._maintenance_thread.is_alive()):
+            return
+
+        self._maintenance_stop.clear()
+
+        def _loop():
+            while not self._maintenance_stop.wait(interval):
+                try:
+                    self.run_maintenance()
+                except sqlite3.Error:
+                    logging.warning("로컬 저장소 유지보수 작업 중 오류가 발생했습니다.", exc_info=True)
+
+        self._maintenance_thread = threading.Thread(target=_loop, name="local-storage-maintenance", daemon=True)
+        self._maintenance_thread.start()
+
+    def stop_maintenance(self) -> None:
+        """백그라운드 유지보수 작업을 중지합니다."""
+        self._maintenance_stop.set()
+        if self._maintenance_thread:
+            self._maintenance_thread.join(timeout=self._timeout)
+            self._maintenance_thread = None
+
+    def _create_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.db_path), timeout=self._timeout, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        self._apply_pragmas(conn)
+        return conn
+
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """커넥션 단위 PRAGMA를 생성 시점에 한 번만 적용합니다."""
+        self.apply_storage_profile(conn)
+        # 스키마에 선언된 ON DELETE CASCADE / SET NULL 이 동작하도록 외래 키 제약을 활성화합니다.
+        # 따라서 프로필/채팅 탭 삭제 시 하위 데이터가 함께 삭제되고, 없는 부모를 참조하는 INSERT 는 실패합니다.
+        conn.execute("PRAGMA foreign_keys = ON")
+
+    def _acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created < self._pool_size
+            if can_create:
+                self._created += 1
+
+        if can_create:
+            try:
+                return self._create_connection()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+
+        try:
+            return self._idle.get(timeout=self._timeout)
+        except queue.Empty as e:
+            # 서비스 계층의 DB_BUSY 처리와 동일하게 다뤄지도록 잠금 오류 메시지를 사용합니다.
+            raise sqlite3.OperationalError("database is locked: no idle local storage connection") from e
+
+    def _release(self, conn: sqlite3.Connection) -> None:
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            logging.warning("로컬 저장소 커넥션 상태를 복구하지 못해 폐기합니다.", exc_info=True)
+            self._discard(conn)
+            return
+        self._idle.put(conn)
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+        with self._lock:
+            self._created -= 1
+
+
+local_storage = LocalStorageEngine()
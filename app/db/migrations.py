@@ -0,0 +1,78 @@
+# app/db/migrations.py
+import logging
+import sqlite3
+from collections.abc import Callable
+from typing import NamedTuple
+
+
+class Migration(NamedTuple):
+    """
+    로컬 저장소 스키마 변경 단위입니다.
+    - version: 1부터 시작하는 고유 버전 (적용 순서)
+    - apply: 트랜잭션 안에서 실행될 함수 (cursor를 인자로 받음)
+    """
+
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Cursor], None]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """현재 적용된 스키마 버전을 반환합니다. 버전 테이블이 없으면 0을 반환합니다."""
+    row = conn.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'schema_version'").fetchone()
+    if not row:
+        return 0
+    return conn.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version").fetchone()[0]
+
+
+def run_migrations(conn: sqlite3.Connection, migrations: list[Migration]) -> int:
+    """
+    적용되지 않은 마이그레이션을 버전 순서대로 하나씩 적용하고, 최종 버전을 반환합니다.
+    - 이미 최신 버전이면 버전 조회 한 번으로 끝나므로, 테이블 수나 데이터 양과 무관하게 빠릅니다.
+    - 각 마이그레이션은 개별 트랜잭션으로 적용되며, 실패 시 해당 단계만 롤백되고 예외가 전파됩니다.
+    - 테이블 재생성 중 CASCADE 삭제가 일어나지 않도록 외래 키 제약을 끈 상태로 실행합니다.
+    """
+    ordered = sorted(migrations, key=lambda m: m.version)
+    current_version = get_schema_version(conn)
+    pending = [m for m in ordered if m.version > current_version]
+    if not pending:
+        return current_version
+
+    # PRAGMA foreign_keys 는 트랜잭션 안에서 변경되지 않으므로 BEGIN 전에 설정합니다.
+    conn.execute("PRAGMA foreign_keys = OFF")
+    try:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER PRIMARY KEY NOT NULL,
+                description TEXT NOT NULL,
+                applied_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        conn.commit()
+
+        for migration in pending:
+            logging.info(f"로컬 저장소 마이그레이션 {migration.version} 적용 중: {migration.description}")
+            conn.execute("BEGIN")
+            try:
+                cursor = conn.cursor()
+                migration.apply(cursor)
+                cursor.execute(
+                    "INSERT INTO schema_version (version, description) VALUES (?, ?)",
+                    (migration.version, migration.description),
+                )
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                logging.error(f"로컬 저장소 마이그레이션 {migration.version} 적용에 실패하여 롤백했습니다.")
+                raise
+            current_version = migration.version
+
+        violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+        if violations:
+            logging.warning(f"마이그레이션 후 외래 키 제약을 위반하는 행이 {len(violations)}건 있습니다.")
+    finally:
+        conn.execute("PRAGMA foreign_keys = ON")
+
+    return current_version
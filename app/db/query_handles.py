@@ -0,0 +1,296 @@
+# app/db/query_handles.py
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from app.core.exceptions import APIException
+from app.core.status import CommonCode
+from app.core.utils import get_env_number
+from app.db.user_db_pool import open_connection
+
+# 프로필에 제한 시간이 지정되지 않았을 때 사용할 기본 쿼리 제한 시간(초). 0이면 제한하지 않습니다.
+DEFAULT_QUERY_TIMEOUT_SEC = 300
+# DB 자체 제한 시간이 먼저 동작하도록, 감시 타이머는 이 시간(초)만큼 늦게 취소를 시도합니다.
+WATCHDOG_GRACE_SEC = 1.0
+
+CANCEL_REASON_USER = "canceled"
+CANCEL_REASON_TIMEOUT = "timeout"
+
+
+def default_query_timeout_sec() -> int:
+    """기본 쿼리 제한 시간(초)을 반환합니다. `ENV_QUERY_TIMEOUT_SEC` 환경 변수로 덮어쓸 수 있습니다."""
+    return get_env_number("ENV_QUERY_TIMEOUT_SEC", int, DEFAULT_QUERY_TIMEOUT_SEC)
+
+
+class RunningQuery(BaseModel):
+    """실행 중인 쿼리 정보 (조회용)"""
+
+    handle_id: str = Field(..., description="실행 Key")
+    db_profile_id: str | None = Field(None, description="DB 프로필 Key")
+    query_text: str = Field(..., description="쿼리 내용 (앞부분)")
+    started_at: datetime = Field(..., description="실행 시작 시각")
+    timeout_sec: int = Field(..., description="제한 시간(초), 0이면 무제한")
+
+
+class QueryHandle:
+    """
+    실행 중인 사용자 DB 쿼리 하나를 나타냅니다.
+    실행 중인 커넥션/커서를 붙잡고 있다가, 취소 요청이나 제한 시간 초과 시 드라이버 고유의 방식으로 쿼리를 중단합니다.
+    """
+
+    def __init__(self, handle_id: str, db_profile_id: str | None, query_text: str, timeout_sec: int):
+        self.handle_id = handle_id
+        self.db_profile_id = db_profile_id
+        self.query_text = query_text
+        self.timeout_sec = max(0, timeout_sec)
+        self.started_at = datetime.now()
+        self.cancel_reason: str | None = None
+        # 실행 후 커넥션을 폐기할 예정이면 True (제한 시간 원복 등 커넥션에 더 이상 명령을 보내지 않습니다)
+        self.connection_abandoned = False
+        self._driver_module: Any = None
+        self._connection: Any = None
+        self._cursor: Any = None
+        self._connect_kwargs: dict[str, Any] = {}
+        self._attached_at: float | None = None
+        self._watchdog: threading.Timer | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def driver_name(self) -> str:
+        return self._driver_module.__name__ if self._driver_module else ""
+
+    def failure_code(self, default: CommonCode) -> CommonCode:
+        """쿼리 실패 시 응답할 코드를 반환합니다. 취소/제한 시간 초과로 중단된 경우 해당 코드를 반환합니다."""
+        if self.cancel_reason == CANCEL_REASON_TIMEOUT:
+            return CommonCode.QUERY_TIMEOUT
+        if self.cancel_reason == CANCEL_REASON_USER:
+            return CommonCode.QUERY_CANCELED
+        return default
+
+    def to_model(self) -> RunningQuery:
+        return RunningQuery(
+            handle_id=self.handle_id,
+            db_profile_id=self.db_profile_id,
+            query_text=self.query_text[:200],
+            started_at=self.started_at,
+            timeout_sec=self.timeout_sec,
+        )
+
+    def attach(self, driver_module: Any, connection: Any, cursor: Any, connect_kwargs: dict[str, Any]) -> None:
+        with self._lock:
+            self._driver_module = driver_module
+            self._connection = connection
+            self._cursor = cursor
+            self._connect_kwargs = connect_kwargs
+            self._attached_at = time.monotonic()
+
+    def start_watchdog(self, delay_sec: float) -> None:
+        """제한 시간이 지나도 끝나지 않으면 쿼리를 취소하는 감시 타이머를 시작합니다."""
+        watchdog = threading.Timer(delay_sec, self.cancel, (CANCEL_REASON_TIMEOUT,))
+        watchdog.daemon = True
+        with self._lock:
+            self._watchdog = watchdog
+        watchdog.start()
+
+    def detach(self) -> tuple[Any, Any, float]:
+        """붙잡고 있던 커넥션/커서와 실행 시간(초)을 반환하고 놓습니다. 이미 놓았으면 커넥션은 None입니다."""
+        with self._lock:
+            connection, cursor, watchdog = self._connection, self._cursor, self._watchdog
+            elapsed = time.monotonic() - self._attached_at if self._attached_at is not None else 0.0
+            self._connection = None
+            self._cursor = None
+            self._watchdog = None
+        if watchdog:
+            watchdog.cancel()
+        return connection, cursor, elapsed
+
+    def cancel(self, reason: str = CANCEL_REASON_USER) -> bool:
+        """실행 중인 쿼리를 중단합니다. 이미 끝났거나 중단할 수 없으면 False를 반환합니다."""
+        with self._lock:
+            if self._connection is None:
+                return False
+            self.cancel_reason = self.cancel_reason or reason
+            connection, cursor = self._connection, self._cursor
+
+        logging.info(f"Cancelling query {self.handle_id} ({reason}).")
+        try:
+            if self._cancel_native(connection, cursor):
+                return True
+            logging.warning(f"Cancellation is not supported for {self.driver_name}")
+        except Exception as e:
+            logging.warning(f"Failed to cancel query {self.handle_id}: {e}")
+        return False
+
+    def _cancel_native(self, connection: Any, cursor: Any) -> bool:
+        """드라이버 고유의 방식으로 쿼리를 중단합니다. 지원하지 않는 드라이버면 False를 반환합니다."""
+        driver_name = self.driver_name
+        if driver_name == "sqlite3":
+            connection.interrupt()
+        elif driver_name in ("psycopg2", "oracledb"):
+            connection.cancel()
+        elif driver_name == "pyodbc":
+            cursor.cancel()
+        elif driver_name == "mysql.connector":
+            self._kill_query(connection.connection_id)
+        elif driver_name == "pymysql":
+            self._kill_query(connection.thread_id())
+        else:
+            return False
+        return True
+
+    def _kill_query(self, connection_id: int) -> None:
+        """MySQL/MariaDB는 실행 중인 커넥션에서 취소할 수 없으므로, 별도 커넥션에서 KILL QUERY를 보냅니다."""
+        side_connection = open_connection(self._driver_module, **self._connect_kwargs)
+        try:
+            cursor = side_connection.cursor()
+            cursor.execute(f"KILL QUERY {int(connection_id)}")
+        finally:
+            side_connection.close()
+
+
+class QueryHandleRegistry:
+    """
+    실행 중인 쿼리 핸들을 관리합니다.
+    - 실행 중에는 핸들 Key로 쿼리를 취소할 수 있습니다.
+    - 제한 시간이 있으면 드라이버 고유의 제한 시간을 설정하고, 그래도 끝나지 않으면 감시 타이머가 쿼리를 취소합니다.
+    - `request_cancel`로 아직 등록되지 않은 핸들 Key의 취소를 예약하면, 쿼리가 등록되는 시점에 실행하지 않고 중단합니다.
+    """
+
+    def __init__(self):
+        self._handles: dict[str, QueryHandle] = {}
+        self._pending_cancels: set[str] = set()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def running(
+        self,
+        handle: QueryHandle,
+        driver_module: Any,
+        connection: Any,
+        cursor: Any,
+        connect_kwargs: dict[str, Any],
+    ) -> Iterator[QueryHandle]:
+        """`with` 블록 안에서 실행되는 쿼리를 등록하고, 제한 시간을 적용합니다."""
+        self.register(handle, driver_module, connection, cursor, connect_kwargs)
+        try:
+            yield handle
+        finally:
+            self.unregister(handle)
+
+    def register(
+        self,
+        handle: QueryHandle,
+        driver_module: Any,
+        connection: Any,
+        cursor: Any,
+        connect_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        쿼리를 취소/제한 시간 관리 대상으로 등록합니다. 쿼리(또는 결과 스트림)가 끝나면 `unregister`를 호출해야 합니다.
+        등록 전에 취소가 예약되어 있었으면 등록하지 않고 QUERY_CANCELED 예외를 발생시킵니다.
+        """
+        with self._lock:
+            if handle.handle_id in self._pending_cancels:
+                self._pending_cancels.discard(handle.handle_id)
+                handle.cancel_reason = CANCEL_REASON_USER
+                raise APIException(CommonCode.QUERY_CANCELED)
+            handle.attach(driver_module, connection, cursor, connect_kwargs)
+            self._handles[handle.handle_id] = handle
+
+        if handle.timeout_sec:
+            _apply_native_timeout(handle.driver_name, connection, cursor, handle.timeout_sec)
+            handle.start_watchdog(handle.timeout_sec + WATCHDOG_GRACE_SEC)
+
+    def unregister(self, handle: QueryHandle) -> None:
+        """등록을 해제하고, 커넥션을 계속 사용할 예정이면 제한 시간을 원래 값으로 되돌립니다. 여러 번 호출해도 됩니다."""
+        connection, cursor, elapsed = handle.detach()
+        with self._lock:
+            if self._handles.get(handle.handle_id) is handle:
+                del self._handles[handle.handle_id]
+        if connection is None or not handle.timeout_sec:
+            return
+        if not handle.connection_abandoned:
+            _reset_native_timeout(handle.driver_name, connection, cursor)
+        if elapsed >= handle.timeout_sec and not handle.cancel_reason:
+            # DB 자체 제한 시간으로 중단된 경우
+            handle.cancel_reason = CANCEL_REASON_TIMEOUT
+
+    def cancel(self, handle_id: str) -> bool:
+        """실행 중인 쿼리를 취소합니다. 해당 Key로 실행 중인 쿼리가 없으면 False를 반환합니다."""
+        with self._lock:
+            handle = self._handles.get(handle_id)
+        return handle.cancel() if handle else False
+
+    def request_cancel(self, handle_id: str) -> bool:
+        """
+        실행 중인 쿼리를 취소하고, 아직 등록되지 않았으면 등록 시점에 중단되도록 취소를 예약합니다.
+        바로 취소했으면 True, 예약했으면 False를 반환합니다. 예약은 `discard_cancel`로 해제합니다.
+        """
+        with self._lock:
+            handle = self._handles.get(handle_id)
+            if handle is None:
+                self._pending_cancels.add(handle_id)
+                return False
+        return handle.cancel()
+
+    def discard_cancel(self, handle_id: str) -> None:
+        """예약된 취소를 해제합니다. (쿼리가 등록되지 않은 채 끝난 경우)"""
+        with self._lock:
+            self._pending_cancels.discard(handle_id)
+
+    def find_running(self, db_profile_id: str | None = None) -> list[RunningQuery]:
+        with self._lock:
+            handles = list(self._handles.values())
+        return [
+            handle.to_model() for handle in handles if db_profile_id is None or handle.db_profile_id == db_profile_id
+        ]
+
+
+def _apply_native_timeout(driver_name: str, connection: Any, cursor: Any, timeout_sec: int) -> None:
+    """드라이버/DB가 제공하는 쿼리 제한 시간을 설정합니다. 설정에 실패해도 감시 타이머가 제한 시간을 보장합니다."""
+    try:
+        if driver_name == "psycopg2":
+            # SET LOCAL 은 트랜잭션이 끝나면(커밋/반납 시 롤백) 원래 값으로 돌아갑니다.
+            _execute_setting(connection, "SET LOCAL statement_timeout = %s", (timeout_sec * 1000,))
+        elif driver_name == "mysql.connector":
+            _execute_setting(connection, "SET SESSION MAX_EXECUTION_TIME = %s", (timeout_sec * 1000,))
+        elif driver_name == "pymysql":
+            _execute_setting(connection, "SET SESSION max_statement_time = %s", (timeout_sec,))
+        elif driver_name == "oracledb":
+            connection.call_timeout = timeout_sec * 1000
+        elif driver_name == "pyodbc":
+            connection.timeout = timeout_sec
+    except Exception as e:
+        logging.warning(f"Failed to apply native query timeout for {driver_name}: {e}")
+
+
+def _reset_native_timeout(driver_name: str, connection: Any, cursor: Any) -> None:
+    """풀로 돌아간 커넥션이 다른 조회(스키마 조회 등)에 제한 시간을 물려주지 않도록 원래 값으로 되돌립니다."""
+    try:
+        if driver_name == "mysql.connector":
+            _execute_setting(connection, "SET SESSION MAX_EXECUTION_TIME = 0", ())
+        elif driver_name == "pymysql":
+            _execute_setting(connection, "SET SESSION max_statement_time = 0", ())
+        elif driver_name == "oracledb":
+            connection.call_timeout = 0
+        elif driver_name == "pyodbc":
+            connection.timeout = 0
+    except Exception as e:
+        logging.warning(f"Failed to reset native query timeout for {driver_name}: {e}")
+
+
+def _execute_setting(connection: Any, sql: str, params: tuple) -> None:
+    cursor = connection.cursor()
+    try:
+        cursor.execute(sql, params or None)
+    finally:
+        cursor.close()
+
+
+query_handles = QueryHandleRegistry()
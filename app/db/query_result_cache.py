@@ -0,0 +1,168 @@
+# app/db/query_result_cache.py
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.core import serialization
+from app.core.enum.result_format import ResultFormatEnum
+from app.core.utils import get_env_number
+
+# 캐시 전체 최대 크기(바이트, 결과를 JSON으로 직렬화한 크기 기준). ENV_QUERY_CACHE_MAX_BYTES 로 덮어씁니다.
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+# 캐시된 결과의 유효 시간(초). ENV_QUERY_CACHE_TTL_SEC 로 덮어씁니다.
+DEFAULT_TTL = 300.0
+# 결과 하나가 캐시 전체에서 차지할 수 있는 최대 비율 (큰 결과 하나가 캐시를 비우지 않도록)
+MAX_ENTRY_RATIO = 0.25
+
+# 정규화 시 그대로 유지할 문자열/식별자 리터럴과 제거할 주석
+_LITERAL_OR_COMMENT = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/", re.DOTALL)
+_WHITESPACE = re.compile(r"\s+")
+
+CacheKey = tuple[str, str, str, str]
+
+
+def normalize_query(query_text: str) -> str:
+    """
+    캐시 Key로 사용할 수 있도록 쿼리를 정규화합니다.
+    주석을 제거하고 연속된 공백을 한 칸으로 줄이며 끝의 세미콜론을 제거합니다. 리터럴 안의 내용은 바꾸지 않습니다.
+    """
+    parts: list[str] = []
+    text = ""
+    last = 0
+    for match in _LITERAL_OR_COMMENT.finditer(query_text):
+        token = match.group()
+        text += query_text[last : match.start()]
+        last = match.end()
+        if token.startswith(("--", "/*")):
+            text += " "
+            continue
+        parts.append(_WHITESPACE.sub(" ", text))
+        parts.append(token)
+        text = ""
+    parts.append(_WHITESPACE.sub(" ", text + query_text[last:]))
+    return "".join(parts).strip().rstrip(";").strip()
+
+
+class _CacheEntry:
+    __slots__ = ("data", "size", "expires_at")
+
+    def __init__(self, data: Any, size: int, expires_at: float):
+        self.data = data
+        self.size = size
+        self.expires_at = expires_at
+
+
+class QueryResultCache:
+    """
+    읽기 전용 쿼리의 실행 결과를 메모리에 보관하는 LRU 캐시입니다.
+    - Key: (프로필 Key, 데이터베이스, 결과 형식, 정규화한 쿼리)
+    - 전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 결과부터 제거하고, TTL이 지난 결과는 사용하지 않습니다.
+    - 프로필에 데이터를 바꾸는 쿼리가 실행되면 해당 프로필의 결과를 모두 무효화합니다.
+      무효화 이전에 시작된 조회의 결과가 뒤늦게 저장되지 않도록 프로필별 세대 번호를 확인합니다.
+    """
+
+    def __init__(self, max_bytes: int | None = None, ttl: float | None = None):
+        self._max_bytes = max(0, max_bytes) if max_bytes is not None else None
+        self._ttl = ttl
+        self._entries: OrderedDict[CacheKey, _CacheEntry] = OrderedDict()
+        self._total_bytes = 0
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        캐시 최대 크기를 최초 사용 시점에 환경 변수에서 읽어옵니다.
+        (.env 로드가 모듈 import 이후에 일어나므로 생성자에서 읽지 않습니다.)
+        """
+        if self._max_bytes is None:
+            self._max_bytes = max(0, get_env_number("ENV_QUERY_CACHE_MAX_BYTES", int, DEFAULT_MAX_BYTES))
+        return self._max_bytes
+
+    @property
+    def ttl(self) -> float:
+        """결과 유효 시간을 최초 사용 시점에 환경 변수에서 읽어옵니다."""
+        if self._ttl is None:
+            self._ttl = get_env_number("ENV_QUERY_CACHE_TTL_SEC", float, DEFAULT_TTL)
+        return self._ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.ttl > 0
+
+    def generation(self, profile_id: str) -> int:
+        """프로필의 현재 세대 번호를 반환합니다. 조회 시작 전에 받아 두었다가 `put`에 전달합니다."""
+        with self._lock:
+            return self._generations.get(profile_id, 0)
+
+    def get(self, profile_id: str, database: str | None, query_text: str, result_format: ResultFormatEnum) -> Any:
+        """캐시된 결과를 반환합니다. 없거나 만료되었으면 None을 반환합니다."""
+        if not self.enabled:
+            return None
+        key = self._key(profile_id, database, query_text, result_format)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.data
+
+    def put(
+        self,
+        profile_id: str,
+        database: str | None,
+        query_text: str,
+        result_format: ResultFormatEnum,
+        data: Any,
+        generation: int,
+    ) -> bool:
+        """결과를 저장합니다. 너무 크거나 조회 도중 프로필이 무효화되었으면 저장하지 않고 False를 반환합니다."""
+        if not self.enabled:
+            return False
+        size = len(serialization.dumps(data).encode())
+        if size > self.max_bytes * MAX_ENTRY_RATIO:
+            return False
+
+        key = self._key(profile_id, database, query_text, result_format)
+        with self._lock:
+            if self._generations.get(profile_id, 0) != generation:
+                return False
+            self._remove(key)
+            self._entries[key] = _CacheEntry(data, size, time.monotonic() + self.ttl)
+            self._total_bytes += size
+            while self._total_bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+        return True
+
+    def invalidate_profile(self, profile_id: str) -> None:
+        """프로필의 캐시된 결과를 모두 제거합니다."""
+        with self._lock:
+            self._generations[profile_id] = self._generations.get(profile_id, 0) + 1
+            keys = [key for key in self._entries if key[0] == profile_id]
+            for key in keys:
+                self._remove(key)
+        if keys:
+            logging.info(f"Invalidated {len(keys)} cached query results for db_profile {profile_id}.")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+
+    @staticmethod
+    def _key(profile_id: str, database: str | None, query_text: str, result_format: ResultFormatEnum) -> CacheKey:
+        return (profile_id, database or "", result_format.value, normalize_query(query_text))
+
+
+query_result_cache = QueryResultCache()
@@ -0,0 +1,355 @@
+# app/db/user_db_pool.py
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import oracledb
+
+# 연결 정보(드라이버 + 접속 인자)별로 유지할 최대 커넥션 수
+DEFAULT_MAX_SIZE = 4
+# 이 시간(초) 이상 사용되지 않은 유휴 커넥션은 닫습니다.
+DEFAULT_IDLE_TIMEOUT = 300.0
+# 유휴 시간이 이 값(초)을 넘은 커넥션은 대여 전에 실제로 ping을 보내 상태를 확인합니다.
+DEFAULT_PING_AFTER = 5.0
+# 풀이 가득 찼을 때 커넥션 반납을 기다리는 최대 시간(초)
+DEFAULT_ACQUIRE_TIMEOUT = 30.0
+
+
+def open_connection(driver_module: Any, **kwargs: Any) -> Any:
+    """드라이버 종류에 맞는 방식으로 사용자 DB에 새 커넥션을 엽니다."""
+    if driver_module is oracledb:
+        if kwargs.get("user", "").lower() == "sys":
+            kwargs["mode"] = oracledb.AUTH_MODE_SYSDBA
+        return driver_module.connect(**kwargs)
+    elif "connection_string" in kwargs:
+        return driver_module.connect(kwargs["connection_string"])
+    elif driver_module is sqlite3:
+        # 풀에 보관된 커넥션은 다른 요청 스레드에서 재사용될 수 있습니다.
+        return driver_module.connect(kwargs.get("db_name") or kwargs["database"], check_same_thread=False)
+    else:
+        return driver_module.connect(**kwargs)
+
+
+class PoolExhaustedError(Exception):
+    """정해진 시간 안에 사용 가능한 커넥션을 얻지 못한 경우 발생합니다."""
+
+
+class _IdleConnection:
+    __slots__ = ("conn", "last_used")
+
+    def __init__(self, conn: Any):
+        self.conn = conn
+        self.last_used = time.monotonic()
+
+
+class UserDbConnectionPool:
+    """
+    하나의 연결 정보(드라이버 + 접속 인자)에 대한 커넥션 풀입니다.
+    - 대여 시 오래 쉬었던 커넥션은 ping으로 상태를 확인하고, 끊긴 커넥션은 새로 엽니다.
+    - 반납 시 진행 중이던 트랜잭션을 롤백하여 다음 사용자에게 상태가 넘어가지 않도록 합니다.
+    """
+
+    def __init__(
+        self,
+        driver_module: Any,
+        connect: Callable[[], Any],
+        connect_kwargs: dict[str, Any],
+        max_size: int = DEFAULT_MAX_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        self.driver_module = driver_module
+        self.connect_kwargs = connect_kwargs
+        self._connect = connect
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._idle: list[_IdleConnection] = []
+        self._created = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+    @property
+    def is_unused(self) -> bool:
+        with self._cond:
+            return self._created == 0
+
+    def acquire(self, timeout: float = DEFAULT_ACQUIRE_TIMEOUT) -> Any:
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._cond:
+                expired = self._evict_idle_locked()
+                entry = self._idle.pop() if self._idle else None
+                can_create = entry is None and self._created < self._max_size
+                if can_create:
+                    self._created += 1
+                elif entry is None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise PoolExhaustedError("사용 가능한 사용자 DB 커넥션이 없습니다.")
+                    self._cond.wait(remaining)
+                    continue
+
+            for conn in expired:
+                self._close_quietly(conn)
+
+            if can_create:
+                try:
+                    return self._connect()
+                except BaseException:
+                    self._forget()
+                    raise
+
+            if self._is_healthy(entry):
+                return entry.conn
+            logging.info(f"끊어진 사용자 DB 커넥션을 폐기합니다. ({self.driver_module.__name__})")
+            self._close_quietly(entry.conn)
+            self._forget()
+
+    def release(self, conn: Any) -> None:
+        try:
+            conn.rollback()
+        except Exception:
+            # 롤백조차 실패하면 연결이 끊긴 것으로 보고 폐기합니다.
+            self.discard(conn)
+            return
+
+        with self._cond:
+            if self._closed:
+                self._created -= 1
+                self._cond.notify()
+                close = True
+            else:
+                self._idle.append(_IdleConnection(conn))
+                self._cond.notify()
+                close = False
+        if close:
+            self._close_quietly(conn)
+
+    def discard(self, conn: Any) -> None:
+        self._close_quietly(conn)
+        self._forget()
+
+    def close(self) -> None:
+        """유휴 커넥션을 모두 닫고, 대여 중인 커넥션은 반납 시 닫히도록 표시합니다."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._created -= len(idle)
+            self._cond.notify_all()
+        for entry in idle:
+            self._close_quietly(entry.conn)
+
+    def evict_idle(self) -> None:
+        with self._cond:
+            expired = self._evict_idle_locked()
+        for conn in expired:
+            self._close_quietly(conn)
+
+    def _evict_idle_locked(self) -> list[Any]:
+        now = time.monotonic()
+        expired = [e.conn for e in self._idle if now - e.last_used > self._idle_timeout]
+        if expired:
+            self._idle = [e for e in self._idle if now - e.last_used <= self._idle_timeout]
+            self._created -= len(expired)
+            self._cond.notify(len(expired))
+        # 실제 close는 네트워크 I/O가 있을 수 있으므로 잠금을 놓은 뒤 호출자가 수행합니다.
+        return expired
+
+    def _forget(self) -> None:
+        with self._cond:
+            self._created -= 1
+            self._cond.notify()
+
+    def _is_healthy(self, entry: _IdleConnection) -> bool:
+        conn = entry.conn
+        # psycopg2 는 끊긴 커넥션을 closed 값으로 알려줍니다.
+        if getattr(conn, "closed", 0):
+            return False
+        if time.monotonic() - entry.last_used < DEFAULT_PING_AFTER:
+            return True
+        try:
+            _ping(self.driver_module, conn)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn: Any) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+def _ping(driver_module: Any, conn: Any) -> None:
+    """드라이버별로 가장 가벼운 방법으로 서버와의 연결 상태를 확인합니다."""
+    module_name = driver_module.__name__
+    if module_name == "oracledb":
+        conn.ping()
+    elif module_name in ("mysql.connector", "pymysql"):
+        conn.ping(reconnect=False)
+    else:
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT 1")
+            cursor.fetchall()
+        finally:
+            cursor.close()
+        conn.rollback()
+
+
+class UserDbPoolManager:
+    """
+    사용자 DB 커넥션 풀을 연결 정보별로 관리합니다.
+    DBTypesEnum 의 모든 드라이버 앞단에서 동작하며, 동일한 접속 인자로 들어온 요청은 같은 풀을 공유합니다.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self._max_size = max_size
+        self._idle_timeout = idle_timeout
+        self._pools: dict[tuple, UserDbConnectionPool] = {}
+        # 대여 중인 커넥션이 어느 풀에서 나왔는지 기록합니다. ({id(conn): pool})
+        self._checked_out: dict[int, UserDbConnectionPool] = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+    def acquire(self, driver_module: Any, connect: Callable[..., Any], **kwargs: Any) -> Any:
+        """
+        접속 인자에 해당하는 풀에서 커넥션을 빌립니다. 사용 후에는 반드시 `release()`로 반납해야 합니다.
+        `connect(driver_module, **kwargs)` 는 풀에 커넥션이 없을 때 새 커넥션을 여는 데 사용됩니다.
+        """
+        self._sweep_if_due()
+        pool = self._get_pool(driver_module, connect, kwargs)
+        conn = pool.acquire()
+        with self._lock:
+            self._checked_out[id(conn)] = pool
+        return conn
+
+    def release(self, conn: Any) -> None:
+        """빌린 커넥션을 롤백 후 풀에 반납합니다. 롤백에 실패한 커넥션은 폐기됩니다."""
+        with self._lock:
+            pool = self._checked_out.pop(id(conn), None)
+        if pool is None:
+            UserDbConnectionPool._close_quietly(conn)
+            return
+        pool.release(conn)
+
+    def discard(self, conn: Any) -> None:
+        """연결이 끊긴 커넥션을 풀에 돌려놓지 않고 닫습니다."""
+        with self._lock:
+            pool = self._checked_out.pop(id(conn), None)
+        if pool is None:
+            UserDbConnectionPool._close_quietly(conn)
+            return
+        pool.discard(conn)
+
+    @contextmanager
+    def connection(self, driver_module: Any, connect: Callable[..., Any], **kwargs: Any) -> Iterator[Any]:
+        """`acquire()`/`release()`를 감싼 컨텍스트 매니저입니다."""
+        interface_error = getattr(driver_module, "InterfaceError", ())
+        conn = self.acquire(driver_module, connect, **kwargs)
+        try:
+            yield conn
+        except interface_error:
+            # 연결 자체가 끊긴 경우 다시 풀에 넣지 않습니다.
+            self.discard(conn)
+            raise
+        except BaseException:
+            self.release(conn)
+            raise
+        else:
+            self.release(conn)
+
+    def invalidate_matching(
+        self,
+        host: str | None = None,
+        port: int | None = None,
+        user: str | None = None,
+        path: str | None = None,
+    ) -> int:
+        """
+        주어진 접속 대상과 일치하는 풀을 모두 닫고 제거합니다. (프로필 수정/삭제 시 호출)
+        - 서버형 DB는 host/port(/user)로, SQLite는 파일 경로로 비교합니다.
+        - 제거된 풀의 수를 반환합니다.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, pool in self._pools.items()
+                if _matches(pool.connect_kwargs, host=host, port=port, user=user, path=path)
+            ]
+            pools = [self._pools.pop(key) for key in keys]
+        for pool in pools:
+            pool.close()
+        if pools:
+            logging.info(f"사용자 DB 커넥션 풀 {len(pools)}개를 무효화했습니다.")
+        return len(pools)
+
+    def evict_idle(self) -> None:
+        """오래 사용되지 않은 커넥션을 닫고, 비어 있는 풀을 정리합니다."""
+        with self._lock:
+            pools = list(self._pools.items())
+        for key, pool in pools:
+            pool.evict_idle()
+            if pool.is_unused:
+                with self._lock:
+                    if self._pools.get(key) is pool:
+                        del self._pools[key]
+                pool.close()
+
+    def close_all(self) -> None:
+        """모든 풀을 닫습니다. (애플리케이션 종료 시 사용)"""
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
+    def _sweep_if_due(self) -> None:
+        # 다시 사용되지 않는 풀의 유휴 커넥션도 정리되도록, 대여 요청 시 주기적으로 전체 풀을 점검합니다.
+        with self._lock:
+            if time.monotonic() - self._last_sweep < self._idle_timeout / 2:
+                return
+            self._last_sweep = time.monotonic()
+        self.evict_idle()
+
+    def _get_pool(
+        self, driver_module: Any, connect: Callable[..., Any], kwargs: dict[str, Any]
+    ) -> UserDbConnectionPool:
+        key = (driver_module.__name__, tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = UserDbConnectionPool(
+                    driver_module,
+                    lambda: connect(driver_module, **kwargs),
+                    dict(kwargs),
+                    max_size=self._max_size,
+                    idle_timeout=self._idle_timeout,
+                )
+                self._pools[key] = pool
+            return pool
+
+
+def _matches(kwargs: dict[str, Any], host: str | None, port: int | None, user: str | None, path: str | None) -> bool:
+    if path is not None:
+        return "host" not in kwargs and path in (kwargs.get("db_name"), kwargs.get("database"))
+    if host is None:
+        return False
+
+    if "connection_string" in kwargs:
+        server = f"SERVER={host},{port};" if port is not None else f"SERVER={host}"
+        return server in kwargs["connection_string"]
+
+    if kwargs.get("host") != host:
+        return False
+    if port is not None and str(kwargs.get("port")) != str(port):
+        return False
+    if user is not None and kwargs.get("user") != user:
+        return False
+    return True
+
+
+user_db_pool = UserDbPoolManager()
@@ -1,10 +1,13 @@
 # main.py
+import asyncio
+import logging
 import os
 import sys
+from contextlib import asynccontextmanager
 
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -18,7 +21,14 @@ from app.core.exceptions import (
     generic_exception_handler,
     validation_exception_handler,
 )
+from app.core.executors import executors
+from app.core.readiness import readiness
 from app.db.init_db import initialize_database
+from app.db.local_storage import local_storage
+from app.db.user_db_pool import user_db_pool
+from app.services.annotation_job_service import annotation_job_service
+from app.services.driver_service import driver_service
+from app.services.query_session_service import query_session_service
 
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if project_root not in sys.path:
@@ -42,7 +52,60 @@ if os.path.exists(env_path):
 else:
     print(f"경고: .env 파일을 찾을 수 없습니다. ({env_path})")
 
-app = FastAPI()
+
+async def run_startup_pipeline():
+    """
+    서버가 포트를 연 뒤 백그라운드에서 초기화를 진행합니다.
+    마이그레이션과 드라이버 워밍업은 서로 독립적이므로 동시에 실행합니다.
+    """
+    readiness.register("local_storage_migration")
+    readiness.register("local_storage_warm_up")
+    readiness.register("driver_warm_up", required=False)
+
+    def _warm_up_local_storage():
+        local_storage.warm_up()
+        # 이전 실행에서 끝나지 못한 어노테이션 작업은 중단 상태로 표시합니다. (재개 요청으로 다시 실행)
+        # 준비 완료 전에 실행해야 새로 등록된 작업이 중단 상태로 바뀌지 않습니다.
+        annotation_job_service.mark_interrupted_jobs()
+
+    async def _prepare_local_storage():
+        if not await readiness.run_phase("local_storage_migration", initialize_database):
+            readiness.skip_phase("local_storage_warm_up", "local_storage_migration 단계가 실패했습니다.")
+            return
+        await readiness.run_phase("local_storage_warm_up", _warm_up_local_storage)
+        # WAL 체크포인트 및 PRAGMA optimize를 주기적으로 실행합니다.
+        local_storage.start_maintenance()
+
+    await asyncio.gather(
+        _prepare_local_storage(),
+        readiness.run_phase("driver_warm_up", driver_service.warm_up_drivers),
+    )
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup_task = asyncio.create_task(run_startup_pipeline())
+    # 버려진 결과 세션이 사용자 DB 커넥션을 계속 점유하지 않도록 만료된 세션을 주기적으로 닫습니다.
+    query_session_service.start_sweeper()
+    yield
+    if not startup_task.done():
+        startup_task.cancel()
+    # 시작 단계가 아직 실행 중이면 끝날 때까지 기다린 뒤 자원을 정리합니다.
+    try:
+        await startup_task
+    except asyncio.CancelledError:
+        pass
+    except Exception as e:
+        logging.error(f"시작 파이프라인 실행 중 오류가 발생했습니다: {e}", exc_info=True)
+    local_storage.stop_maintenance()
+    local_storage.close_all()
+    query_session_service.stop_sweeper()
+    query_session_service.close_all()
+    user_db_pool.close_all()
+    executors.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # 전체 로그 찍는 부분
 app.add_middleware(BaseHTTPMiddleware, dispatch=log_requests_middleware)
@@ -63,10 +126,8 @@ app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
 # 라우터
 app.include_router(health_api.router)
-app.include_router(api_router, prefix="/api")
-
-# initialize_database 함수가 호출되어 테이블이 생성되거나 이미 존재함을 확인합니다.
-initialize_database()
+# API 요청은 로컬 저장소 초기화가 끝날 때까지 대기합니다. (/health 는 즉시 응답)
+app.include_router(api_router, prefix="/api", dependencies=[Depends(readiness.wait_until_ready)])
 
 if __name__ == "__main__":
     # Uvicorn 서버를 시작합니다.
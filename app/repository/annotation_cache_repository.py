@@ -0,0 +1,44 @@
+from app.db.local_storage import local_storage
+
+# SQLite 바인딩 변수 수 제한을 넘지 않도록 한 번에 조회하는 해시 수
+_LOOKUP_BATCH_SIZE = 500
+
+
+class AnnotationCacheRepository:
+    """
+    AI 서버가 생성한 테이블 단위 어노테이션(JSON)을 테이블 정의 해시로 저장합니다.
+    프로필과 무관하게 같은 정의의 테이블(개발/스테이징/운영 사본 등)이 저장된 설명을 함께 사용합니다.
+    """
+
+    def find_payloads(self, table_hashes: list[str]) -> dict[str, str]:
+        """해시에 해당하는 캐시 항목을 {해시: payload} 형태로 반환합니다."""
+        payloads = {}
+        with local_storage.connection() as conn:
+            for start in range(0, len(table_hashes), _LOOKUP_BATCH_SIZE):
+                batch = table_hashes[start : start + _LOOKUP_BATCH_SIZE]
+                placeholders = ", ".join("?" for _ in batch)
+                rows = conn.execute(
+                    f"SELECT table_hash, payload FROM annotation_cache WHERE table_hash IN ({placeholders})", batch
+                ).fetchall()
+                payloads.update((row["table_hash"], row["payload"]) for row in rows)
+        return payloads
+
+    def save_payloads(self, entries: list[tuple[str, str, str]]) -> None:
+        """(해시, 테이블 이름, payload) 항목들을 저장하거나 갱신합니다."""
+        if not entries:
+            return
+        with local_storage.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO annotation_cache (table_hash, table_name, payload)
+                VALUES (?, ?, ?)
+                ON CONFLICT (table_hash) DO UPDATE SET
+                    table_name = excluded.table_name,
+                    payload = excluded.payload,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                entries,
+            )
+
+
+annotation_cache_repository = AnnotationCacheRepository()
@@ -0,0 +1,155 @@
+from datetime import datetime
+
+from app.core.enum.annotation_job import AnnotationJobPhaseEnum, AnnotationJobStatusEnum
+from app.db.local_storage import local_storage
+from app.schemas.annotation.response_model import AnnotationJobResponse
+
+_JOB_COLUMNS = """
+    id, db_profile_id, status, incremental, phase, progress, message, annotation_id, error_code, error_message,
+    started_at, finished_at, created_at, updated_at
+"""
+
+
+class AnnotationJobRepository:
+    """
+    백그라운드 어노테이션 생성 작업의 상태를 로컬 DB(`annotation_job`)에 저장합니다.
+    서버가 재시작되어도 작업 상태와 AI 응답(재개용)이 남아 있습니다.
+    """
+
+    def create_job(self, job_id: str, db_profile_id: str, incremental: bool = False) -> bool:
+        """
+        프로필에 대기/실행 중인 작업이 없을 때만 작업을 생성하고, 생성 여부를 반환합니다.
+        확인과 생성을 하나의 문장(쓰기 트랜잭션)으로 처리하여 동시에 요청되어도 작업이 하나만 생성됩니다.
+        """
+        with local_storage.transaction() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO annotation_job (id, db_profile_id, status, incremental)
+                SELECT ?, ?, ?, ?
+                WHERE NOT EXISTS (SELECT 1 FROM annotation_job WHERE db_profile_id = ? AND status IN (?, ?))
+                """,
+                (
+                    job_id,
+                    db_profile_id,
+                    AnnotationJobStatusEnum.pending.value,
+                    1 if incremental else 0,
+                    db_profile_id,
+                    AnnotationJobStatusEnum.pending.value,
+                    AnnotationJobStatusEnum.running.value,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def find_job(self, job_id: str) -> AnnotationJobResponse | None:
+        with local_storage.connection() as conn:
+            row = conn.execute(f"SELECT {_JOB_COLUMNS} FROM annotation_job WHERE id = ?", (job_id,)).fetchone()
+        return AnnotationJobResponse(**dict(row)) if row else None
+
+    def find_active_job(self, db_profile_id: str) -> AnnotationJobResponse | None:
+        """프로필에 대해 대기 중이거나 실행 중인 작업을 반환합니다."""
+        with local_storage.connection() as conn:
+            row = conn.execute(
+                f"""
+                SELECT {_JOB_COLUMNS} FROM annotation_job
+                WHERE db_profile_id = ? AND status IN (?, ?)
+                ORDER BY created_at DESC LIMIT 1
+                """,
+                (db_profile_id, AnnotationJobStatusEnum.pending.value, AnnotationJobStatusEnum.running.value),
+            ).fetchone()
+        return AnnotationJobResponse(**dict(row)) if row else None
+
+    def mark_pending(self, job_id: str) -> bool:
+        """
+        재개 가능한(실패/중단) 작업을 다시 대기 상태로 되돌리고, 변경 여부를 반환합니다. (저장된 AI 응답은 유지합니다)
+        같은 프로필에 대기/실행 중인 작업이 있으면 바꾸지 않습니다.
+        """
+        with local_storage.transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE annotation_job
+                SET status = ?, error_code = NULL, error_message = NULL, finished_at = NULL
+                WHERE id = ? AND status IN (?, ?)
+                  AND NOT EXISTS (
+                    SELECT 1 FROM annotation_job AS active
+                    WHERE active.db_profile_id = annotation_job.db_profile_id AND active.status IN (?, ?)
+                  )
+                """,
+                (
+                    AnnotationJobStatusEnum.pending.value,
+                    job_id,
+                    AnnotationJobStatusEnum.failed.value,
+                    AnnotationJobStatusEnum.interrupted.value,
+                    AnnotationJobStatusEnum.pending.value,
+                    AnnotationJobStatusEnum.running.value,
+                ),
+            )
+            return cursor.rowcount == 1
+
+    def mark_running(self, job_id: str) -> None:
+        with local_storage.transaction() as conn:
+            conn.execute(
+                "UPDATE annotation_job SET status = ?, started_at = ? WHERE id = ?",
+                (AnnotationJobStatusEnum.running.value, datetime.now(), job_id),
+            )
+
+    def update_phase(self, job_id: str, phase: AnnotationJobPhaseEnum, message: str) -> None:
+        with local_storage.transaction() as conn:
+            conn.execute(
+                "UPDATE annotation_job SET phase = ?, progress = ?, message = ? WHERE id = ?",
+                (phase.value, phase.start_progress, message, job_id),
+            )
+
+    def update_progress(self, job_id: str, progress: int, message: str) -> None:
+        with local_storage.transaction() as conn:
+            conn.execute(
+                "UPDATE annotation_job SET progress = ?, message = ? WHERE id = ?", (progress, message, job_id)
+            )
+
+    def find_ai_response(self, job_id: str) -> str | None:
+        """재개용으로 저장해 둔 AI 응답(JSON)을 반환합니다."""
+        with local_storage.connection() as conn:
+            row = conn.execute("SELECT ai_response FROM annotation_job WHERE id = ?", (job_id,)).fetchone()
+        return row["ai_response"] if row else None
+
+    def save_ai_response(self, job_id: str, ai_response: str) -> None:
+        with local_storage.transaction() as conn:
+            conn.execute("UPDATE annotation_job SET ai_response = ? WHERE id = ?", (ai_response, job_id))
+
+    def mark_succeeded(self, job_id: str, annotation_id: str, message: str) -> None:
+        """작업을 완료 처리합니다. 더 이상 필요 없는 AI 응답은 삭제합니다."""
+        with local_storage.transaction() as conn:
+            conn.execute(
+                """
+                UPDATE annotation_job
+                SET status = ?, progress = 100, message = ?, annotation_id = ?, ai_response = NULL, finished_at = ?
+                WHERE id = ?
+                """,
+                (AnnotationJobStatusEnum.succeeded.value, message, annotation_id, datetime.now(), job_id),
+            )
+
+    def mark_failed(self, job_id: str, error_code: str, error_message: str) -> None:
+        with local_storage.transaction() as conn:
+            conn.execute(
+                """
+                UPDATE annotation_job SET status = ?, error_code = ?, error_message = ?, finished_at = ?
+                WHERE id = ?
+                """,
+                (AnnotationJobStatusEnum.failed.value, error_code, error_message, datetime.now(), job_id),
+            )
+
+    def mark_unfinished_interrupted(self) -> int:
+        """대기/실행 중으로 남아 있는 작업(서버 종료로 중단된 작업)을 중단 상태로 바꾸고, 바뀐 작업 수를 반환합니다."""
+        with local_storage.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE annotation_job SET status = ?, finished_at = ? WHERE status IN (?, ?)",
+                (
+                    AnnotationJobStatusEnum.interrupted.value,
+                    datetime.now(),
+                    AnnotationJobStatusEnum.pending.value,
+                    AnnotationJobStatusEnum.running.value,
+                ),
+            )
+            return cursor.rowcount
+
+
+annotation_job_repository = AnnotationJobRepository()
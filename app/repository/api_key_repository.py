@@ -1,6 +1,4 @@
-import sqlite3
-
-from app.core.utils import get_db_path
+from app.db.local_storage import local_storage
 from app.schemas.api_key.db_model import APIKeyInDB
 
 
@@ -10,11 +8,7 @@ class APIKeyRepository:
         암호화된 API Key 정보를 받아 데이터베이스에 저장하고,
         저장된 객체를 반환합니다.
         """
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
-            conn.row_factory = sqlite3.Row
+        with local_storage.transaction() as conn:
             cursor = conn.cursor()
 
             cursor.execute(
@@ -24,64 +18,41 @@ class APIKeyRepository:
                 """,
                 (new_id, service_name, encrypted_key),
             )
-            conn.commit()
 
             cursor.execute("SELECT * FROM ai_credential WHERE id = ?", (new_id,))
             created_row = cursor.fetchone()
 
-            if not created_row:
-                return None
-
-            return APIKeyInDB.model_validate(dict(created_row))
+        if not created_row:
+            return None
 
-        finally:
-            if conn:
-                conn.close()
+        return APIKeyInDB.model_validate(dict(created_row))
 
     def get_all_api_keys(self) -> list[APIKeyInDB]:
         """데이터베이스에 저장된 모든 API Key를 조회합니다."""
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
-            conn.row_factory = sqlite3.Row
+        with local_storage.connection() as conn:
             cursor = conn.cursor()
 
             cursor.execute("SELECT * FROM ai_credential")
             rows = cursor.fetchall()
 
-            return [APIKeyInDB.model_validate(dict(row)) for row in rows]
-        finally:
-            if conn:
-                conn.close()
+        return [APIKeyInDB.model_validate(dict(row)) for row in rows]
 
     def get_api_key_by_service_name(self, service_name: str) -> APIKeyInDB | None:
         """서비스 이름으로 특정 API Key를 조회합니다."""
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
-            conn.row_factory = sqlite3.Row
+        with local_storage.connection() as conn:
             cursor = conn.cursor()
 
             cursor.execute("SELECT * FROM ai_credential WHERE service_name = ?", (service_name,))
             row = cursor.fetchone()
 
-            if not row:
-                return None
+        if not row:
+            return None
 
-            return APIKeyInDB.model_validate(dict(row))
-        finally:
-            if conn:
-                conn.close()
+        return APIKeyInDB.model_validate(dict(row))
 
     def update_api_key(self, service_name: str, encrypted_key: str) -> APIKeyInDB | None:
         """서비스 이름에 해당하는 API Key를 수정하고, 수정된 객체를 반환합니다."""
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
-            conn.row_factory = sqlite3.Row
+        with local_storage.transaction() as conn:
             cursor = conn.cursor()
 
             # 먼저 해당 서비스의 데이터가 존재하는지 확인
@@ -94,7 +65,6 @@ class APIKeyRepository:
                 "UPDATE ai_credential SET api_key = ?, updated_at = datetime('now', 'localtime') WHERE service_name = ?",
                 (encrypted_key, service_name),
             )
-            conn.commit()
 
             # rowcount가 0이면 업데이트된 행이 없음 (정상적인 경우 발생하기 어려움)
             if cursor.rowcount == 0:
@@ -103,17 +73,11 @@ class APIKeyRepository:
             cursor.execute("SELECT * FROM ai_credential WHERE service_name = ?", (service_name,))
             updated_row = cursor.fetchone()
 
-            return APIKeyInDB.model_validate(dict(updated_row))
-        finally:
-            if conn:
-                conn.close()
+        return APIKeyInDB.model_validate(dict(updated_row))
 
     def delete_api_key(self, service_name: str) -> bool:
         """서비스 이름에 해당하는 API Key를 삭제하고, 성공 여부를 반환합니다."""
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
+        with local_storage.transaction() as conn:
             cursor = conn.cursor()
 
             # 먼저 해당 서비스의 데이터가 존재하는지 확인
@@ -123,16 +87,12 @@ class APIKeyRepository:
 
             # 데이터 삭제
             cursor.execute("DELETE FROM ai_credential WHERE service_name = ?", (service_name,))
-            conn.commit()
 
             # rowcount가 0이면 삭제된 행이 없음 (정상적인 경우 발생하기 어려움)
             if cursor.rowcount == 0:
                 return False
 
             return cursor.rowcount > 0
-        finally:
-            if conn:
-                conn.close()
 
 
 api_key_repository = APIKeyRepository()
@@ -0,0 +1,698 @@
+import hashlib
+import logging
+import sqlite3
+from typing import Any
+
+from app.core.enum.db_driver import DBTypesEnum
+from app.core.exceptions import APIException
+from app.core.status import CommonCode
+from app.db.user_db_pool import open_connection, user_db_pool
+from app.schemas.user_db.result_model import ColumnInfo, ConstraintInfo, IndexInfo, TableInfo
+
+# 스키마 단위 일괄 조회를 지원하는 DB 종류
+BULK_SUPPORTED_DB_TYPES = {
+    DBTypesEnum.sqlite.name,
+    DBTypesEnum.postgresql.name,
+    DBTypesEnum.oracle.name,
+    DBTypesEnum.mysql.name,
+    DBTypesEnum.mariadb.name,
+}
+
+# DB 종류별 테이블 단위 DDL 지문 조회 쿼리 (첫 번째 컬럼: 테이블 이름, 나머지: 지문 재료)
+# - SQLite: 테이블과 인덱스의 CREATE 문
+# - PostgreSQL: 테이블/컬럼/제약조건/인덱스/코멘트 카탈로그 행의 xmin (DDL 로 행이 바뀔 때마다 갱신)
+# - MySQL/MariaDB: 테이블 생성 시각과 코멘트, 컬럼/인덱스/FK 정의의 체크섬
+# - Oracle: 테이블과 인덱스의 마지막 DDL 시각
+TABLE_FINGERPRINT_QUERIES = {
+    DBTypesEnum.sqlite.name: """
+        SELECT tbl_name, group_concat(type || ':' || name || ':' || coalesce(sql, ''), char(10))
+        FROM (SELECT tbl_name, type, name, sql FROM sqlite_master ORDER BY tbl_name, type, name)
+        WHERE tbl_name NOT LIKE 'sqlite_%'
+        GROUP BY tbl_name
+    """,
+    DBTypesEnum.postgresql.name: """
+        SELECT
+            c.relname,
+            c.xmin::text,
+            (SELECT string_agg(a.attname || ':' || a.xmin::text, ',' ORDER BY a.attnum)
+             FROM pg_catalog.pg_attribute a WHERE a.attrelid = c.oid AND a.attnum > 0),
+            (SELECT string_agg(con.conname || ':' || con.xmin::text, ',' ORDER BY con.conname)
+             FROM pg_catalog.pg_constraint con WHERE con.conrelid = c.oid),
+            (SELECT string_agg(ic.relname || ':' || ix.xmin::text || ':' || ic.xmin::text, ',' ORDER BY ic.relname)
+             FROM pg_catalog.pg_index ix JOIN pg_catalog.pg_class ic ON ic.oid = ix.indexrelid
+             WHERE ix.indrelid = c.oid),
+            (SELECT string_agg(d.objsubid::text || ':' || d.xmin::text, ',' ORDER BY d.objsubid)
+             FROM pg_catalog.pg_description d
+             WHERE d.objoid = c.oid AND d.classoid = 'pg_catalog.pg_class'::regclass)
+        FROM pg_catalog.pg_class c
+        JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = %s AND c.relkind IN ('r', 'p')
+    """,
+    DBTypesEnum.mysql.name: """
+        SELECT
+            t.table_name,
+            t.create_time,
+            CRC32(t.table_comment),
+            (SELECT COALESCE(SUM(CRC32(CONCAT_WS('.', c.ordinal_position, c.column_name, c.column_type,
+                    c.is_nullable, c.column_default, c.column_key, c.column_comment))), 0)
+             FROM information_schema.columns c
+             WHERE c.table_schema = t.table_schema AND c.table_name = t.table_name),
+            (SELECT COALESCE(SUM(CRC32(CONCAT_WS('.', s.index_name, s.seq_in_index, s.column_name, s.non_unique))), 0)
+             FROM information_schema.statistics s
+             WHERE s.table_schema = t.table_schema AND s.table_name = t.table_name),
+            (SELECT COALESCE(SUM(CRC32(CONCAT_WS('.', k.constraint_name, k.column_name,
+                    k.referenced_table_name, k.referenced_column_name))), 0)
+             FROM information_schema.key_column_usage k
+             WHERE k.table_schema = t.table_schema AND k.table_name = t.table_name)
+        FROM information_schema.tables t
+        WHERE t.table_schema = %s AND t.table_type = 'BASE TABLE'
+    """,
+    DBTypesEnum.oracle.name: """
+        SELECT
+            o.object_name,
+            TO_CHAR(o.last_ddl_time, 'YYYYMMDDHH24MISS'),
+            (SELECT COUNT(*) || '-' || TO_CHAR(MAX(io.last_ddl_time), 'YYYYMMDDHH24MISS')
+             FROM all_indexes i
+             JOIN all_objects io ON io.owner = i.owner AND io.object_name = i.index_name AND io.object_type = 'INDEX'
+             WHERE i.table_owner = o.owner AND i.table_name = o.object_name)
+        FROM all_objects o
+        WHERE o.owner = :owner AND o.object_type = 'TABLE'
+    """,
+}
+TABLE_FINGERPRINT_QUERIES[DBTypesEnum.mariadb.name] = TABLE_FINGERPRINT_QUERIES[DBTypesEnum.mysql.name]
+
+# 카탈로그 조회를 테이블 이름 조건으로 한정할 최대 테이블 수 (그보다 많으면 스키마 전체를 조회)
+MAX_FILTERED_TABLES = 500
+
+_ORACLE_CONSTRAINT_TYPES = {"P": "PRIMARY KEY", "R": "FOREIGN KEY", "U": "UNIQUE", "C": "CHECK"}
+
+
+class CatalogRepository:
+    """
+    스키마 전체의 컬럼/제약조건/인덱스를 한 번에 조회하는 카탈로그 레포지토리입니다.
+    - 테이블마다 커넥션을 열고 쿼리를 보내는 대신, 커넥션 하나로 종류별 쿼리를 한 번씩만 실행합니다.
+    - 조회 결과는 메모리에서 테이블별로 묶어 `TableInfo` 목록으로 반환합니다.
+    """
+
+    def supports(self, db_type: str) -> bool:
+        return db_type.lower() in BULK_SUPPORTED_DB_TYPES
+
+    def find_schema_tables(
+        self, driver_module: Any, db_type: str, schema_name: str, table_names: list[str], **kwargs: Any
+    ) -> list[TableInfo]:
+        """
+        스키마에 속한 테이블들의 상세 정보를 일괄 조회합니다.
+        - 반환 순서는 `table_names` 순서를 따릅니다.
+        - 컬럼 조회 실패 시 빈 컬럼 목록을, 제약조건/인덱스 조회 실패 시 APIException을 발생시킵니다.
+        - 대상 테이블이 많지 않으면 카탈로그 조회 자체를 해당 테이블로 한정합니다. (증분 재조회)
+        """
+        db_type = db_type.lower()
+        only = table_names if len(table_names) <= MAX_FILTERED_TABLES else None
+        connection = None
+        try:
+            connection = user_db_pool.acquire(driver_module, open_connection, **kwargs)
+            cursor = connection.cursor()
+
+            try:
+                columns = self._find_columns(cursor, db_type, schema_name, only)
+            except Exception as e:
+                logging.error(f"Exception in bulk column lookup for schema '{schema_name}': {e}", exc_info=True)
+                columns = {}
+                # PostgreSQL 은 실패한 문장 이후 트랜잭션이 중단(aborted) 상태로 남아 이어지는 조회가 모두 실패하므로,
+                # 제약조건/인덱스 조회 전에 롤백합니다.
+                cursor = self._rollback(connection, schema_name) or cursor
+
+            try:
+                constraints = self._find_constraints(cursor, db_type, schema_name, only)
+            except (sqlite3.Error, driver_module.DatabaseError) as e:
+                logging.error(f"Error finding constraints for schema '{schema_name}': {e}", exc_info=True)
+                raise APIException(CommonCode.FAIL_FIND_CONSTRAINTS) from e
+
+            try:
+                indexes = self._find_indexes(cursor, db_type, schema_name, only)
+            except (sqlite3.Error, driver_module.DatabaseError) as e:
+                logging.error(f"Error finding indexes for schema '{schema_name}': {e}", exc_info=True)
+                raise APIException(CommonCode.FAIL_FIND_INDEXES) from e
+        finally:
+            if connection:
+                user_db_pool.release(connection)
+
+        key = str.upper if db_type == DBTypesEnum.oracle.name else str
+        return [
+            TableInfo(
+                name=table_name,
+                columns=columns.get(key(table_name), []),
+                constraints=constraints.get(key(table_name), []),
+                indexes=indexes.get(key(table_name), []),
+                comment=None,
+            )
+            for table_name in table_names
+        ]
+
+    def _rollback(self, connection: Any, schema_name: str) -> Any | None:
+        """실패한 조회 이후 트랜잭션을 롤백하고 새 커서를 반환합니다. 롤백에 실패하면 None을 반환합니다."""
+        try:
+            connection.rollback()
+            return connection.cursor()
+        except Exception as e:
+            logging.warning(f"Failed to roll back after bulk column lookup for schema '{schema_name}': {e}")
+            return None
+
+    def find_table_fingerprints(
+        self, driver_module: Any, db_type: str, schema_name: str, **kwargs: Any
+    ) -> dict[str, str] | None:
+        """
+        스키마에 속한 테이블별 DDL 지문을 조회합니다. (테이블 이름 -> 지문)
+        - 컬럼/제약조건/인덱스/코멘트 정의가 바뀐 테이블만 지문이 달라집니다.
+        - 지원하지 않는 DB이거나 조회에 실패하면 None을 반환합니다. (전체 재조회)
+        """
+        db_type = db_type.lower()
+        query = TABLE_FINGERPRINT_QUERIES.get(db_type)
+        if not query:
+            return None
+
+        connection = None
+        try:
+            connection = user_db_pool.acquire(driver_module, open_connection, **kwargs)
+            cursor = connection.cursor()
+            if db_type == DBTypesEnum.sqlite.name:
+                cursor.execute(query)
+            elif db_type == DBTypesEnum.oracle.name:
+                cursor.execute(query, {"owner": schema_name.upper()})
+            else:
+                cursor.execute(query, (schema_name,))
+            return {
+                table_name: hashlib.sha1("|".join(str(value) for value in values).encode()).hexdigest()
+                for table_name, *values in cursor.fetchall()
+            }
+        except Exception as e:
+            logging.warning(f"Failed to read table fingerprints for schema '{schema_name}': {e}")
+            return None
+        finally:
+            if connection:
+                user_db_pool.release(connection)
+
+    # ─────────────────────────────
+    # 컬럼 일괄 조회
+    # ─────────────────────────────
+    def _find_columns(
+        self, cursor: Any, db_type: str, schema_name: str, only: list[str] | None = None
+    ) -> dict[str, list[ColumnInfo]]:
+        if db_type == DBTypesEnum.sqlite.name:
+            table_filter, params = _table_filter(db_type, "m.name", only)
+            cursor.execute(
+                f"""
+                SELECT m.name, p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk
+                FROM sqlite_master m
+                JOIN pragma_table_info(m.name) p
+                WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'{table_filter}
+                ORDER BY m.name, p.cid
+                """,
+                params,
+            )
+            return _group(
+                (
+                    row[0],
+                    ColumnInfo(
+                        name=row[2],
+                        type=row[3],
+                        nullable=(row[4] == 0),
+                        default=row[5],
+                        comment=None,
+                        is_pk=(row[6] >= 1),
+                        ordinal_position=row[1] + 1,
+                    ),
+                )
+                for row in cursor.fetchall()
+            )
+
+        if db_type == DBTypesEnum.postgresql.name:
+            table_filter, params = _table_filter(db_type, "c.table_name", only)
+            cursor.execute(
+                f"""
+                SELECT
+                    c.table_name,
+                    c.column_name,
+                    c.udt_name,
+                    c.is_nullable,
+                    c.column_default,
+                    c.ordinal_position,
+                    pg_catalog.col_description(cls.oid, c.ordinal_position::int) AS comment,
+                    pk.column_name IS NOT NULL AS is_pk
+                FROM information_schema.columns c
+                JOIN pg_catalog.pg_namespace n ON n.nspname = c.table_schema
+                JOIN pg_catalog.pg_class cls ON cls.relnamespace = n.oid AND cls.relname = c.table_name
+                LEFT JOIN (
+                    SELECT kcu.table_name, kcu.column_name
+                    FROM information_schema.table_constraints tc
+                    JOIN information_schema.key_column_usage kcu
+                        ON tc.constraint_name = kcu.constraint_name
+                        AND tc.table_schema = kcu.table_schema
+                        AND tc.table_name = kcu.table_name
+                    WHERE tc.table_schema = %s AND tc.constraint_type = 'PRIMARY KEY'
+                ) pk ON pk.table_name = c.table_name AND pk.column_name = c.column_name
+                WHERE c.table_schema = %s{table_filter}
+                ORDER BY c.table_name, c.ordinal_position
+                """,
+                (schema_name, schema_name, *params),
+            )
+            return _group(
+                (
+                    row[0],
+                    ColumnInfo(
+                        name=row[1],
+                        type=row[2],
+                        nullable=(row[3] == "YES"),
+                        default=row[4],
+                        ordinal_position=row[5],
+                        comment=row[6],
+                        is_pk=row[7],
+                    ),
+                )
+                for row in cursor.fetchall()
+            )
+
+        if db_type == DBTypesEnum.oracle.name:
+            table_filter, params = _table_filter(db_type, "c.table_name", only)
+            cursor.execute(
+                f"""
+                SELECT
+                    c.table_name,
+                    c.column_name,
+                    c.data_type,
+                    c.nullable,
+                    c.data_default,
+                    cc.comments,
+                    CASE WHEN cons.column_name IS NOT NULL THEN 1 ELSE 0 END AS is_pk,
+                    c.data_length,
+                    c.data_precision,
+                    c.data_scale,
+                    c.column_id
+                FROM all_tab_columns c
+                LEFT JOIN all_col_comments cc
+                    ON c.owner = cc.owner AND c.table_name = cc.table_name AND c.column_name = cc.column_name
+                LEFT JOIN (
+                    SELECT acc.owner, acc.table_name, acc.column_name
+                    FROM all_constraints ac
+                    JOIN all_cons_columns acc ON ac.owner = acc.owner AND ac.constraint_name = acc.constraint_name
+                    WHERE ac.owner = :owner AND ac.constraint_type = 'P'
+                ) cons ON c.owner = cons.owner AND c.table_name = cons.table_name AND c.column_name = cons.column_name
+                WHERE c.owner = :owner{table_filter}
+                ORDER BY c.table_name, c.column_id
+                """,
+                {"owner": schema_name.upper(), **params},
+            )
+            return _group(
+                (
+                    row[0],
+                    ColumnInfo(
+                        name=row[1],
+                        type=format_oracle_type(row[2], row[7], row[8], row[9]),
+                        nullable=(row[3] == "Y"),
+                        default=str(row[4]).strip() if row[4] is not None else None,
+                        comment=row[5],
+                        is_pk=bool(row[6]),
+                        ordinal_position=row[10],
+                    ),
+                )
+                for row in cursor.fetchall()
+            )
+
+        # MySQL / MariaDB
+        table_filter, params = _table_filter(db_type, "table_name", only)
+        cursor.execute(
+            f"""
+            SELECT
+                table_name, column_name, column_type, is_nullable,
+                column_default, ordinal_position, column_comment, column_key
+            FROM information_schema.columns
+            WHERE table_schema = %s{table_filter}
+            ORDER BY table_name, ordinal_position
+            """,
+            (schema_name, *params),
+        )
+        return _group(
+            (
+                row[0],
+                ColumnInfo(
+                    name=row[1],
+                    type=row[2],
+                    nullable=(row[3] == "YES"),
+                    default=row[4],
+                    ordinal_position=row[5],
+                    comment=row[6] or None,
+                    is_pk=(row[7] == "PRI"),
+                ),
+            )
+            for row in cursor.fetchall()
+        )
+
+    # ─────────────────────────────
+    # 제약조건 일괄 조회
+    # ─────────────────────────────
+    def _find_constraints(
+        self, cursor: Any, db_type: str, schema_name: str, only: list[str] | None = None
+    ) -> dict[str, list[ConstraintInfo]]:
+        if db_type == DBTypesEnum.sqlite.name:
+            return self._find_constraints_for_sqlite(cursor, only)
+        if db_type == DBTypesEnum.oracle.name:
+            return self._find_constraints_for_oracle(cursor, schema_name, only)
+        table_filter, params = _table_filter(db_type, "tc.table_name", only)
+        if db_type == DBTypesEnum.postgresql.name:
+            cursor.execute(
+                f"""
+                SELECT
+                    tc.table_name,
+                    tc.constraint_name,
+                    tc.constraint_type,
+                    kcu.column_name,
+                    rc.update_rule,
+                    rc.delete_rule,
+                    ccu.table_name AS foreign_table_name,
+                    ccu.column_name AS foreign_column_name,
+                    chk.check_clause
+                FROM information_schema.table_constraints tc
+                LEFT JOIN information_schema.key_column_usage kcu
+                    ON tc.constraint_name = kcu.constraint_name
+                    AND tc.table_schema = kcu.table_schema
+                    AND tc.table_name = kcu.table_name
+                LEFT JOIN information_schema.referential_constraints rc
+                    ON tc.constraint_name = rc.constraint_name AND tc.table_schema = rc.constraint_schema
+                LEFT JOIN information_schema.constraint_column_usage ccu
+                    ON rc.unique_constraint_name = ccu.constraint_name
+                    AND rc.unique_constraint_schema = ccu.table_schema
+                LEFT JOIN information_schema.check_constraints chk
+                    ON tc.constraint_name = chk.constraint_name AND tc.table_schema = chk.constraint_schema
+                WHERE tc.table_schema = %s{table_filter}
+                ORDER BY tc.table_name, tc.constraint_name, kcu.ordinal_position
+                """,
+                (schema_name, *params),
+            )
+            rows = []
+            for (
+                table_name,
+                name,
+                const_type,
+                column,
+                on_update,
+                on_delete,
+                ref_table,
+                ref_column,
+                check,
+            ) in cursor.fetchall():
+                # NOT NULL 은 컬럼 정보의 nullable 로 표현되므로 제외합니다.
+                if const_type == "CHECK" and check and "IS NOT NULL" in check.upper():
+                    continue
+                rows.append((table_name, name, const_type, column, ref_table, ref_column, check, on_update, on_delete))
+            return _merge_constraints(rows)
+
+        # MySQL / MariaDB
+        cursor.execute(
+            f"""
+            SELECT
+                tc.table_name,
+                tc.constraint_name,
+                tc.constraint_type,
+                kcu.column_name,
+                kcu.referenced_table_name,
+                kcu.referenced_column_name,
+                rc.update_rule,
+                rc.delete_rule
+            FROM information_schema.table_constraints tc
+            LEFT JOIN information_schema.key_column_usage kcu
+                ON tc.constraint_schema = kcu.constraint_schema
+                AND tc.table_name = kcu.table_name
+                AND tc.constraint_name = kcu.constraint_name
+            LEFT JOIN information_schema.referential_constraints rc
+                ON tc.constraint_schema = rc.constraint_schema
+                AND tc.table_name = rc.table_name
+                AND tc.constraint_name = rc.constraint_name
+            WHERE tc.table_schema = %s{table_filter}
+            ORDER BY tc.table_name, tc.constraint_name, kcu.ordinal_position
+            """,
+            (schema_name, *params),
+        )
+        return _merge_constraints(
+            (table_name, name, const_type, column, ref_table, ref_column, None, on_update, on_delete)
+            for table_name, name, const_type, column, ref_table, ref_column, on_update, on_delete in cursor.fetchall()
+        )
+
+    def _find_constraints_for_sqlite(self, cursor: Any, only: list[str] | None) -> dict[str, list[ConstraintInfo]]:
+        table_filter, params = _table_filter(DBTypesEnum.sqlite.name, "m.name", only)
+        cursor.execute(
+            f"""
+            SELECT m.name, p.id, p."table", p."from", p."to"
+            FROM sqlite_master m
+            JOIN pragma_foreign_key_list(m.name) p
+            WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'{table_filter}
+            ORDER BY m.name, p.id, p.seq
+            """,
+            params,
+        )
+        fk_groups: dict[tuple[str, int], dict[str, Any]] = {}
+        for table_name, fk_id, ref_table, column, ref_column in cursor.fetchall():
+            group = fk_groups.setdefault(
+                (table_name, fk_id), {"referenced_table": ref_table, "columns": [], "referenced_columns": []}
+            )
+            group["columns"].append(column)
+            group["referenced_columns"].append(ref_column)
+
+        return _group(
+            (
+                table_name,
+                ConstraintInfo(
+                    name=f"fk_{table_name}_{'_'.join(group['columns'])}",
+                    type="FOREIGN KEY",
+                    columns=group["columns"],
+                    referenced_table=group["referenced_table"],
+                    referenced_columns=group["referenced_columns"],
+                ),
+            )
+            for (table_name, _), group in fk_groups.items()
+        )
+
+    def _find_constraints_for_oracle(
+        self, cursor: Any, schema_name: str, only: list[str] | None
+    ) -> dict[str, list[ConstraintInfo]]:
+        table_filter, params = _table_filter(DBTypesEnum.oracle.name, "ac.table_name", only)
+        cursor.execute(
+            f"""
+            SELECT
+                ac.table_name,
+                ac.constraint_name,
+                ac.constraint_type,
+                acc.column_name,
+                ac.search_condition,
+                r_ac.table_name AS referenced_table,
+                r_acc.column_name AS referenced_column,
+                ac.delete_rule
+            FROM all_constraints ac
+            JOIN all_cons_columns acc
+                ON ac.owner = acc.owner AND ac.constraint_name = acc.constraint_name AND ac.table_name = acc.table_name
+            LEFT JOIN all_constraints r_ac
+                ON ac.r_owner = r_ac.owner AND ac.r_constraint_name = r_ac.constraint_name
+            LEFT JOIN all_cons_columns r_acc
+                ON ac.r_owner = r_acc.owner
+                AND ac.r_constraint_name = r_acc.constraint_name
+                AND acc.position = r_acc.position
+            WHERE ac.owner = :owner{table_filter}
+            ORDER BY ac.table_name, ac.constraint_name, acc.position
+            """,
+            {"owner": schema_name.upper(), **params},
+        )
+        rows = []
+        for table_name, name, type_char, column, check, ref_table, ref_column, on_delete in cursor.fetchall():
+            const_type = _ORACLE_CONSTRAINT_TYPES.get(type_char)
+            if not const_type:
+                continue
+            if const_type == "CHECK":
+                check_str = (str(check) if check else "").upper()
+                # "COL" IS NOT NULL 또는 COL IS NOT NULL 형식 모두 처리
+                if f'"{column.upper()}" IS NOT NULL' in check_str or f"{column.upper()} IS NOT NULL" in check_str:
+                    continue
+            rows.append(
+                (
+                    table_name,
+                    name,
+                    const_type,
+                    column,
+                    ref_table,
+                    ref_column,
+                    check if const_type == "CHECK" else None,
+                    None,
+                    on_delete if const_type == "FOREIGN KEY" else None,
+                )
+            )
+        return _merge_constraints(rows)
+
+    # ─────────────────────────────
+    # 인덱스 일괄 조회
+    # ─────────────────────────────
+    def _find_indexes(
+        self, cursor: Any, db_type: str, schema_name: str, only: list[str] | None = None
+    ) -> dict[str, list[IndexInfo]]:
+        if db_type == DBTypesEnum.sqlite.name:
+            # "sqlite_autoindex_"로 시작하는 인덱스는 PK/UNIQUE 에 의해 자동 생성된 것이므로 제외
+            table_filter, params = _table_filter(db_type, "m.name", only)
+            cursor.execute(
+                f"""
+                SELECT m.name, il.name, il."unique", ii.name
+                FROM sqlite_master m
+                JOIN pragma_index_list(m.name) il
+                JOIN pragma_index_info(il.name) ii
+                WHERE m.type = 'table'
+                  AND m.name NOT LIKE 'sqlite_%'
+                  AND il.name NOT LIKE 'sqlite_autoindex_%'{table_filter}
+                ORDER BY m.name, il.seq, ii.seqno
+                """,
+                params,
+            )
+            rows = [(table, index, unique == 1, column) for table, index, unique, column in cursor.fetchall()]
+            return _merge_indexes(rows)
+
+        if db_type == DBTypesEnum.postgresql.name:
+            table_filter, params = _table_filter(db_type, "t.relname", only)
+            cursor.execute(
+                f"""
+                SELECT t.relname, i.relname, ix.indisunique, a.attname
+                FROM pg_class t
+                JOIN pg_namespace n ON n.oid = t.relnamespace
+                JOIN pg_index ix ON t.oid = ix.indrelid
+                JOIN pg_class i ON i.oid = ix.indexrelid
+                JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(ix.indkey)
+                WHERE t.relkind = 'r' AND n.nspname = %s AND NOT ix.indisprimary{table_filter}
+                ORDER BY t.relname, i.relname, a.attnum
+                """,
+                (schema_name, *params),
+            )
+            return _merge_indexes(cursor.fetchall())
+
+        if db_type == DBTypesEnum.oracle.name:
+            table_filter, params = _table_filter(db_type, "i.table_name", only)
+            cursor.execute(
+                f"""
+                SELECT i.table_name, i.index_name, i.uniqueness, ic.column_name
+                FROM all_indexes i
+                JOIN all_ind_columns ic ON i.owner = ic.index_owner AND i.index_name = ic.index_name
+                LEFT JOIN all_constraints ac
+                    ON i.owner = ac.owner AND i.index_name = ac.constraint_name AND ac.constraint_type = 'P'
+                WHERE i.owner = :owner AND ac.constraint_name IS NULL{table_filter}
+                ORDER BY i.table_name, i.index_name, ic.column_position
+                """,
+                {"owner": schema_name.upper(), **params},
+            )
+            rows = [(table, index, uniqueness == "UNIQUE", column) for table, index, uniqueness, column in cursor]
+            return _merge_indexes(rows)
+
+        # MySQL / MariaDB
+        table_filter, params = _table_filter(db_type, "table_name", only)
+        cursor.execute(
+            f"""
+            SELECT table_name, index_name, non_unique = 0, column_name
+            FROM information_schema.statistics
+            WHERE table_schema = %s AND index_name <> 'PRIMARY'{table_filter}
+            ORDER BY table_name, index_name, seq_in_index
+            """,
+            (schema_name, *params),
+        )
+        return _merge_indexes(cursor.fetchall())
+
+
+def format_oracle_type(data_type: str, length: Any, precision: Any, scale: Any) -> str:
+    """Oracle 컬럼 타입을 길이/정밀도를 포함한 표기로 변환합니다."""
+    if data_type in ["VARCHAR2", "NVARCHAR2", "CHAR", "RAW"]:
+        return f"{data_type}({length})"
+    if data_type == "NUMBER":
+        if precision is not None and scale is not None:
+            if precision == 38 and scale == 0:
+                return "NUMBER"
+            return f"NUMBER({precision}, {scale})"
+        if precision is not None:
+            return f"NUMBER({precision})"
+        return "NUMBER"
+    return data_type
+
+
+def _table_filter(db_type: str, column: str, table_names: list[str] | None) -> tuple[str, Any]:
+    """
+    `column IN (...)` 조건절과 바인딩 값을 만듭니다. 대상이 없으면 빈 조건을 반환합니다.
+    Oracle은 이름 바인딩(dict), 그 외 DB는 위치 바인딩(tuple)을 사용합니다.
+    """
+    if db_type == DBTypesEnum.oracle.name:
+        if not table_names:
+            return "", {}
+        binds = {f"table_{i}": name.upper() for i, name in enumerate(table_names)}
+        return f" AND {column} IN ({', '.join(f':{key}' for key in binds)})", binds
+    if not table_names:
+        return "", ()
+    if db_type == DBTypesEnum.postgresql.name:
+        return f" AND {column} = ANY(%s)", (list(table_names),)
+    placeholder = "?" if db_type == DBTypesEnum.sqlite.name else "%s"
+    return f" AND {column} IN ({', '.join([placeholder] * len(table_names))})", tuple(table_names)
+
+
+def _group(pairs) -> dict[str, list]:
+    grouped: dict[str, list] = {}
+    for table_name, item in pairs:
+        grouped.setdefault(table_name, []).append(item)
+    return grouped
+
+
+def _merge_constraints(rows) -> dict[str, list[ConstraintInfo]]:
+    """
+    (테이블, 제약조건명, 타입, 컬럼, 참조 테이블, 참조 컬럼, CHECK 식, ON UPDATE, ON DELETE) 행들을
+    제약조건 단위로 묶습니다. 여러 컬럼으로 구성된 제약조건은 행이 여러 개로 나뉘어 조회됩니다.
+    """
+    constraint_map: dict[tuple[str, str], dict[str, Any]] = {}
+    for table_name, name, const_type, column, ref_table, ref_column, check, on_update, on_delete in rows:
+        data = constraint_map.setdefault(
+            (table_name, name),
+            {
+                "type": const_type,
+                "columns": [],
+                "referenced_table": ref_table,
+                "referenced_columns": [],
+                "check_expression": check,
+                "on_update": on_update,
+                "on_delete": on_delete,
+            },
+        )
+        if column and column not in data["columns"]:
+            data["columns"].append(column)
+        if ref_column and ref_column not in data["referenced_columns"]:
+            data["referenced_columns"].append(ref_column)
+
+    return _group(
+        (
+            table_name,
+            ConstraintInfo(
+                name=name,
+                type=data["type"],
+                columns=data["columns"],
+                referenced_table=data["referenced_table"],
+                referenced_columns=data["referenced_columns"] or None,
+                check_expression=data["check_expression"],
+                on_update=data["on_update"],
+                on_delete=data["on_delete"],
+            ),
+        )
+        for (table_name, name), data in constraint_map.items()
+    )
+
+
+def _merge_indexes(rows) -> dict[str, list[IndexInfo]]:
+    """(테이블, 인덱스명, 고유 여부, 컬럼) 행들을 인덱스 단위로 묶습니다. 표현식 인덱스의 컬럼은 제외합니다."""
+    index_map: dict[tuple[str, str], dict[str, Any]] = {}
+    for table_name, index_name, is_unique, column in rows:
+        data = index_map.setdefault((table_name, index_name), {"columns": [], "is_unique": bool(is_unique)})
+        if column is not None:
+            data["columns"].append(column)
+
+    return _group(
+        (table_name, IndexInfo(name=index_name, columns=data["columns"], is_unique=data["is_unique"]))
+        for (table_name, index_name), data in index_map.items()
+        if data["columns"]
+    )
+
+
+catalog_repository = CatalogRepository()
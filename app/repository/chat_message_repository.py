@@ -1,9 +1,7 @@
-import sqlite3
-
 from app.core.enum.sender import SenderEnum
 from app.core.exceptions import APIException
 from app.core.status import CommonCode
-from app.core.utils import get_db_path
+from app.db.local_storage import local_storage
 from app.schemas.chat_message.db_model import ChatMessageInDB
 from app.schemas.chat_message.response_model import ALLChatMessagesResponseByTab, ChatMessagesResponse
 
@@ -12,11 +10,7 @@ class ChatMessageRepository:
     def create_chat_message(self, new_id: str, sender: str, chat_tab_id: str, message: str) -> ChatMessageInDB:
         """새로운 채팅을 데이터베이스에 저장하고, 저장된 객체를 반환합니다."""
 
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
-            conn.row_factory = sqlite3.Row
+        with local_storage.transaction() as conn:
             cursor = conn.cursor()
 
             cursor.execute(
@@ -31,27 +25,18 @@ class ChatMessageRepository:
                     message,
                 ),
             )
-            conn.commit()
 
             cursor.execute("SELECT * FROM chat_message WHERE id = ?", (new_id,))
             created_row = cursor.fetchone()
 
-            if not created_row:
-                return None
-
-            return ChatMessageInDB.model_validate(dict(created_row))
+        if not created_row:
+            return None
 
-        finally:
-            if conn:
-                conn.close()
+        return ChatMessageInDB.model_validate(dict(created_row))
 
     def get_chat_tab_and_messages_by_id(self, tabId: str) -> ALLChatMessagesResponseByTab:
         """주어진 chat_tab_id에 해당하는 모든 메시지를 가져옵니다."""
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
-            conn.row_factory = sqlite3.Row
+        with local_storage.connection() as conn:
             cursor = conn.cursor()
 
             # 1. 채팅 탭 정보 조회
@@ -97,19 +82,10 @@ class ChatMessageRepository:
                 updated_at=tab_row["updated_at"],
                 messages=messages,
             )
-        except sqlite3.Error as e:
-            raise e
-        finally:
-            if conn:
-                conn.close()
 
     def get_chat_tab_by_id(self, tabId: str) -> None:
         """데이터베이스에 저장된 특정 Chat Tab ID를 조회합니다."""
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
-            conn.row_factory = sqlite3.Row
+        with local_storage.connection() as conn:
             cursor = conn.cursor()
 
             cursor.execute(
@@ -118,9 +94,6 @@ class ChatMessageRepository:
             )
 
             return None
-        finally:
-            if conn:
-                conn.close()
 
 
 chat_message_repository = ChatMessageRepository()
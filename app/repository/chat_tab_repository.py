@@ -1,6 +1,4 @@
-import sqlite3
-
-from app.core.utils import get_db_path
+from app.db.local_storage import local_storage
 from app.schemas.chat_tab.db_model import ChatTabInDB
 
 
@@ -9,11 +7,7 @@ class ChatTabRepository:
         """
         새로운 채팅 탭 이름을 데이터베이스에 저장하고, 저장된 객체를 반환합니다.
         """
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
-            conn.row_factory = sqlite3.Row
+        with local_storage.transaction() as conn:
             cursor = conn.cursor()
 
             cursor.execute(
@@ -26,27 +20,18 @@ class ChatTabRepository:
                     name,
                 ),
             )
-            conn.commit()
 
             cursor.execute("SELECT * FROM chat_tab WHERE id = ?", (new_id,))
             created_row = cursor.fetchone()
 
-            if not created_row:
-                return None
-
-            return ChatTabInDB.model_validate(dict(created_row))
+        if not created_row:
+            return None
 
-        finally:
-            if conn:
-                conn.close()
+        return ChatTabInDB.model_validate(dict(created_row))
 
     def updated_chat_tab(self, id: str, new_name: str | None) -> ChatTabInDB | None:
         """채팅 탭ID에 해당하는 ChatName를 수정하고, 수정된 객체를 반환합니다."""
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
-            conn.row_factory = sqlite3.Row
+        with local_storage.transaction() as conn:
             cursor = conn.cursor()
 
             # 먼저 해당 서비스의 데이터가 존재하는지 확인
@@ -59,7 +44,6 @@ class ChatTabRepository:
                 "UPDATE chat_tab SET name = ?, updated_at = datetime('now') WHERE id = ?",
                 (new_name, id),
             )
-            conn.commit()
 
             # rowcount가 0이면 업데이트된 행이 없음 (정상적인 경우 발생하기 어려움)
             if cursor.rowcount == 0:
@@ -68,31 +52,18 @@ class ChatTabRepository:
             cursor.execute("SELECT * FROM chat_tab WHERE id = ?", (id,))
             updated_row = cursor.fetchone()
 
-            return ChatTabInDB.model_validate(dict(updated_row))
-        finally:
-            if conn:
-                conn.close()
+        return ChatTabInDB.model_validate(dict(updated_row))
 
     def update_tab_timestamp(self, id: str) -> bool:
         """지정된 ID의 채팅 탭의 updated_at 타임스탬프를 현재 시간으로 업데이트합니다."""
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
+        with local_storage.transaction() as conn:
             cursor = conn.cursor()
             cursor.execute("UPDATE chat_tab SET updated_at = datetime('now') WHERE id = ?", (id,))
-            conn.commit()
             return cursor.rowcount > 0
-        finally:
-            if conn:
-                conn.close()
 
     def delete_chat_tab(self, id: str) -> bool:
         """채팅 탭ID에 해당하는 ChatTab을 삭제하고, 성공 여부를 반환합니다."""
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
+        with local_storage.transaction() as conn:
             cursor = conn.cursor()
 
             # 먼저 해당 서비스의 데이터가 존재하는지 확인
@@ -102,33 +73,22 @@ class ChatTabRepository:
 
             # 데이터 삭제
             cursor.execute("DELETE FROM chat_tab WHERE id = ?", (id,))
-            conn.commit()
 
             # rowcount가 0이면 삭제된 행이 없음 (정상적인 경우 발생하기 어려움)
             if cursor.rowcount == 0:
                 return False
 
             return cursor.rowcount > 0
-        finally:
-            if conn:
-                conn.close()
 
     def get_all_chat_tab(self) -> list[ChatTabInDB]:
         """데이터베이스에 저장된 모든 Chat Tab ID를 조회합니다."""
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
-            conn.row_factory = sqlite3.Row
+        with local_storage.connection() as conn:
             cursor = conn.cursor()
 
             cursor.execute("SELECT * FROM chat_tab")
             rows = cursor.fetchall()
 
-            return [ChatTabInDB.model_validate(dict(row)) for row in rows]
-        finally:
-            if conn:
-                conn.close()
+        return [ChatTabInDB.model_validate(dict(row)) for row in rows]
 
 
 chat_tab_repository = ChatTabRepository()
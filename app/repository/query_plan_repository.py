@@ -0,0 +1,281 @@
+import json
+import logging
+import uuid
+import xml.etree.ElementTree as ElementTree
+from collections.abc import Callable
+from contextlib import nullcontext
+from typing import Any
+
+from app.core.enum.db_driver import DBTypesEnum
+from app.core.exceptions import APIException
+from app.core.status import CommonCode
+from app.db.query_handles import QueryHandle, query_handles
+from app.db.user_db_pool import open_connection, user_db_pool
+from app.schemas.query.result_model import PlanNode, QueryPlan, QueryPlanResult
+
+# MySQL/MariaDB JSON 계획에서 하위 연산이 아닌 정보 항목
+MYSQL_INFO_KEYS = {"cost_info", "used_columns", "possible_keys", "used_key_parts", "ref"}
+SQLSERVER_SHOWPLAN_NS = "{http://schemas.microsoft.com/sqlserver/2004/07/showplan}"
+
+
+class QueryPlanRepository:
+    """
+    쿼리를 실행하지 않고 DB의 실행 계획만 조회합니다.
+    DB마다 다른 계획 형식을 `PlanNode` 트리로 정규화하며, 원본 계획도 함께 반환합니다.
+    - PostgreSQL: EXPLAIN (FORMAT JSON)
+    - MySQL/MariaDB: EXPLAIN FORMAT=JSON
+    - Oracle: EXPLAIN PLAN + PLAN_TABLE (원본은 DBMS_XPLAN.DISPLAY 출력)
+    - SQLite: EXPLAIN QUERY PLAN (예상 행 수/비용 없음)
+    - SQL Server: SET SHOWPLAN_XML
+    """
+
+    def explain(
+        self,
+        query: str,
+        driver_module: Any,
+        db_type: str,
+        handle: QueryHandle | None = None,
+        **kwargs: Any,
+    ) -> QueryPlanResult:
+        """
+        실행 계획을 조회합니다. 쿼리가 유효하지 않으면 오류 메시지와 함께 실패 결과를 반환합니다.
+        실행 계획을 지원하지 않는 DB면 INVALID_DB_DRIVER 예외를 발생시킵니다.
+        """
+        db_type = db_type.lower()
+        explainer = self._explainer(db_type)
+        if explainer is None:
+            raise APIException(CommonCode.INVALID_DB_DRIVER)
+        connection = None
+        try:
+            connection = user_db_pool.acquire(driver_module, open_connection, **kwargs)
+            cursor = connection.cursor()
+            tracking = (
+                query_handles.running(handle, driver_module, connection, cursor, kwargs) if handle else nullcontext()
+            )
+            with tracking:
+                plan = self._explain(cursor, db_type, explainer, query)
+            return QueryPlanResult(is_successful=True, code=CommonCode.SUCCESS_EXPLAIN, data=plan)
+        except (AttributeError, driver_module.OperationalError, driver_module.DatabaseError) as e:
+            code = handle.failure_code(CommonCode.FAIL_CONNECT_DB) if handle else CommonCode.FAIL_CONNECT_DB
+            return QueryPlanResult(is_successful=False, code=code, data=str(e))
+        except Exception as e:
+            logging.error(f"Failed to explain query for {db_type}: {e}")
+            code = handle.failure_code(CommonCode.FAIL) if handle else CommonCode.FAIL
+            return QueryPlanResult(is_successful=False, code=code, data=str(e))
+        finally:
+            if connection:
+                user_db_pool.release(connection)
+
+    def _explainer(self, db_type: str) -> Callable[[Any, str], tuple[PlanNode | None, Any]] | None:
+        """DB 종류별 실행 계획 조회 메서드를 반환합니다. 지원하지 않는 DB면 None을 반환합니다."""
+        return {
+            DBTypesEnum.postgresql.name: self._explain_postgresql,
+            DBTypesEnum.mysql.name: self._explain_mysql,
+            DBTypesEnum.mariadb.name: self._explain_mysql,
+            DBTypesEnum.oracle.name: self._explain_oracle,
+            DBTypesEnum.sqlite.name: self._explain_sqlite,
+            DBTypesEnum.sqlserver.name: self._explain_sqlserver,
+        }.get(db_type)
+
+    def _explain(
+        self, cursor: Any, db_type: str, explainer: Callable[[Any, str], tuple[PlanNode | None, Any]], query: str
+    ) -> QueryPlan:
+        root, raw = explainer(cursor, query)
+        return QueryPlan(
+            db_type=db_type,
+            root=root,
+            estimated_rows=root.estimated_rows if root else None,
+            estimated_cost=root.estimated_cost if root else None,
+            raw=raw,
+        )
+
+    # ─────────────────────────────
+    # PostgreSQL
+    # ─────────────────────────────
+    def _explain_postgresql(self, cursor: Any, query: str) -> tuple[PlanNode | None, Any]:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {query}")
+        raw = _load_json(cursor.fetchone()[0])
+        return (_postgresql_node(raw[0]["Plan"]) if raw else None), raw
+
+    # ─────────────────────────────
+    # MySQL / MariaDB
+    # ─────────────────────────────
+    def _explain_mysql(self, cursor: Any, query: str) -> tuple[PlanNode | None, Any]:
+        cursor.execute(f"EXPLAIN FORMAT=JSON {query}")
+        raw = _load_json(cursor.fetchone()[0])
+        if "query_block" in raw:
+            return _mysql_node("query_block", raw["query_block"]), raw
+        return _mysql_node(raw.get("operation", "query"), raw), raw
+
+    # ─────────────────────────────
+    # Oracle
+    # ─────────────────────────────
+    def _explain_oracle(self, cursor: Any, query: str) -> tuple[PlanNode | None, Any]:
+        # STATEMENT_ID 는 바인드 변수를 쓸 수 없으므로 직접 생성한 값만 넣습니다.
+        statement_id = f"QGENIE_{uuid.uuid4().hex[:20]}"
+        cursor.execute(f"EXPLAIN PLAN SET STATEMENT_ID = '{statement_id}' FOR {query}")
+        cursor.execute(
+            """
+            SELECT id, parent_id, operation, options, object_name, cardinality, cost
+            FROM plan_table WHERE statement_id = :statement_id ORDER BY id
+            """,
+            {"statement_id": statement_id},
+        )
+        rows = cursor.fetchall()
+        cursor.execute(
+            "SELECT plan_table_output FROM TABLE(DBMS_XPLAN.DISPLAY('PLAN_TABLE', :statement_id, 'TYPICAL'))",
+            {"statement_id": statement_id},
+        )
+        raw = "\n".join(row[0] or "" for row in cursor.fetchall())
+
+        nodes: dict[Any, PlanNode] = {}
+        root = None
+        for plan_id, parent_id, operation, options, object_name, cardinality, cost in rows:
+            node = PlanNode(
+                operation=f"{operation} {options}" if options else operation,
+                object_name=object_name,
+                estimated_rows=cardinality,
+                estimated_cost=cost,
+            )
+            nodes[plan_id] = node
+            if parent_id in nodes:
+                nodes[parent_id].children.append(node)
+            elif root is None:
+                root = node
+        return root, raw
+
+    # ─────────────────────────────
+    # SQLite
+    # ─────────────────────────────
+    def _explain_sqlite(self, cursor: Any, query: str) -> tuple[PlanNode | None, Any]:
+        cursor.execute(f"EXPLAIN QUERY PLAN {query}")
+        rows = cursor.fetchall()
+        raw = [{"id": row[0], "parent": row[1], "detail": row[3]} for row in rows]
+
+        root = PlanNode(operation="QUERY PLAN")
+        nodes: dict[int, PlanNode] = {0: root}
+        for plan_id, parent_id, _, detail in rows:
+            operation, _, rest = detail.partition(" ")
+            object_name = rest.split(" ", 1)[0] if operation in ("SCAN", "SEARCH") and rest else None
+            node = PlanNode(operation=operation, object_name=object_name, detail=detail)
+            nodes[plan_id] = node
+            nodes.get(parent_id, root).children.append(node)
+        return root, raw
+
+    # ─────────────────────────────
+    # SQL Server
+    # ─────────────────────────────
+    def _explain_sqlserver(self, cursor: Any, query: str) -> tuple[PlanNode | None, Any]:
+        cursor.execute("SET SHOWPLAN_XML ON")
+        try:
+            cursor.execute(query)
+            raw = cursor.fetchone()[0]
+        finally:
+            cursor.execute("SET SHOWPLAN_XML OFF")
+
+        relops = _sqlserver_relops(ElementTree.fromstring(raw))
+        return (_sqlserver_node(relops[0]) if relops else None), raw
+
+
+def _load_json(value: Any) -> Any:
+    return json.loads(value) if isinstance(value, str | bytes) else value
+
+
+def _to_float(value: Any) -> float | None:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _postgresql_node(plan: dict) -> PlanNode:
+    details = [
+        f"{key}: {plan[key]}"
+        for key in ("Join Type", "Index Name", "Index Cond", "Hash Cond", "Filter", "Sort Key")
+        if plan.get(key)
+    ]
+    return PlanNode(
+        operation=plan.get("Node Type", "Unknown"),
+        object_name=plan.get("Relation Name"),
+        detail=", ".join(details) or None,
+        estimated_rows=_to_float(plan.get("Plan Rows")),
+        estimated_cost=_to_float(plan.get("Total Cost")),
+        children=[_postgresql_node(child) for child in plan.get("Plans", [])],
+    )
+
+
+def _mysql_node(name: str, block: dict) -> PlanNode:
+    """
+    MySQL/MariaDB JSON 계획의 블록 하나를 변환합니다.
+    (format version 1: query_block/table/nested_loop 등의 중첩 구조, version 2: operation/inputs 구조)
+    """
+    if "inputs" in block or "estimated_total_cost" in block:
+        return PlanNode(
+            operation=block.get("operation", name),
+            object_name=block.get("table_name"),
+            detail=block.get("access_type"),
+            estimated_rows=_to_float(block.get("estimated_rows")),
+            estimated_cost=_to_float(block.get("estimated_total_cost")),
+            children=[_mysql_node("input", child) for child in block.get("inputs", [])],
+        )
+
+    cost_info = block.get("cost_info", {})
+    is_table = name == "table"
+    return PlanNode(
+        operation=block.get("access_type", name) if is_table else name,
+        object_name=block.get("table_name"),
+        detail=f"key: {block['key']}" if block.get("key") else None,
+        estimated_rows=_to_float(block.get("rows_produced_per_join", block.get("rows"))),
+        estimated_cost=_to_float(cost_info.get("prefix_cost") or cost_info.get("query_cost")),
+        children=_mysql_children(block),
+    )
+
+
+def _mysql_children(block: dict) -> list[PlanNode]:
+    children = []
+    for key, value in block.items():
+        if key in MYSQL_INFO_KEYS:
+            continue
+        items = value if isinstance(value, list) else [value]
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            # nested_loop: [{"table": {...}}, ...] 처럼 한 항목짜리 래퍼는 벗겨냅니다.
+            if len(item) == 1 and isinstance(next(iter(item.values())), dict):
+                children.append(_mysql_node(*next(iter(item.items()))))
+            else:
+                children.append(_mysql_node(key, item))
+    return children
+
+
+def _sqlserver_relops(element: ElementTree.Element) -> list[ElementTree.Element]:
+    """`element` 아래에서 가장 가까운 RelOp 요소들을 찾습니다. (RelOp 안의 RelOp 는 하위 연산)"""
+    relops = []
+    for child in element:
+        if child.tag == f"{SQLSERVER_SHOWPLAN_NS}RelOp":
+            relops.append(child)
+        else:
+            relops.extend(_sqlserver_relops(child))
+    return relops
+
+
+def _sqlserver_node(relop: ElementTree.Element) -> PlanNode:
+    # 연산 요소(IndexScan 등)의 바로 아래 Object 만 봅니다. (더 아래는 하위 연산의 대상)
+    targets = (op.find(f"{SQLSERVER_SHOWPLAN_NS}Object") for op in relop)
+    target = next((element for element in targets if element is not None), None)
+    object_name = None
+    if target is not None:
+        object_name = ".".join(part.strip("[]") for part in (target.get("Table"), target.get("Index")) if part) or None
+    logical_op = relop.get("LogicalOp")
+    physical_op = relop.get("PhysicalOp", "Unknown")
+    return PlanNode(
+        operation=physical_op,
+        object_name=object_name,
+        detail=logical_op if logical_op and logical_op != physical_op else None,
+        estimated_rows=_to_float(relop.get("EstimateRows")),
+        estimated_cost=_to_float(relop.get("EstimatedTotalSubtreeCost")),
+        children=[_sqlserver_node(child) for child in _sqlserver_relops(relop)],
+    )
+
+
+query_plan_repository = QueryPlanRepository()
@@ -1,98 +1,293 @@
+import logging
 import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, nullcontext
 from typing import Any
 
-import oracledb
-
+from app.core import serialization, sql_classifier
+from app.core.enum.result_format import ResultFormatEnum
 from app.core.exceptions import APIException
+from app.core.sql_classifier import SqlStatement
 from app.core.status import CommonCode
-from app.core.utils import get_db_path
+from app.db.local_storage import local_storage
+from app.db.query_handles import QueryHandle, query_handles
+from app.db.user_db_pool import open_connection, user_db_pool
 from app.schemas.query.result_model import (
     BasicResult,
     ExecutionResult,
+    ExecutionScriptResult,
     ExecutionSelectResult,
     InsertLocalDBResult,
     QueryTestResult,
+    ScriptResult,
     SelectQueryHistoryResult,
+    StatementResult,
 )
 
+# 미리보기(execution_test) 결과를 읽을 때 한 번에 가져오는 최대 행 수
+PREVIEW_FETCH_SIZE = 500
+# 결과를 끝까지 읽지 않으면 커넥션에 다른 명령을 보낼 수 없는(남은 결과를 모두 받아야 하는) 드라이버
+UNBUFFERED_RESULT_DRIVERS = ("pymysql", "mysql.connector")
+
+
+class QueryStream:
+    """
+    실행 중인 쿼리의 결과를 배치 단위로 읽어오는 스트림입니다.
+    - 첫 배치는 실행 시점에 미리 읽어, 응답을 보내기 전에 실행 오류와 컬럼 정보를 확인할 수 있습니다.
+    - 커넥션은 결과를 모두 읽거나 `close()`를 호출하면 풀에 반납됩니다.
+      끝까지 읽지 않은 채 닫으면 서버에 남은 결과를 버리기 위해 커넥션을 폐기합니다.
+    - 실행 핸들은 스트림이 닫힐 때까지 등록된 채로 남아, 결과를 읽는 동안에도 취소/제한 시간이 적용됩니다.
+    """
+
+    def __init__(
+        self,
+        connection: Any,
+        cursor: Any,
+        columns: list[str],
+        first_batch: list,
+        fetch_size: int,
+        handle: QueryHandle | None = None,
+    ):
+        self.columns = columns
+        self.row_count = 0
+        self._connection = connection
+        self._cursor = cursor
+        self._pending = first_batch
+        self._fetch_size = fetch_size
+        self._handle = handle
+        self._exhausted = not first_batch
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def batches(self) -> Iterator[list]:
+        """남은 결과를 `fetch_size` 행씩 반환합니다. 모두 읽으면 커넥션을 반납합니다."""
+        try:
+            batch = self._pending
+            self._pending = []
+            while batch:
+                self.row_count += len(batch)
+                yield batch
+                batch = self._cursor.fetchmany(self._fetch_size)
+            self._exhausted = True
+        finally:
+            self.close()
+
+    @property
+    def is_exhausted(self) -> bool:
+        return self._exhausted
+
+    def failure_code(self, default: CommonCode) -> CommonCode:
+        """결과를 읽다 실패했을 때 응답할 코드를 반환합니다. 취소/제한 시간 초과로 중단된 경우 해당 코드를 반환합니다."""
+        return _failure_code(self._handle, default)
+
+    def fetch(self, size: int) -> list:
+        """
+        다음 `size` 행을 반환합니다. 반환된 행이 `size`보다 적으면 결과를 모두 읽은 것이며, 커넥션을 반납합니다.
+        조회 중 오류가 발생하면 스트림을 닫고 예외를 다시 발생시킵니다.
+        """
+        rows, self._pending = self._pending[:size], self._pending[size:]
+        try:
+            if len(rows) < size and not self._exhausted:
+                rows.extend(self._cursor.fetchmany(size - len(rows)))
+        except Exception:
+            self.close()
+            raise
+
+        self.row_count += len(rows)
+        if len(rows) < size and not self._pending:
+            self._exhausted = True
+            self.close()
+        return rows
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        if self._handle:
+            # 폐기할 커넥션에는 제한 시간 원복 명령을 보내지 않습니다.
+            self._handle.connection_abandoned = self._handle.connection_abandoned or not self._exhausted
+            query_handles.unregister(self._handle)
+        if not self._exhausted:
+            user_db_pool.discard(self._connection)
+            return
+        try:
+            self._cursor.close()
+        except Exception:
+            user_db_pool.discard(self._connection)
+            return
+        user_db_pool.release(self._connection)
+
 
 class QueryRepository:
     def execution(
         self,
         query: str,
         driver_module: Any,
+        result_format: ResultFormatEnum = ResultFormatEnum.dict,
+        handle: QueryHandle | None = None,
         **kwargs: Any,
     ) -> ExecutionSelectResult | ExecutionResult | BasicResult:
         """
         쿼리 수행합니다.
+        조회 결과의 행은 `result_format` 형식으로 변환됩니다.
+        `handle`이 주어지면 실행 중 취소할 수 있고, 핸들의 제한 시간이 적용됩니다.
+        결과 행을 반환하는 문장은 결과를 읽고, 데이터를 바꾸는 문장은 커밋합니다. (RETURNING 은 둘 다)
         """
+        script = sql_classifier.classify(query, driver_module.__name__)
         connection = None
         try:
-            connection = self._connect(driver_module, **kwargs)
+            connection = user_db_pool.acquire(driver_module, self._connect, **kwargs)
             cursor = connection.cursor()
 
-            cursor.execute(query)
-
-            if self._is_select_query(query):
-                rows = cursor.fetchall()
-
-                if cursor.description:
-                    columns = [desc[0] for desc in cursor.description]
-                    data = [dict(zip(columns, row, strict=False)) for row in rows]
-                else:
-                    columns = []
-                    data = []
-                result = {"columns": columns, "data": data}
+            with self._track(handle, driver_module, connection, cursor, kwargs):
+                cursor.execute(query)
+                result = self._read_result(cursor, result_format) if script.returns_rows else None
+                if not script.is_read_only:
+                    connection.commit()
 
+            if result is not None:
                 return ExecutionSelectResult(is_successful=True, code=CommonCode.SUCCESS_EXECUTION, data=result)
-
-            connection.commit()
             return ExecutionResult(is_successful=True, code=CommonCode.SUCCESS_EXECUTION, data=cursor.rowcount)
         except (AttributeError, driver_module.OperationalError, driver_module.DatabaseError):
-            return BasicResult(is_successful=False, code=CommonCode.FAIL_CONNECT_DB)
+            return BasicResult(is_successful=False, code=_failure_code(handle, CommonCode.FAIL_CONNECT_DB))
         except Exception:
-            return BasicResult(is_successful=False, code=CommonCode.FAIL)
+            return BasicResult(is_successful=False, code=_failure_code(handle, CommonCode.FAIL))
         finally:
             if connection:
-                connection.close()
+                user_db_pool.release(connection)
 
     def execution_test(
         self,
         query: str,
         driver_module: Any,
+        result_format: ResultFormatEnum = ResultFormatEnum.dict,
+        handle: QueryHandle | None = None,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
         **kwargs: Any,
     ) -> QueryTestResult:
         """
         쿼리가 문법적으로 유효한지 테스트합니다.
         실제 데이터는 변경되지 않습니다. (모든 작업은 롤백됩니다).
+        조회 결과는 `max_rows`행 / `max_bytes`바이트까지만 읽고, 나머지는 DB에서 가져오지 않습니다.
+        (잘렸는지 여부는 결과의 `truncated`)
         """
+        script = sql_classifier.classify(query, driver_module.__name__)
         connection = None
+        discard = False
         try:
-            connection = self._connect(driver_module, **kwargs)
-            cursor = connection.cursor()
-            cursor.execute(query)
-
-            if not self._is_select_query(query):
-                return QueryTestResult(is_successful=True, code=CommonCode.SUCCESS_EXECUTION_TEST, data=True)
-
-            rows = cursor.fetchall()
-            if cursor.description:
-                columns = [desc[0] for desc in cursor.description]
-                data = [dict(zip(columns, row, strict=False)) for row in rows]
+            connection = user_db_pool.acquire(driver_module, self._connect, **kwargs)
+            if script.returns_rows and script.is_read_only:
+                fetch_size = min(max_rows + 1, PREVIEW_FETCH_SIZE) if max_rows else PREVIEW_FETCH_SIZE
+                cursor = self._open_stream_cursor(connection, driver_module, fetch_size, script.is_query)
             else:
-                columns = []
-                data = []
+                cursor = connection.cursor()
+            with self._track(handle, driver_module, connection, cursor, kwargs):
+                cursor.execute(query)
+
+                if not script.returns_rows:
+                    return QueryTestResult(is_successful=True, code=CommonCode.SUCCESS_EXECUTION_TEST, data=True)
 
-            result = {"columns": columns, "data": data}
+                result = self._read_limited_result(cursor, result_format, max_rows, max_bytes)
+                discard = result["truncated"] and driver_module.__name__ in UNBUFFERED_RESULT_DRIVERS
+                if discard and handle:
+                    handle.connection_abandoned = True
             return QueryTestResult(is_successful=True, code=CommonCode.SUCCESS_EXECUTION, data=result)
         except (AttributeError, driver_module.OperationalError, driver_module.DatabaseError) as e:
-            return QueryTestResult(is_successful=False, code=CommonCode.FAIL_CONNECT_DB, data=str(e))
+            return QueryTestResult(
+                is_successful=False, code=_failure_code(handle, CommonCode.FAIL_CONNECT_DB), data=str(e)
+            )
         except Exception as e:
-            return QueryTestResult(is_successful=False, code=CommonCode.FAIL, data=str(e))
+            return QueryTestResult(is_successful=False, code=_failure_code(handle, CommonCode.FAIL), data=str(e))
+        finally:
+            if connection and discard:
+                # 읽지 않은 결과가 서버에 남아 있어, 반납하면 롤백 전에 나머지를 모두 읽어야 합니다.
+                user_db_pool.discard(connection)
+            elif connection:
+                user_db_pool.release(connection)
+
+    def execute_script(
+        self,
+        statements: tuple[SqlStatement, ...],
+        driver_module: Any,
+        result_format: ResultFormatEnum = ResultFormatEnum.dict,
+        handle: QueryHandle | None = None,
+        **kwargs: Any,
+    ) -> ExecutionScriptResult:
+        """
+        여러 문장을 하나의 커넥션, 하나의 트랜잭션에서 순서대로 실행하고 문장별 결과를 반환합니다.
+        한 문장이라도 실패하면 전체를 롤백합니다. (MySQL/Oracle 의 DDL 처럼 DB가 자동 커밋하는 문장은 예외)
+        """
+        results: list[StatementResult] = []
+        started = time.perf_counter()
+        connection = None
+        try:
+            connection = user_db_pool.acquire(driver_module, self._connect, **kwargs)
+            cursor = connection.cursor()
+            with self._track(handle, driver_module, connection, cursor, kwargs):
+                if driver_module is sqlite3 and not connection.in_transaction:
+                    # sqlite3 모듈은 DDL 앞에서 트랜잭션을 시작하지 않으므로 직접 시작합니다.
+                    cursor.execute("BEGIN")
+                for index, statement in enumerate(statements):
+                    results.append(self._run_script_statement(cursor, index, statement, result_format))
+                connection.commit()
+
+            script_result = ScriptResult(statements=results, is_committed=True, elapsed_ms=_elapsed_ms(started))
+            return ExecutionScriptResult(is_successful=True, code=CommonCode.SUCCESS_EXECUTION, data=script_result)
+        except (AttributeError, driver_module.OperationalError, driver_module.DatabaseError) as e:
+            code = _failure_code(handle, CommonCode.FAIL_CONNECT_DB)
+            return self._script_failure(code, results, started, e)
+        except Exception as e:
+            return self._script_failure(_failure_code(handle, CommonCode.FAIL), results, started, e)
         finally:
             if connection:
-                connection.rollback()
-                connection.close()
+                user_db_pool.release(connection)
+
+    def open_stream(
+        self,
+        query: str,
+        driver_module: Any,
+        fetch_size: int,
+        handle: QueryHandle | None = None,
+        **kwargs: Any,
+    ) -> QueryStream:
+        """
+        쿼리를 실행하고 결과를 서버 측 커서로 나누어 읽는 스트림을 반환합니다.
+        데이터를 바꾸는 쿼리는 커밋 후 반환된 행(RETURNING)만 담은 스트림을 반환합니다.
+        (반환된 행이 없으면 `row_count`에 영향받은 행 수)
+        `handle`이 주어지면 스트림이 닫힐 때까지 취소할 수 있고, 핸들의 제한 시간이 적용됩니다.
+        """
+        script = sql_classifier.classify(query, driver_module.__name__)
+        connection = None
+        try:
+            connection = user_db_pool.acquire(driver_module, self._connect, **kwargs)
+
+            is_write = not script.returns_rows or not script.is_read_only
+            if is_write:
+                cursor = connection.cursor()
+            else:
+                cursor = self._open_stream_cursor(connection, driver_module, fetch_size, script.is_query)
+            if handle:
+                query_handles.register(handle, driver_module, connection, cursor, kwargs)
+            if is_write:
+                return self._run_write_stream(connection, cursor, query, fetch_size, handle)
+
+            cursor.execute(query)
+            # psycopg2 서버 측 커서는 첫 fetch 이후에 description이 채워집니다.
+            first_batch = cursor.fetchmany(fetch_size) if cursor.description or _is_named_cursor(cursor) else []
+            columns = [desc[0] for desc in cursor.description] if cursor.description else []
+            return QueryStream(connection, cursor, columns, first_batch, fetch_size, handle)
+        except (AttributeError, driver_module.OperationalError, driver_module.DatabaseError) as e:
+            self._abort_stream(connection, handle)
+            raise APIException(_failure_code(handle, CommonCode.FAIL_CONNECT_DB)) from e
+        except Exception as e:
+            self._abort_stream(connection, handle)
+            raise APIException(_failure_code(handle, CommonCode.FAIL)) from e
 
     def create_query_history(
         self,
@@ -102,82 +297,203 @@ class QueryRepository:
     ) -> InsertLocalDBResult:
         """
         쿼리 실행 결과를 저장합니다.
+        연결된 채팅 메시지나 DB 프로필이 이미 삭제된 경우(외래 키 위반), 사용자의 쿼리는 이미 실행되었으므로
+        이력 저장만 건너뜁니다. (부모가 삭제되면 이력도 함께 삭제되므로 남겨 둘 이력이 없습니다)
         """
-        db_path = get_db_path()
-        connection = None
         try:
-            connection = sqlite3.connect(db_path)
-            cursor = connection.cursor()
-            cursor.execute(sql, data)
-            connection.commit()
+            with local_storage.transaction() as connection:
+                cursor = connection.cursor()
+                cursor.execute(sql, data)
 
             return ExecutionResult(is_successful=True, code=CommonCode.SUCCESS_EXECUTION, data=query)
+        except sqlite3.IntegrityError as e:
+            if "FOREIGN KEY" not in str(e).upper():
+                raise APIException(CommonCode.FAIL_CONNECT_DB) from e
+            logging.warning(f"Skipped saving query history: the chat message or DB profile no longer exists ({e}).")
+            return ExecutionResult(is_successful=False, code=CommonCode.FAIL_CREATE_QUERY, data=query)
         except sqlite3.Error as e:
             raise APIException(CommonCode.FAIL_CONNECT_DB) from e
         except Exception as e:
             raise APIException(CommonCode.FAIL_CREATE_QUERY) from e
-        finally:
-            if connection:
-                connection.close()
 
     def find_query_history(self, chat_tab_id: int) -> SelectQueryHistoryResult:
         """
         전달받은 쿼리를 실행하여 모든 DB 연결 정보를 조회합니다.
         """
-        db_path = get_db_path()
-        connection = None
         try:
-            connection = sqlite3.connect(db_path)
-            connection.row_factory = sqlite3.Row
-            cursor = connection.cursor()
+            with local_storage.connection() as connection:
+                cursor = connection.cursor()
 
-            sql = """
-                SELECT qh.*
-                FROM query_history AS qh
-                LEFT JOIN chat_message AS cm ON qh.chat_message_id = cm.id
-                WHERE cm.chat_tab_id = ?
-                ORDER BY qh.created_at DESC
-                LIMIT 5;
-            """
-            data = (chat_tab_id,)
-
-            cursor.execute(sql, data)
-            rows = cursor.fetchall()
+                sql = """
+                    SELECT qh.*
+                    FROM query_history AS qh
+                    LEFT JOIN chat_message AS cm ON qh.chat_message_id = cm.id
+                    WHERE cm.chat_tab_id = ?
+                    ORDER BY qh.created_at DESC
+                    LIMIT 5;
+                """
+                data = (chat_tab_id,)
 
-            columns = [desc[0] for desc in cursor.description]
-            data = [dict(zip(columns, row, strict=False)) for row in rows]
-            result = {"columns": columns, "data": data}
+                cursor.execute(sql, data)
+                rows = cursor.fetchall()
+
+                columns = [desc[0] for desc in cursor.description]
+                data = [dict(zip(columns, row, strict=False)) for row in rows]
+                result = {"columns": columns, "data": data}
 
             return SelectQueryHistoryResult(is_successful=True, code=CommonCode.SUCCESS_FIND_QUERY_HISTORY, data=result)
         except sqlite3.Error:
             return SelectQueryHistoryResult(is_successful=False, code=CommonCode.FAIL_CONNECT_DB)
         except Exception:
             return SelectQueryHistoryResult(is_successful=False, code=CommonCode.FAIL)
-        finally:
-            if connection:
-                connection.close()
 
     # ─────────────────────────────
     # DB 연결 메서드
     # ─────────────────────────────
     def _connect(self, driver_module: Any, **kwargs):
-        if driver_module is oracledb:
-            if kwargs.get("user", "").lower() == "sys":
-                kwargs["mode"] = oracledb.AUTH_MODE_SYSDBA
-            return driver_module.connect(**kwargs)
-        elif "connection_string" in kwargs:
-            return driver_module.connect(kwargs["connection_string"])
-        elif "db_name" in kwargs:
-            return driver_module.connect(kwargs["db_name"])
-        else:
-            return driver_module.connect(**kwargs)
-
-    def _is_select_query(self, query_text: str) -> bool:
-        for stmt in query_text.split(";"):
-            cleaned_stmt = stmt.strip().lower()
-            if cleaned_stmt and not cleaned_stmt.startswith("--") and cleaned_stmt.startswith("select"):
-                return True
-        return False
+        return open_connection(driver_module, **kwargs)
+
+    def _track(
+        self, handle: QueryHandle | None, driver_module: Any, connection: Any, cursor: Any, kwargs: dict[str, Any]
+    ) -> AbstractContextManager:
+        """실행 핸들이 있으면 취소/제한 시간 관리 대상으로 등록합니다."""
+        if handle is None:
+            return nullcontext()
+        return query_handles.running(handle, driver_module, connection, cursor, kwargs)
+
+    def _run_script_statement(
+        self, cursor: Any, index: int, statement: SqlStatement, result_format: ResultFormatEnum
+    ) -> StatementResult:
+        started = time.perf_counter()
+        cursor.execute(statement.text)
+        columns = data = None
+        row_count = cursor.rowcount if cursor.rowcount >= 0 else None
+        if statement.returns_rows and cursor.description:
+            rows = cursor.fetchall()
+            columns = [desc[0] for desc in cursor.description]
+            data = serialization.shape_rows(columns, rows, result_format)
+            row_count = len(rows)
+        return StatementResult(
+            index=index,
+            statement=statement.text,
+            keyword=statement.keyword,
+            row_count=row_count,
+            columns=columns,
+            data=data,
+            elapsed_ms=_elapsed_ms(started),
+        )
+
+    def _script_failure(
+        self, code: CommonCode, results: list[StatementResult], started: float, error: Exception
+    ) -> ExecutionScriptResult:
+        script_result = ScriptResult(
+            statements=results,
+            is_committed=False,
+            failed_index=len(results),
+            error=str(error),
+            elapsed_ms=_elapsed_ms(started),
+        )
+        return ExecutionScriptResult(is_successful=False, code=code, data=script_result)
+
+    def _read_result(self, cursor: Any, result_format: ResultFormatEnum) -> dict[str, list]:
+        """실행한 커서의 결과를 모두 읽습니다. 결과 집합이 없으면 빈 결과를 반환합니다."""
+        if not cursor.description:
+            return {"columns": [], "data": []}
+        rows = cursor.fetchall()
+        columns = [desc[0] for desc in cursor.description]
+        return {"columns": columns, "data": serialization.shape_rows(columns, rows, result_format)}
+
+    def _read_limited_result(
+        self, cursor: Any, result_format: ResultFormatEnum, max_rows: int | None, max_bytes: int | None
+    ) -> dict[str, Any]:
+        """
+        실행한 커서의 결과를 `max_rows`행 / `max_bytes`바이트(행을 JSON으로 직렬화한 크기 기준)까지 읽습니다.
+        한도에 닿으면 더 읽지 않고 `truncated`를 True로 반환합니다.
+        """
+        # psycopg2 서버 측 커서는 첫 fetch 이후에 description이 채워집니다.
+        if not cursor.description and not _is_named_cursor(cursor):
+            return {"columns": [], "data": [], "truncated": False}
+
+        rows: list = []
+        size = 0
+        truncated = False
+        batch_size = min(max_rows + 1, PREVIEW_FETCH_SIZE) if max_rows else PREVIEW_FETCH_SIZE
+        while not truncated:
+            batch = cursor.fetchmany(batch_size)
+            if not batch:
+                break
+            for row in batch:
+                if max_rows is not None and len(rows) >= max_rows:
+                    truncated = True
+                    break
+                if max_bytes is not None:
+                    size += len(serialization.dumps(list(row)).encode())
+                    if size > max_bytes:
+                        truncated = True
+                        break
+                rows.append(row)
+
+        columns = [desc[0] for desc in cursor.description] if cursor.description else []
+        return {
+            "columns": columns,
+            "data": serialization.shape_rows(columns, rows, result_format),
+            "truncated": truncated,
+        }
+
+    def _run_write_stream(
+        self, connection: Any, cursor: Any, query: str, fetch_size: int, handle: QueryHandle | None
+    ) -> QueryStream:
+        """데이터를 바꾸는 쿼리를 실행하고 커밋한 뒤, 반환된 행을 담은 스트림을 반환합니다."""
+        cursor.execute(query)
+        rows = cursor.fetchall() if cursor.description else []
+        columns = [desc[0] for desc in cursor.description] if cursor.description else []
+        connection.commit()
+
+        stream = QueryStream(connection, cursor, columns, rows, fetch_size, handle)
+        if not rows:
+            stream.row_count = max(cursor.rowcount, 0)
+            stream.close()
+        return stream
+
+    def _abort_stream(self, connection: Any, handle: QueryHandle | None) -> None:
+        """스트림을 열지 못했을 때 핸들 등록을 해제하고 커넥션을 반납합니다."""
+        if handle:
+            query_handles.unregister(handle)
+        if connection:
+            user_db_pool.release(connection)
+
+    def _open_stream_cursor(self, connection: Any, driver_module: Any, fetch_size: int, is_query: bool) -> Any:
+        """
+        드라이버별로 결과 전체를 클라이언트 메모리에 올리지 않는 커서를 엽니다.
+        PostgreSQL 서버 측 커서는 조회문(SELECT/VALUES/TABLE)에만 사용할 수 있어, 그 외(SHOW, EXPLAIN 등)는 일반 커서를 엽니다.
+        """
+        driver_name = driver_module.__name__
+        if driver_name == "psycopg2" and is_query:
+            cursor = connection.cursor(name=f"qgenie_stream_{uuid.uuid4().hex}")
+            cursor.itersize = fetch_size
+            return cursor
+        if driver_name == "pymysql":
+            return connection.cursor(driver_module.cursors.SSCursor)
+        if driver_name == "mysql.connector":
+            return connection.cursor(buffered=False)
+
+        cursor = connection.cursor()
+        cursor.arraysize = fetch_size
+        if driver_name == "oracledb":
+            cursor.prefetchrows = fetch_size + 1
+        return cursor
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+def _failure_code(handle: QueryHandle | None, default: CommonCode) -> CommonCode:
+    return handle.failure_code(default) if handle else default
+
+
+def _is_named_cursor(cursor: Any) -> bool:
+    return getattr(cursor, "name", None) is not None
 
 
 query_repository = QueryRepository()
@@ -0,0 +1,43 @@
+from app.db.local_storage import local_storage
+
+
+class SchemaCacheRepository:
+    """
+    사용자 DB 카탈로그 조회 결과(JSON)를 프로필/객체 단위로 저장합니다.
+    각 항목은 저장 당시의 스키마 지문(fingerprint)과 함께 보관되며, 지문이 달라지면 사용하지 않습니다.
+    """
+
+    def find_cache(self, db_profile_id: str, object_key: str) -> tuple[str, str] | None:
+        """저장된 (fingerprint, payload)를 반환합니다. 없으면 None을 반환합니다."""
+        with local_storage.connection() as conn:
+            row = conn.execute(
+                "SELECT fingerprint, payload FROM schema_cache WHERE db_profile_id = ? AND object_key = ?",
+                (db_profile_id, object_key),
+            ).fetchone()
+        if not row:
+            return None
+        return row["fingerprint"], row["payload"]
+
+    def save_cache(self, db_profile_id: str, object_key: str, fingerprint: str, payload: str) -> None:
+        """캐시 항목을 저장하거나 갱신합니다."""
+        with local_storage.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO schema_cache (db_profile_id, object_key, fingerprint, payload)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (db_profile_id, object_key) DO UPDATE SET
+                    fingerprint = excluded.fingerprint,
+                    payload = excluded.payload,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                (db_profile_id, object_key, fingerprint, payload),
+            )
+
+    def delete_by_profile(self, db_profile_id: str) -> int:
+        """프로필의 캐시 항목을 모두 삭제하고, 삭제된 항목 수를 반환합니다."""
+        with local_storage.transaction() as conn:
+            cursor = conn.execute("DELETE FROM schema_cache WHERE db_profile_id = ?", (db_profile_id,))
+            return cursor.rowcount
+
+
+schema_cache_repository = SchemaCacheRepository()
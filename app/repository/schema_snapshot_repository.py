@@ -0,0 +1,64 @@
+from app.db.local_storage import local_storage
+
+
+class SchemaSnapshotRepository:
+    """
+    스키마 증분 재조회를 위해, 마지막으로 조회한 테이블별 DDL 지문과 상세 정보(JSON)를 보관합니다.
+    스냅샷은 (프로필, 데이터베이스, 스키마, 테이블) 단위로 저장됩니다.
+    """
+
+    def find_snapshots(self, db_profile_id: str, db_name: str, schema_name: str) -> dict[str, tuple[str, str]]:
+        """스키마에 저장된 스냅샷을 {테이블 이름: (fingerprint, payload)} 형태로 반환합니다."""
+        with local_storage.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT table_name, fingerprint, payload
+                FROM schema_snapshot
+                WHERE db_profile_id = ? AND db_name = ? AND schema_name = ?
+                """,
+                (db_profile_id, db_name, schema_name),
+            ).fetchall()
+        return {row["table_name"]: (row["fingerprint"], row["payload"]) for row in rows}
+
+    def apply_changes(
+        self,
+        db_profile_id: str,
+        db_name: str,
+        schema_name: str,
+        upserts: list[tuple[str, str, str]],
+        removed: list[str],
+    ) -> None:
+        """
+        변경된 테이블의 스냅샷((테이블 이름, fingerprint, payload) 목록)을 저장하고,
+        삭제된 테이블의 스냅샷을 제거합니다. 하나의 트랜잭션으로 처리합니다.
+        """
+        if not upserts and not removed:
+            return
+        with local_storage.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO schema_snapshot (db_profile_id, db_name, schema_name, table_name, fingerprint, payload)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (db_profile_id, db_name, schema_name, table_name) DO UPDATE SET
+                    fingerprint = excluded.fingerprint,
+                    payload = excluded.payload,
+                    updated_at = CURRENT_TIMESTAMP
+                """,
+                [(db_profile_id, db_name, schema_name, *upsert) for upsert in upserts],
+            )
+            conn.executemany(
+                """
+                DELETE FROM schema_snapshot
+                WHERE db_profile_id = ? AND db_name = ? AND schema_name = ? AND table_name = ?
+                """,
+                [(db_profile_id, db_name, schema_name, table_name) for table_name in removed],
+            )
+
+    def delete_by_profile(self, db_profile_id: str) -> int:
+        """프로필의 스냅샷을 모두 삭제하고, 삭제된 항목 수를 반환합니다."""
+        with local_storage.transaction() as conn:
+            cursor = conn.execute("DELETE FROM schema_snapshot WHERE db_profile_id = ?", (db_profile_id,))
+            return cursor.rowcount
+
+
+schema_snapshot_repository = SchemaSnapshotRepository()
@@ -2,12 +2,12 @@ import logging
 import sqlite3
 from typing import Any
 
-import oracledb
-
 from app.core.enum.db_driver import DBTypesEnum
 from app.core.exceptions import APIException
 from app.core.status import CommonCode
-from app.core.utils import get_db_path
+from app.db.local_storage import local_storage
+from app.db.user_db_pool import open_connection, user_db_pool
+from app.repository.catalog_repository import format_oracle_type
 from app.schemas.user_db.db_profile_model import AllDBProfileInfo, UpdateOrCreateDBProfile
 from app.schemas.user_db.result_model import (
     AllDBProfileResult,
@@ -23,6 +23,56 @@ from app.schemas.user_db.result_model import (
     TableListResult,
 )
 
+# DB 종류별 스키마 지문 조회 쿼리
+# - PostgreSQL: 카탈로그 행(컬럼 기본값 pg_attrdef 포함)이 생성/수정되면 바뀌는 xmin 과 행 수
+# - MySQL/MariaDB: 테이블 생성 시각(ALTER 시 갱신)과 컬럼(기본값 포함)/인덱스/제약조건/FK 정의의 체크섬
+#   (서버 전체가 아닌 프로필의 스키마만 집계하도록 {schema_filter} 자리에 `s.table_schema` 조건을 넣습니다)
+# - Oracle: 객체의 마지막 DDL 시각과 개수 (:owner 가 NULL 이면 접근 가능한 전체 객체)
+# - SQLite: 스키마가 바뀔 때마다 증가하는 schema_version
+FINGERPRINT_QUERIES = {
+    DBTypesEnum.postgresql.name: """
+        SELECT
+            (SELECT count(*) || '-' || coalesce(max(xmin::text::bigint), 0) FROM pg_catalog.pg_class),
+            (SELECT count(*) || '-' || coalesce(max(xmin::text::bigint), 0) FROM pg_catalog.pg_attribute),
+            (SELECT count(*) || '-' || coalesce(max(xmin::text::bigint), 0) FROM pg_catalog.pg_attrdef),
+            (SELECT count(*) || '-' || coalesce(max(xmin::text::bigint), 0) FROM pg_catalog.pg_constraint),
+            (SELECT count(*) || '-' || coalesce(max(xmin::text::bigint), 0) FROM pg_catalog.pg_description)
+    """,
+    DBTypesEnum.mysql.name: """
+        SELECT
+            (SELECT CONCAT(COUNT(*), '-', COALESCE(MAX(s.create_time), ''),
+                           '-', COALESCE(SUM(CRC32(CONCAT_WS('.', s.table_schema, s.table_name, s.create_time))), 0))
+             FROM information_schema.tables s WHERE {schema_filter}),
+            (SELECT CONCAT(COUNT(*), '-', COALESCE(SUM(CRC32(CONCAT_WS('.', s.table_schema, s.table_name,
+                           s.column_name, s.column_type, s.is_nullable, s.column_key, s.column_comment,
+                           COALESCE(s.column_default, '<NULL>'), s.extra))), 0))
+             FROM information_schema.columns s WHERE {schema_filter}),
+            (SELECT CONCAT(COUNT(*), '-', COALESCE(SUM(CRC32(CONCAT_WS('.', s.table_schema, s.table_name,
+                           s.index_name, s.column_name, s.seq_in_index, s.non_unique))), 0))
+             FROM information_schema.statistics s WHERE {schema_filter}),
+            (SELECT CONCAT(COUNT(*), '-', COALESCE(SUM(CRC32(CONCAT_WS('.', s.table_schema, s.table_name,
+                           s.constraint_name, s.constraint_type))), 0))
+             FROM information_schema.table_constraints s WHERE {schema_filter}),
+            (SELECT CONCAT(COUNT(*), '-', COALESCE(SUM(CRC32(CONCAT_WS('.', s.table_schema, s.table_name,
+                           s.constraint_name, s.column_name, s.ordinal_position, s.referenced_table_schema,
+                           s.referenced_table_name, s.referenced_column_name, r.update_rule, r.delete_rule))), 0))
+             FROM information_schema.key_column_usage s
+             LEFT JOIN information_schema.referential_constraints r
+               ON r.constraint_schema = s.constraint_schema AND r.constraint_name = s.constraint_name
+              AND r.table_name = s.table_name
+             WHERE s.referenced_table_name IS NOT NULL AND {schema_filter})
+    """,
+    DBTypesEnum.oracle.name: """
+        SELECT COUNT(*), TO_CHAR(MAX(last_ddl_time), 'YYYYMMDDHH24MISS')
+        FROM all_objects
+        WHERE :owner IS NULL OR owner = :owner
+    """,
+    DBTypesEnum.sqlite.name: "PRAGMA schema_version",
+}
+FINGERPRINT_QUERIES[DBTypesEnum.mariadb.name] = FINGERPRINT_QUERIES[DBTypesEnum.mysql.name]
+# 스키마를 지정하지 않은 MySQL/MariaDB 지문에서 제외할 시스템 스키마
+MYSQL_SYSTEM_SCHEMAS = ("information_schema", "mysql", "performance_schema", "sys")
+
 
 class UserDbRepository:
     def connection_test(self, driver_module: Any, **kwargs: Any) -> BasicResult:
@@ -45,13 +95,10 @@ class UserDbRepository:
         """
         DB 드라이버와 연결에 필요한 매개변수들을 받아 저장합니다.
         """
-        db_path = get_db_path()
-        connection = None
         try:
-            connection = sqlite3.connect(db_path)
-            cursor = connection.cursor()
-            cursor.execute(sql, data)
-            connection.commit()
+            with local_storage.transaction() as connection:
+                cursor = connection.cursor()
+                cursor.execute(sql, data)
 
             name = create_db_info.view_name if create_db_info.view_name else create_db_info.type
             id = create_db_info.id
@@ -62,21 +109,15 @@ class UserDbRepository:
             return ChangeProfileResult(is_successful=False, code=CommonCode.FAIL_SAVE_PROFILE)
         except Exception:
             return ChangeProfileResult(is_successful=False, code=CommonCode.FAIL_SAVE_PROFILE)
-        finally:
-            if connection:
-                connection.close()
 
     def update_profile(self, sql: str, data: tuple, update_db_info: UpdateOrCreateDBProfile) -> ChangeProfileResult:
         """
         DB 드라이버와 연결에 필요한 매개변수들을 받아 업데이트합니다.
         """
-        db_path = get_db_path()
-        connection = None
         try:
-            connection = sqlite3.connect(db_path)
-            cursor = connection.cursor()
-            cursor.execute(sql, data)
-            connection.commit()
+            with local_storage.transaction() as connection:
+                cursor = connection.cursor()
+                cursor.execute(sql, data)
 
             name = update_db_info.view_name if update_db_info.view_name else update_db_info.type
             id = update_db_info.id
@@ -87,9 +128,6 @@ class UserDbRepository:
             return ChangeProfileResult(is_successful=False, code=CommonCode.FAIL_UPDATE_PROFILE)
         except Exception:
             return ChangeProfileResult(is_successful=False, code=CommonCode.FAIL_UPDATE_PROFILE)
-        finally:
-            if connection:
-                connection.close()
 
     def delete_profile(
         self,
@@ -100,13 +138,10 @@ class UserDbRepository:
         """
         DB 드라이버와 연결에 필요한 매개변수들을 받아 삭제합니다.
         """
-        db_path = get_db_path()
-        connection = None
         try:
-            connection = sqlite3.connect(db_path)
-            cursor = connection.cursor()
-            cursor.execute(sql, data)
-            connection.commit()
+            with local_storage.transaction() as connection:
+                cursor = connection.cursor()
+                cursor.execute(sql, data)
 
             data = {"id": profile_id}
             return ChangeProfileResult(is_successful=True, code=CommonCode.SUCCESS_DELETE_PROFILE, data=data)
@@ -114,44 +149,32 @@ class UserDbRepository:
             return ChangeProfileResult(is_successful=False, code=CommonCode.FAIL_DELETE_PROFILE)
         except Exception:
             return ChangeProfileResult(is_successful=False, code=CommonCode.FAIL_DELETE_PROFILE)
-        finally:
-            if connection:
-                connection.close()
 
     def find_all_profile(self, sql: str) -> AllDBProfileResult:
         """
         전달받은 쿼리를 실행하여 모든 DB 연결 정보를 조회합니다.
         """
-        db_path = get_db_path()
-        connection = None
         try:
-            connection = sqlite3.connect(db_path)
-            connection.row_factory = sqlite3.Row
-            cursor = connection.cursor()
-            cursor.execute(sql)
-            rows = cursor.fetchall()
+            with local_storage.connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(sql)
+                rows = cursor.fetchall()
             profiles = [DBProfile(**row) for row in rows]
             return AllDBProfileResult(is_successful=True, code=CommonCode.SUCCESS_FIND_PROFILE, profiles=profiles)
         except sqlite3.Error:
             return AllDBProfileResult(is_successful=False, code=CommonCode.FAIL_FIND_PROFILE)
         except Exception:
             return AllDBProfileResult(is_successful=False, code=CommonCode.FAIL_FIND_PROFILE)
-        finally:
-            if connection:
-                connection.close()
 
     def find_profile(self, sql: str, data: tuple) -> AllDBProfileInfo:
         """
         전달받은 쿼리를 실행하여 특정 DB 연결 정보를 조회합니다.
         """
-        db_path = get_db_path()
-        connection = None
         try:
-            connection = sqlite3.connect(db_path)
-            connection.row_factory = sqlite3.Row
-            cursor = connection.cursor()
-            cursor.execute(sql, data)
-            row = cursor.fetchone()
+            with local_storage.connection() as connection:
+                cursor = connection.cursor()
+                cursor.execute(sql, data)
+                row = cursor.fetchone()
 
             if not row:
                 raise APIException(CommonCode.NO_DB_PROFILE_FOUND)
@@ -162,9 +185,53 @@ class UserDbRepository:
             raise APIException(CommonCode.FAIL_FIND_PROFILE) from e
         except Exception as e:
             raise APIException(CommonCode.FAIL) from e
+
+    # ─────────────────────────────
+    # 스키마 지문(fingerprint) 조회
+    # ─────────────────────────────
+    def find_schema_fingerprint(
+        self, driver_module: Any, db_type: str, schema_names: list[str] | None = None, **kwargs: Any
+    ) -> str | None:
+        """
+        카탈로그 변경 여부를 판단할 수 있는 가벼운 지문 문자열을 조회합니다.
+        - 스키마 구조(테이블/컬럼/기본값/제약조건/FK/인덱스/코멘트)가 바뀌면 값이 달라집니다.
+        - `schema_names`는 Oracle(소유자 하나)과 MySQL/MariaDB 에서 집계 범위를 좁히는 데 사용합니다.
+          MySQL/MariaDB 에서 지정하지 않으면 시스템 스키마를 뺀 전체 스키마를 집계합니다.
+        - 지원하지 않는 DB이거나 조회에 실패하면 None을 반환합니다. (캐시를 사용하지 않음)
+        """
+        db_type = db_type.lower()
+        if db_type not in FINGERPRINT_QUERIES:
+            return None
+
+        connection = None
+        try:
+            connection = user_db_pool.acquire(driver_module, self._connect, **kwargs)
+            cursor = connection.cursor()
+            if db_type == DBTypesEnum.oracle.name:
+                owner = schema_names[0].upper() if schema_names else None
+                cursor.execute(FINGERPRINT_QUERIES[db_type], {"owner": owner})
+            elif db_type in (DBTypesEnum.mysql.name, DBTypesEnum.mariadb.name):
+                cursor.execute(*self._mysql_fingerprint_query(FINGERPRINT_QUERIES[db_type], schema_names))
+            else:
+                cursor.execute(FINGERPRINT_QUERIES[db_type])
+            row = cursor.fetchone()
+            return ":".join("" if value is None else str(value) for value in row) if row else None
+        except Exception as e:
+            logging.warning(f"Failed to read schema fingerprint for {db_type}: {e}")
+            return None
         finally:
             if connection:
-                connection.close()
+                user_db_pool.release(connection)
+
+    def _mysql_fingerprint_query(self, template: str, schema_names: list[str] | None) -> tuple[str, tuple]:
+        """지문 쿼리의 `{schema_filter}` 자리에 스키마 조건을 채우고, 쿼리와 바인딩 값을 반환합니다."""
+        if schema_names:
+            schema_filter = f"s.table_schema IN ({', '.join('%s' for _ in schema_names)})"
+            params = tuple(schema_names)
+        else:
+            schema_filter = f"s.table_schema NOT IN ({', '.join('%s' for _ in MYSQL_SYSTEM_SCHEMAS)})"
+            params = MYSQL_SYSTEM_SCHEMAS
+        return template.format(schema_filter=schema_filter), params * template.count("{schema_filter}")
 
     # ─────────────────────────────
     # 데이터베이스 조회
@@ -175,7 +242,7 @@ class UserDbRepository:
         connection = None
         logging.info(f"Attempting to find databases for db_type: '{db_type}' with connection args: {kwargs}")
         try:
-            connection = self._connect(driver_module, **kwargs)
+            connection = user_db_pool.acquire(driver_module, self._connect, **kwargs)
             cursor = connection.cursor()
 
             if not database_query:
@@ -203,7 +270,7 @@ class UserDbRepository:
             return DatabaseListResult(is_successful=False, code=CommonCode.FAIL_FIND_DATABASES, databases=[])
         finally:
             if connection:
-                connection.close()
+                user_db_pool.release(connection)
 
     # ─────────────────────────────
     # 스키마 조회
@@ -211,7 +278,7 @@ class UserDbRepository:
     def find_schemas(self, driver_module: Any, schema_query: str, **kwargs: Any) -> SchemaListResult:
         connection = None
         try:
-            connection = self._connect(driver_module, **kwargs)
+            connection = user_db_pool.acquire(driver_module, self._connect, **kwargs)
             cursor = connection.cursor()
 
             if not schema_query:
@@ -225,7 +292,7 @@ class UserDbRepository:
             return SchemaListResult(is_successful=False, code=CommonCode.FAIL_FIND_SCHEMAS, schemas=[])
         finally:
             if connection:
-                connection.close()
+                user_db_pool.release(connection)
 
     # ─────────────────────────────
     # 테이블 조회
@@ -233,7 +300,7 @@ class UserDbRepository:
     def find_tables(self, driver_module: Any, table_query: str, schema_name: str, **kwargs: Any) -> TableListResult:
         connection = None
         try:
-            connection = self._connect(driver_module, **kwargs)
+            connection = user_db_pool.acquire(driver_module, self._connect, **kwargs)
             cursor = connection.cursor()
 
             if "%s" in table_query or "?" in table_query:
@@ -250,7 +317,7 @@ class UserDbRepository:
             return TableListResult(is_successful=False, code=CommonCode.FAIL_FIND_TABLES, tables=[])
         finally:
             if connection:
-                connection.close()
+                user_db_pool.release(connection)
 
     # ─────────────────────────────
     # 컬럼 조회
@@ -260,7 +327,7 @@ class UserDbRepository:
     ) -> ColumnListResult:
         connection = None
         try:
-            connection = self._connect(driver_module, **kwargs)
+            connection = user_db_pool.acquire(driver_module, self._connect, **kwargs)
             cursor = connection.cursor()
 
             columns = []
@@ -286,7 +353,7 @@ class UserDbRepository:
             return ColumnListResult(is_successful=False, code=CommonCode.FAIL_FIND_COLUMNS, columns=[])
         finally:
             if connection:
-                connection.close()
+                user_db_pool.release(connection)
 
     def _find_columns_for_sqlite(self, cursor: Any, table_name: str) -> list[ColumnInfo]:
         pragma_sql = f"PRAGMA table_info('{table_name}')"
@@ -409,25 +476,10 @@ class UserDbRepository:
                     ordinal_position,
                 ) = c
 
-                if data_type in ["VARCHAR2", "NVARCHAR2", "CHAR", "RAW"]:
-                    full_type = f"{data_type}({length})"
-                elif data_type == "NUMBER":
-                    if precision is not None and scale is not None:
-                        if precision == 38 and scale == 0:
-                            full_type = "NUMBER"
-                        else:
-                            full_type = f"NUMBER({precision}, {scale})"
-                    elif precision is not None:
-                        full_type = f"NUMBER({precision})"
-                    else:
-                        full_type = "NUMBER"
-                else:
-                    full_type = data_type
-
                 columns.append(
                     ColumnInfo(
                         name=name,
-                        type=full_type,
+                        type=format_oracle_type(data_type, length, precision, scale),
                         nullable=(nullable == "Y"),
                         default=str(default).strip() if default is not None else None,
                         comment=comment,
@@ -489,7 +541,7 @@ class UserDbRepository:
         """
         connection = None
         try:
-            connection = self._connect(driver_module, **kwargs)
+            connection = user_db_pool.acquire(driver_module, self._connect, **kwargs)
             cursor = connection.cursor()
             db_type_lower = db_type.lower()
 
@@ -502,7 +554,7 @@ class UserDbRepository:
             return []
         finally:
             if connection:
-                connection.close()
+                user_db_pool.release(connection)
 
     def _find_constraints_for_sqlite(self, cursor: Any, table_name: str) -> list[ConstraintInfo]:
         constraints = []
@@ -684,7 +736,7 @@ class UserDbRepository:
         """
         connection = None
         try:
-            connection = self._connect(driver_module, **kwargs)
+            connection = user_db_pool.acquire(driver_module, self._connect, **kwargs)
             cursor = connection.cursor()
             db_type_lower = db_type.lower()
 
@@ -697,7 +749,7 @@ class UserDbRepository:
             return []
         finally:
             if connection:
-                connection.close()
+                user_db_pool.release(connection)
 
     def _find_indexes_for_sqlite(self, cursor: Any, table_name: str) -> list[IndexInfo]:
         indexes = []
@@ -811,7 +863,7 @@ class UserDbRepository:
         """
         connection = None
         try:
-            connection = self._connect(driver_module, **kwargs)
+            connection = user_db_pool.acquire(driver_module, self._connect, **kwargs)
             cursor = connection.cursor()
 
             if db_type == DBTypesEnum.sqlite.name:
@@ -823,7 +875,7 @@ class UserDbRepository:
             return {table_name: [] for table_name in table_names}
         finally:
             if connection:
-                connection.close()
+                user_db_pool.release(connection)
 
     def _find_sample_rows_for_sqlite(self, cursor: Any, table_names: list[str]) -> dict[str, list[dict[str, Any]]]:
         sample_rows_map = {}
@@ -875,16 +927,7 @@ class UserDbRepository:
     # DB 연결 메서드
     # ─────────────────────────────
     def _connect(self, driver_module: Any, **kwargs):
-        if driver_module is oracledb:
-            if kwargs.get("user", "").lower() == "sys":
-                kwargs["mode"] = oracledb.AUTH_MODE_SYSDBA
-            return driver_module.connect(**kwargs)
-        elif "connection_string" in kwargs:
-            return driver_module.connect(kwargs["connection_string"])
-        elif "db_name" in kwargs:
-            return driver_module.connect(kwargs["db_name"])
-        else:
-            return driver_module.connect(**kwargs)
+        return open_connection(driver_module, **kwargs)
 
 
 user_db_repository = UserDbRepository()
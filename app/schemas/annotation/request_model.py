@@ -7,6 +7,10 @@ class AnnotationCreateRequest(RequestBase):
     """어노테이션 생성 요청 스키마"""
 
     db_profile_id: str = Field(..., description="어노테이션을 생성할 DB 프로필의 고유 ID")
+    incremental: bool = Field(
+        False,
+        description="기존 어노테이션과 비교해 새로 생기거나 바뀐 테이블만 AI에 요청하고 나머지 설명은 유지할지 여부",
+    )
 
     def validate(self):
         self.validate_required_fields(["db_profile_id"])
@@ -2,6 +2,7 @@ from datetime import datetime
 
 from pydantic import BaseModel, Field
 
+from app.core.enum.annotation_job import AnnotationJobPhaseEnum, AnnotationJobStatusEnum
 from app.schemas.annotation.base_model import AnnotationBase
 
 
@@ -62,3 +63,19 @@ class AnnotationDeleteResponse(BaseModel):
 
     id: str = Field(..., description="삭제된 어노테이션의 고유 ID")
     message: str = Field("성공적으로 삭제되었습니다.", description="삭제 결과 메시지")
+
+
+class AnnotationJobResponse(AnnotationBase):
+    """백그라운드 어노테이션 생성 작업 상태 응답 스키마"""
+
+    db_profile_id: str = Field(..., description="DB 프로필의 고유 ID")
+    status: AnnotationJobStatusEnum = Field(..., description="작업 상태")
+    phase: AnnotationJobPhaseEnum | None = Field(None, description="진행 중(또는 마지막으로 진행한) 단계")
+    incremental: bool = Field(False, description="바뀐 테이블만 다시 요청하는 증분 작업 여부")
+    progress: int = Field(0, description="진행률(%)")
+    message: str | None = Field(None, description="진행 상황 메시지")
+    annotation_id: str | None = Field(None, description="생성된 어노테이션의 고유 ID (성공 시)")
+    error_code: str | None = Field(None, description="실패 코드 (실패 시)")
+    error_message: str | None = Field(None, description="실패 사유 (실패 시)")
+    started_at: datetime | None = Field(None, description="실행 시작 시각")
+    finished_at: datetime | None = Field(None, description="실행 종료 시각")
@@ -23,6 +23,7 @@ class QueryInfo(BaseModel):
     user_db_id: str = Field(..., description="DB Key")
     database: str | None = Field(None, description="database 명")
     query_text: str | None = Field(None, description="쿼리 내용")
+    handle_id: str | None = Field(None, description="실행 중 취소에 사용할 Key (클라이언트가 지정, 선택)")
 
     @model_validator(mode="after")
     def validate_required_fields(self) -> "QueryInfo":
@@ -1,9 +1,11 @@
 # app/schemas/user_db/result_model.py
 
+from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel, Field
 
+from app.core.enum.query_job_status import QueryJobStatusEnum
 from app.core.status import CommonCode
 
 
@@ -22,7 +24,7 @@ class ExecutionSelectResult(BasicResult):
 class ExecutionResult(BasicResult):
     """DB 결과를 위한 확장 모델"""
 
-    data: str = Field(..., description="쿼리 수행 후 결과")
+    data: int | str = Field(..., description="쿼리 수행 후 결과 (영향받은 행 수 등)")
 
 
 class InsertLocalDBResult(BasicResult):
@@ -41,3 +43,81 @@ class QueryTestResult(BasicResult):
     """DB Test 결과를 위한 확장 모델"""
 
     data: Any = Field(..., description="쿼리 수행 결과")
+
+
+class QuerySessionPage(BaseModel):
+    """결과 세션에서 읽은 한 페이지"""
+
+    session_id: str | None = Field(None, description="다음 페이지 조회에 사용할 세션 Key (더 읽을 행이 없으면 None)")
+    columns: list[str] = Field([], description="컬럼 목록")
+    data: list[dict] = Field([], description="페이지에 포함된 행 목록")
+    offset: int = Field(..., description="페이지 첫 행의 위치 (0부터 시작)")
+    has_more: bool = Field(..., description="다음 페이지 존재 여부")
+
+
+class QueryJob(BaseModel):
+    """비동기 쿼리 실행 작업의 상태 (완료되면 결과 포함)"""
+
+    job_id: str = Field(..., description="작업 Key (실행 취소 Key로도 사용)")
+    status: QueryJobStatusEnum = Field(..., description="작업 상태")
+    submitted_at: datetime = Field(..., description="요청 시각")
+    started_at: datetime | None = Field(None, description="실행 시작 시각")
+    finished_at: datetime | None = Field(None, description="실행 종료 시각")
+    code: str | None = Field(None, description="실행 결과 코드 (완료 후)")
+    message: str | None = Field(None, description="실행 결과 메시지 (완료 후)")
+    result: dict | int | str | None = Field(None, description="실행 결과 (성공 시)")
+
+
+class StatementResult(BaseModel):
+    """스크립트를 구성하는 문장 하나의 실행 결과"""
+
+    index: int = Field(..., description="스크립트 안에서의 순서 (0부터 시작)")
+    statement: str = Field(..., description="실행한 문장")
+    keyword: str = Field(..., description="문장 종류 (SELECT, INSERT 등)")
+    row_count: int | None = Field(None, description="조회/영향받은 행 수 (드라이버가 알려주지 않으면 None)")
+    columns: list[str] | None = Field(None, description="결과 컬럼 목록 (결과 행을 반환하는 문장만)")
+    data: list | None = Field(None, description="결과 행 목록 (결과 행을 반환하는 문장만)")
+    elapsed_ms: float = Field(..., description="실행 시간(ms)")
+
+
+class ScriptResult(BaseModel):
+    """스크립트 실행 결과"""
+
+    statements: list[StatementResult] = Field([], description="실행을 마친 문장별 결과")
+    is_committed: bool = Field(..., description="커밋 여부 (한 문장이라도 실패하면 전체를 롤백합니다)")
+    failed_index: int | None = Field(None, description="실패한 문장의 순서")
+    error: str | None = Field(None, description="실패한 문장의 오류 메시지")
+    elapsed_ms: float = Field(..., description="전체 실행 시간(ms)")
+
+
+class ExecutionScriptResult(BasicResult):
+    """스크립트 실행 결과를 위한 확장 모델"""
+
+    data: ScriptResult = Field(..., description="스크립트 실행 결과")
+
+
+class PlanNode(BaseModel):
+    """실행 계획의 연산 하나 (DB 종류와 관계없이 같은 형태로 정규화)"""
+
+    operation: str = Field(..., description="연산 이름 (예: Seq Scan, SEARCH, TABLE ACCESS FULL)")
+    object_name: str | None = Field(None, description="대상 테이블/인덱스 이름")
+    detail: str | None = Field(None, description="부가 정보 (접근 방식, 인덱스, 조건 등)")
+    estimated_rows: float | None = Field(None, description="예상 행 수 (DB가 제공하지 않으면 None)")
+    estimated_cost: float | None = Field(None, description="예상 비용 (하위 연산 포함, DB마다 단위가 다름)")
+    children: list["PlanNode"] = Field([], description="하위 연산 목록")
+
+
+class QueryPlan(BaseModel):
+    """쿼리 실행 계획"""
+
+    db_type: str = Field(..., description="DB 종류")
+    root: PlanNode | None = Field(None, description="최상위 연산")
+    estimated_rows: float | None = Field(None, description="쿼리 전체의 예상 행 수")
+    estimated_cost: float | None = Field(None, description="쿼리 전체의 예상 비용")
+    raw: Any = Field(None, description="DB가 반환한 원본 실행 계획")
+
+
+class QueryPlanResult(BasicResult):
+    """실행 계획 조회 결과를 위한 확장 모델 (실패 시 오류 메시지)"""
+
+    data: QueryPlan | str = Field(..., description="실행 계획 또는 오류 메시지")
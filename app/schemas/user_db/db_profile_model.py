@@ -58,11 +58,13 @@ class UpdateOrCreateDBProfile(DBProfileInfo):
     id: str | None = Field(None, description="DB Key 값")
     view_name: str | None = Field(None, description="DB 노출명")
     annotation_id: str | None = Field(None, description="연결된 어노테이션 ID")
+    query_timeout_sec: int | None = Field(None, ge=0, description="쿼리 제한 시간(초), 0이면 무제한, 없으면 기본값")
 
 
 class AllDBProfileInfo(DBProfileInfo):
     id: str | None = Field(..., description="DB Key 값")
     view_name: str | None = Field(None, description="DB 노출명")
     annotation_id: str | None = Field(None, description="연결된 어노테이션 ID")
+    query_timeout_sec: int | None = Field(None, description="쿼리 제한 시간(초), 0이면 무제한, 없으면 기본값")
     created_at: datetime = Field(..., description="profile 저장일")
     updated_at: datetime = Field(..., description="profile 수정일")
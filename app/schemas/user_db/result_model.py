@@ -33,6 +33,7 @@ class DBProfile(BaseModel):
     username: str | None
     view_name: str | None
     annotation_id: str | None = None
+    query_timeout_sec: int | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -132,3 +133,31 @@ class DBDetail(BaseModel):
     db_name: str | None = Field(None, description="데이터베이스 이름")
     db_type: str = Field(..., description="데이터베이스 종류")
     schemas: list[SchemaDetail] = Field([], description="스키마 목록")
+
+
+# ─────────────────────────────
+# 증분 스키마 재조회를 위한 모델
+# ─────────────────────────────
+
+
+class SchemaChangeSet(BaseModel):
+    """직전 스냅샷과 비교한 스키마 단위 테이블 변경 내역"""
+
+    db_name: str = Field(..., description="데이터베이스 이름")
+    schema_name: str = Field(..., description="스키마 이름")
+    added: list[str] = Field([], description="새로 생긴 테이블 목록")
+    altered: list[str] = Field([], description="정의가 바뀐 테이블 목록")
+    removed: list[str] = Field([], description="삭제된 테이블 목록")
+    unchanged: list[str] = Field([], description="바뀌지 않은 테이블 목록")
+    fingerprints: dict[str, str] = Field({}, description="현재 테이블별 DDL 지문 (지문을 조회할 수 없으면 비어 있음)")
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.altered or self.removed)
+
+
+class SchemaRescanResult(BaseModel):
+    """증분 재조회 결과 (현재 전체 테이블 정보와 변경 내역)"""
+
+    tables: list[TableInfo] = Field([], description="현재 테이블 상세 정보 목록")
+    changes: list[SchemaChangeSet] = Field([], description="스키마별 변경 내역")
@@ -0,0 +1,80 @@
+# app/services/annotation_cache.py
+import hashlib
+import json
+from typing import Any
+
+from app.schemas.annotation.ai_model import AIAnnotationRequest, AIRelationship, AITableInfo
+
+
+def table_hashes(request: AIAnnotationRequest) -> dict[str, str]:
+    """요청에 담긴 테이블별 정의 해시를 {테이블 이름: 해시} 형태로 반환합니다."""
+    database = request.databases[0]
+    return {
+        table.table_name: _table_hash(
+            request.dbms_type, table, [rel for rel in database.relationships if rel.from_table == table.table_name]
+        )
+        for table in database.tables
+    }
+
+
+def without_tables(request: AIAnnotationRequest, names: set[str]) -> AIAnnotationRequest:
+    """캐시에서 찾은 테이블과, 그 테이블에서 시작하는 관계를 요청에서 제외합니다."""
+    database = request.databases[0]
+    remaining = database.model_copy(
+        update={
+            "tables": [table for table in database.tables if table.table_name not in names],
+            "relationships": [rel for rel in database.relationships if rel.from_table not in names],
+        }
+    )
+    return request.model_copy(update={"databases": [remaining]})
+
+
+def cache_entries(hashes: dict[str, str], ai_response: dict[str, Any]) -> list[tuple[str, str, str]]:
+    """AI 응답에서 테이블별 캐시 항목 (해시, 테이블 이름, payload)을 만듭니다. 요청에 없던 테이블은 제외합니다."""
+    db_data = (ai_response.get("databases") or [{}])[0]
+    relationships = db_data.get("relationships", [])
+    entries = []
+    for tbl_data in db_data.get("tables", []):
+        name = tbl_data.get("table_name")
+        if name not in hashes:
+            continue
+        payload = {"table": tbl_data, "relationships": [rel for rel in relationships if rel.get("from_table") == name]}
+        entries.append((hashes[name], name, json.dumps(payload, ensure_ascii=False)))
+    return entries
+
+
+def merge_cached(cached_payloads: list[str], ai_response: dict[str, Any]) -> dict[str, Any]:
+    """캐시에서 찾은 테이블/관계 설명을 AI 응답에 합칩니다."""
+    db_data = (ai_response.get("databases") or [{}])[0]
+    tables = list(db_data.get("tables", []))
+    relationships = list(db_data.get("relationships", []))
+    for payload in cached_payloads:
+        entry = json.loads(payload)
+        tables.append(entry["table"])
+        relationships.extend(entry["relationships"])
+    return {
+        "databases": [{"description": db_data.get("description"), "tables": tables, "relationships": relationships}]
+    }
+
+
+def _table_hash(dbms_type: str, table: AITableInfo, relationships: list[AIRelationship]) -> str:
+    """
+    테이블 정의를 정규화한 JSON 의 SHA-256 해시입니다.
+    컬럼/제약 조건/인덱스/FK 는 순서와 무관하게 정렬하며, 샘플 데이터는 값 대신 형태(컬럼 구성)만 반영합니다.
+    """
+    sample_columns = sorted({key for row in table.sample_rows for key in row})
+    canonical = {
+        "dbms_type": dbms_type,
+        "table_name": table.table_name,
+        "columns": sorted((col.model_dump() for col in table.columns), key=lambda col: col["column_name"]),
+        "constraints": sorted((const.model_dump() for const in table.constraints), key=_sort_key),
+        "indexes": sorted((idx.model_dump() for idx in table.indexes), key=_sort_key),
+        "relationships": sorted((rel.model_dump() for rel in relationships), key=_sort_key),
+        "sample_shape": {"has_rows": bool(table.sample_rows), "columns": sample_columns},
+    }
+    encoded = json.dumps(canonical, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _sort_key(item: dict[str, Any]) -> str:
+    return json.dumps(item, sort_keys=True, default=str)
@@ -0,0 +1,166 @@
+# app/services/annotation_chunk_planner.py
+from collections import deque
+from typing import Any, NamedTuple
+
+from app.core.utils import get_env_number
+from app.schemas.annotation.ai_model import AIAnnotationRequest, AIDatabaseInfo, AITableInfo
+
+# AI 요청 하나에 담을 스키마 정보의 최대 크기(바이트, JSON 직렬화 기준). 대략 4바이트가 토큰 하나입니다.
+# ENV_ANNOTATION_CHUNK_MAX_BYTES 로 덮어씁니다.
+DEFAULT_CHUNK_MAX_BYTES = 200 * 1024
+
+RelationshipKey = tuple[str | None, tuple[str, ...], str | None, tuple[str, ...]]
+
+
+class AnnotationChunk(NamedTuple):
+    """AI 서버에 한 번에 보낼 요청과, 이 요청의 응답에서 설명을 채택할 테이블 목록"""
+
+    request: AIAnnotationRequest
+    owned_tables: frozenset[str]
+
+
+def plan_chunks(request: AIAnnotationRequest, max_bytes: int | None = None) -> list[AnnotationChunk]:
+    """
+    어노테이션 요청을 `max_bytes` 이하의 요청 여러 개로 나눕니다. 전체가 한도 안이면 원래 요청 하나를 반환합니다.
+    `max_bytes`를 지정하지 않으면 ENV_ANNOTATION_CHUNK_MAX_BYTES 또는 기본값을 사용합니다.
+    1. FK로 연결된 테이블끼리 묶고, 묶음이 한도를 넘으면 FK를 따라가는 순서(BFS)로 잘라 인접한 테이블이 함께 가도록 합니다.
+    2. 작은 묶음은 큰 묶음부터 한도 안에서 하나의 요청으로 합칩니다.
+    3. 다른 요청의 테이블을 참조하는 FK는 시작 테이블의 요청에 넣고, 대상 테이블은 컬럼 정보만 함께 보냅니다.
+       (이 경우 요청이 한도를 조금 넘을 수 있습니다)
+    한 테이블이 한도를 넘으면 샘플 데이터를 줄여 한도에 맞춥니다.
+    """
+    if max_bytes is None:
+        max_bytes = get_env_number("ENV_ANNOTATION_CHUNK_MAX_BYTES", int, DEFAULT_CHUNK_MAX_BYTES)
+    database = request.databases[0]
+    tables = {table.table_name: _fit_table(table, max_bytes) for table in database.tables}
+    if _size(database) <= max_bytes:
+        return [AnnotationChunk(request, frozenset(tables))]
+
+    sizes = {name: _size(table) for name, table in tables.items()}
+    graph: dict[str, set[str]] = {name: set() for name in tables}
+    for rel in database.relationships:
+        if rel.from_table in graph and rel.to_table in graph and rel.from_table != rel.to_table:
+            graph[rel.from_table].add(rel.to_table)
+            graph[rel.to_table].add(rel.from_table)
+
+    clusters = [
+        piece
+        for component in _connected_components(list(tables), graph)
+        for piece in _split(component, sizes, max_bytes)
+    ]
+    return [_build_chunk(request, database, tables, group) for group in _pack(clusters, sizes, max_bytes)]
+
+
+def merge_responses(chunks: list[AnnotationChunk], responses: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    요청별 AI 응답을 하나의 응답으로 합칩니다.
+    - 테이블 설명은 해당 테이블을 담당한 요청의 응답에서만 채택합니다. (컬럼 정보만 보낸 참조 테이블은 제외)
+    - 관계(FK) 설명은 (시작 테이블, 컬럼, 대상 테이블, 컬럼) 기준으로 처음 받은 설명을 채택합니다.
+    - 데이터베이스 설명은 처음으로 비어 있지 않은 설명을 채택합니다.
+    """
+    if len(chunks) == 1:
+        return responses[0]
+
+    description = None
+    tables: list[dict[str, Any]] = []
+    relationships: dict[RelationshipKey, dict[str, Any]] = {}
+    for chunk, response in zip(chunks, responses, strict=True):
+        db_data = (response.get("databases") or [{}])[0]
+        description = description or db_data.get("description")
+        tables.extend(tbl for tbl in db_data.get("tables", []) if tbl.get("table_name") in chunk.owned_tables)
+        for rel in db_data.get("relationships", []):
+            relationships.setdefault(_relationship_key(rel), rel)
+
+    return {
+        "databases": [{"description": description, "tables": tables, "relationships": list(relationships.values())}]
+    }
+
+
+def _size(model: AITableInfo | AIDatabaseInfo) -> int:
+    return len(model.model_dump_json().encode())
+
+
+def _fit_table(table: AITableInfo, max_bytes: int) -> AITableInfo:
+    """테이블 정보가 한도를 넘으면 한도 안에 들어올 때까지 샘플 데이터를 절반씩 줄입니다."""
+    while table.sample_rows and _size(table) > max_bytes:
+        table = table.model_copy(update={"sample_rows": table.sample_rows[: len(table.sample_rows) // 2]})
+    return table
+
+
+def _connected_components(names: list[str], graph: dict[str, set[str]]) -> list[list[str]]:
+    """FK로 연결된 테이블 묶음을 BFS 순서로 반환합니다. (입력 순서를 유지하여 결과가 항상 같도록)"""
+    order = {name: index for index, name in enumerate(names)}
+    visited: set[str] = set()
+    components = []
+    for start in names:
+        if start in visited:
+            continue
+        visited.add(start)
+        component, queue = [], deque([start])
+        while queue:
+            name = queue.popleft()
+            component.append(name)
+            for neighbor in sorted(graph[name] - visited, key=order.__getitem__):
+                visited.add(neighbor)
+                queue.append(neighbor)
+        components.append(component)
+    return components
+
+
+def _split(component: list[str], sizes: dict[str, int], max_bytes: int) -> list[list[str]]:
+    """한도를 넘는 묶음을 BFS 순서대로 잘라 한도 안의 묶음들로 나눕니다."""
+    pieces: list[list[str]] = []
+    current: list[str] = []
+    current_size = 0
+    for name in component:
+        if current and current_size + sizes[name] > max_bytes:
+            pieces.append(current)
+            current, current_size = [], 0
+        current.append(name)
+        current_size += sizes[name]
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _pack(clusters: list[list[str]], sizes: dict[str, int], max_bytes: int) -> list[list[str]]:
+    """묶음들을 큰 것부터 first-fit 으로 한도 안의 요청 단위로 합칩니다."""
+    groups: list[list[str]] = []
+    remaining: list[int] = []
+    for cluster in sorted(clusters, key=lambda c: sum(sizes[name] for name in c), reverse=True):
+        cluster_size = sum(sizes[name] for name in cluster)
+        index = next((i for i, space in enumerate(remaining) if cluster_size <= space), None)
+        if index is None:
+            groups.append(list(cluster))
+            remaining.append(max_bytes - cluster_size)
+        else:
+            groups[index].extend(cluster)
+            remaining[index] -= cluster_size
+    return groups
+
+
+def _build_chunk(
+    request: AIAnnotationRequest, database: AIDatabaseInfo, tables: dict[str, AITableInfo], group: list[str]
+) -> AnnotationChunk:
+    owned = frozenset(group)
+    relationships = [rel for rel in database.relationships if rel.from_table in owned]
+    referenced = []
+    for rel in relationships:
+        if rel.to_table not in owned and rel.to_table in tables and rel.to_table not in referenced:
+            referenced.append(rel.to_table)
+
+    chunk_tables = [table for name, table in tables.items() if name in owned]
+    chunk_tables.extend(AITableInfo(table_name=name, columns=tables[name].columns) for name in referenced)
+    chunk_database = AIDatabaseInfo(
+        database_name=database.database_name, tables=chunk_tables, relationships=relationships
+    )
+    return AnnotationChunk(request.model_copy(update={"databases": [chunk_database]}), owned)
+
+
+def _relationship_key(rel: dict[str, Any]) -> RelationshipKey:
+    return (
+        rel.get("from_table"),
+        tuple(rel.get("from_columns") or []),
+        rel.get("to_table"),
+        tuple(rel.get("to_columns") or []),
+    )
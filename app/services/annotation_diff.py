@@ -0,0 +1,110 @@
+# app/services/annotation_diff.py
+from typing import Any, NamedTuple
+
+from app.core.enum.constraint_type import ConstraintTypeEnum
+from app.schemas.annotation.response_model import FullAnnotationResponse, TableAnnotationDetail
+from app.schemas.user_db.result_model import TableInfo
+
+
+class ReannotationPlan(NamedTuple):
+    """
+    기존 어노테이션과 현재 스키마를 비교한 결과입니다.
+    - changed_tables: 새로 생겼거나 정의가 바뀌어 AI에 다시 요청할 테이블
+    - unchanged_tables: 기존 설명을 그대로 사용할 테이블 이름
+    - removed_tables: 기존 어노테이션에만 있는(삭제된) 테이블 이름
+    - carried_response: 바뀌지 않은 테이블의 기존 설명을 AI 응답과 같은 형태로 옮겨 둔 것
+    """
+
+    changed_tables: list[TableInfo]
+    unchanged_tables: list[str]
+    removed_tables: list[str]
+    carried_response: dict[str, Any]
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.changed_tables or self.removed_tables)
+
+
+def plan_reannotation(full_schema_info: list[TableInfo], previous: FullAnnotationResponse) -> ReannotationPlan:
+    """
+    현재 스키마를 기존 어노테이션 트리와 테이블/컬럼의 이름과 타입 기준으로 비교합니다.
+    새 테이블이거나 컬럼(이름, 타입) 구성이 달라진 테이블만 AI에 다시 요청할 대상으로 분류합니다.
+    바뀌지 않은 테이블의 제약 조건/인덱스는 저장 시 현재 스키마로 다시 만들어지며, 기존 FK 설명은 컬럼 기준으로 옮겨 둡니다.
+    """
+    previous_tables = {table.table_name: table for table in previous.tables}
+    changed, unchanged = [], []
+    carried_tables, carried_relationships = [], []
+    for table in full_schema_info:
+        annotated = previous_tables.get(table.name)
+        if annotated is None or _column_signature(table) != _annotated_column_signature(annotated):
+            changed.append(table)
+            continue
+        unchanged.append(table.name)
+        carried_tables.append(_carry_table(table, annotated))
+        carried_relationships.extend(_carry_relationships(table, annotated))
+
+    current_names = {table.name for table in full_schema_info}
+    removed = [name for name in previous_tables if name not in current_names]
+    carried_response = {
+        "databases": [
+            {"description": previous.description, "tables": carried_tables, "relationships": carried_relationships}
+        ]
+    }
+    return ReannotationPlan(changed, unchanged, removed, carried_response)
+
+
+def merge_carried(plan: ReannotationPlan, ai_response: dict[str, Any] | None) -> dict[str, Any]:
+    """바뀐 테이블에 대한 AI 응답과 기존 설명을 합쳐, 전체 테이블에 대한 하나의 응답으로 만듭니다."""
+    carried = plan.carried_response["databases"][0]
+    db_data = ((ai_response or {}).get("databases") or [{}])[0]
+    return {
+        "databases": [
+            {
+                "description": carried["description"] or db_data.get("description"),
+                "tables": carried["tables"] + db_data.get("tables", []),
+                "relationships": carried["relationships"] + db_data.get("relationships", []),
+            }
+        ]
+    }
+
+
+def _column_signature(table: TableInfo) -> frozenset[tuple[str, str]]:
+    return frozenset((col.name, col.type) for col in table.columns)
+
+
+def _annotated_column_signature(table: TableAnnotationDetail) -> frozenset[tuple[str, str | None]]:
+    return frozenset((col.column_name, col.data_type) for col in table.columns)
+
+
+def _carry_table(table: TableInfo, annotated: TableAnnotationDetail) -> dict[str, Any]:
+    return {
+        "table_name": annotated.table_name,
+        "description": annotated.description,
+        "columns": [{"column_name": col.column_name, "description": col.description} for col in annotated.columns],
+        # 인덱스는 응답에 이름이 있어야 저장되므로, 현재 스키마의 인덱스를 모두 옮겨 둡니다.
+        "indexes": [{"name": idx.name} for idx in table.indexes],
+    }
+
+
+def _carry_relationships(table: TableInfo, annotated: TableAnnotationDetail) -> list[dict[str, Any]]:
+    """FK 설명은 제약 조건에 저장되어 있으므로, 현재 스키마의 참조 정보와 합쳐 관계 설명으로 되돌립니다."""
+    descriptions = {
+        frozenset(const.columns): const.description
+        for const in annotated.constraints
+        if const.type == ConstraintTypeEnum.FOREIGN_KEY.value and const.description
+    }
+    relationships = []
+    for const in table.constraints:
+        description = descriptions.get(frozenset(const.columns))
+        if const.type != ConstraintTypeEnum.FOREIGN_KEY.value or description is None:
+            continue
+        relationships.append(
+            {
+                "from_table": table.name,
+                "from_columns": const.columns,
+                "to_table": const.referenced_table,
+                "to_columns": const.referenced_columns or [],
+                "description": description,
+            }
+        )
+    return relationships
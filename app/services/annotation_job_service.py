@@ -0,0 +1,170 @@
+# app/services/annotation_job_service.py
+
+import asyncio
+import json
+import logging
+from collections.abc import AsyncIterator
+from functools import partial
+
+from app.core.enum.annotation_job import AnnotationJobPhaseEnum
+from app.core.enum.db_key_prefix_name import DBSaveIdEnum
+from app.core.exceptions import APIException
+from app.core.executors import Workload, executors
+from app.core.status import CommonCode
+from app.core.utils import generate_prefixed_uuid
+from app.repository.annotation_job_repository import AnnotationJobRepository, annotation_job_repository
+from app.schemas.annotation.request_model import AnnotationCreateRequest
+from app.schemas.annotation.response_model import AnnotationJobResponse
+from app.schemas.user_db.db_profile_model import AllDBProfileInfo
+from app.schemas.user_db.result_model import TableInfo
+from app.services import annotation_diff
+from app.services.annotation_service import AnnotationService, annotation_service
+
+# SSE 로 작업 상태를 전달할 때 상태를 확인하는 간격(초)
+DEFAULT_WATCH_INTERVAL = 1.0
+
+
+class AnnotationJobService:
+    """
+    어노테이션 생성을 HTTP 요청과 분리된 작업 풀(Workload.ANNOTATION_JOB)에서 실행하고 상태를 로컬 DB에 기록합니다.
+    - 단계(스키마 조회 → 샘플 조회 → AI 요청 → 저장)마다 진행률을 갱신하며, 상태는 작업 Key로 조회합니다.
+    - 프로필당 동시에 하나의 작업만 실행하며, 이미 진행 중인 작업이 있으면 그 작업을 반환합니다.
+    - AI 응답은 받는 즉시 저장하므로, 실패/중단된 작업을 재개하면 AI 요청을 다시 보내지 않고 저장 단계부터 진행합니다.
+    - 증분 작업은 기존 어노테이션과 비교해 바뀐 테이블만 AI에 요청하고, 기존 설명과 합친 응답을 저장합니다.
+    """
+
+    def __init__(
+        self,
+        repository: AnnotationJobRepository = annotation_job_repository,
+        annotation_serv: AnnotationService = annotation_service,
+    ):
+        self.repository = repository
+        self.annotation_service = annotation_serv
+
+    def submit(self, request: AnnotationCreateRequest) -> AnnotationJobResponse:
+        """어노테이션 생성 작업을 등록하고 바로 반환합니다."""
+        try:
+            request.validate()
+        except ValueError as e:
+            raise APIException(CommonCode.INVALID_ANNOTATION_REQUEST, detail=str(e)) from e
+        self.annotation_service.user_db_service.find_profile(request.db_profile_id)
+
+        while True:
+            job_id = generate_prefixed_uuid(DBSaveIdEnum.annotation_job.value)
+            if self.repository.create_job(job_id, request.db_profile_id, request.incremental):
+                executors.submit(Workload.ANNOTATION_JOB, self._run, job_id)
+                return self.find_job(job_id)
+            # 진행 중인 작업이 그 사이에 끝났다면 다시 생성을 시도합니다.
+            active_job = self.repository.find_active_job(request.db_profile_id)
+            if active_job:
+                return active_job
+
+    def find_job(self, job_id: str) -> AnnotationJobResponse:
+        job = self.repository.find_job(job_id)
+        if job is None:
+            raise APIException(CommonCode.NO_ANNOTATION_JOB)
+        return job
+
+    def resume(self, job_id: str) -> AnnotationJobResponse:
+        """실패했거나 중단된 작업을 다시 실행합니다."""
+        job = self.find_job(job_id)
+        if not job.status.is_resumable:
+            raise APIException(CommonCode.ANNOTATION_JOB_NOT_RESUMABLE)
+
+        if self.repository.mark_pending(job_id):
+            executors.submit(Workload.ANNOTATION_JOB, self._run, job_id)
+            return self.find_job(job_id)
+        # 같은 프로필의 다른 작업(또는 동시에 재개된 이 작업)이 진행 중이면 그 작업을 반환합니다.
+        active_job = self.repository.find_active_job(job.db_profile_id)
+        if active_job:
+            return active_job
+        raise APIException(CommonCode.ANNOTATION_JOB_NOT_RESUMABLE)
+
+    async def watch(
+        self, job_id: str, interval: float = DEFAULT_WATCH_INTERVAL
+    ) -> AsyncIterator[AnnotationJobResponse]:
+        """작업 상태가 바뀔 때마다 반환합니다. 작업이 끝나면 종료합니다."""
+        last_state = None
+        while True:
+            job = await executors.run(Workload.LOCAL_STORAGE, self.find_job, job_id)
+            state = (job.status, job.phase, job.progress, job.message)
+            if state != last_state:
+                last_state = state
+                yield job
+            if job.status.is_finished:
+                return
+            await asyncio.sleep(interval)
+
+    def mark_interrupted_jobs(self) -> None:
+        """서버 시작 시 이전 실행에서 끝나지 못한 작업을 중단 상태로 표시합니다. (재개 요청으로 다시 실행)"""
+        count = self.repository.mark_unfinished_interrupted()
+        if count:
+            logging.warning(f"Marked {count} unfinished annotation jobs as interrupted.")
+
+    def _run(self, job_id: str) -> None:
+        job = self.repository.find_job(job_id)
+        if job is None:
+            return
+        self.repository.mark_running(job_id)
+        try:
+            annotation_id = self._run_phases(job)
+        except APIException as e:
+            logging.error(f"Annotation job {job_id} failed: {e.detail or e.message}")
+            self.repository.mark_failed(job_id, e.code_enum.code, e.detail or e.message)
+            return
+        except Exception as e:
+            logging.error(f"Annotation job {job_id} failed: {e}", exc_info=True)
+            self.repository.mark_failed(job_id, CommonCode.FAIL_CREATE_ANNOTATION.code, str(e))
+            return
+        self.repository.mark_succeeded(job_id, annotation_id, "어노테이션 생성을 완료했습니다.")
+
+    def _run_phases(self, job: AnnotationJobResponse) -> str:
+        user_db_service = self.annotation_service.user_db_service
+        db_profile = user_db_service.find_profile(job.db_profile_id)
+
+        self.repository.update_phase(job.id, AnnotationJobPhaseEnum.scan, "스키마 정보를 조회하고 있습니다.")
+        full_schema_info = user_db_service.get_full_schema_info(db_profile)
+
+        saved_response = self.repository.find_ai_response(job.id)
+        if saved_response is not None:
+            ai_response = json.loads(saved_response)
+            logging.info(f"Annotation job {job.id} resumed with the saved AI response.")
+        else:
+            plan = self.annotation_service.plan_reannotation(db_profile, full_schema_info) if job.incremental else None
+            if plan is not None and not plan.has_changes:
+                logging.info(f"Annotation job {job.id}: schema has not changed, keeping the existing annotation.")
+                return db_profile.annotation_id
+
+            target_tables = plan.changed_tables if plan is not None else full_schema_info
+            ai_response = self._request_ai(job.id, db_profile, target_tables) if target_tables else {}
+            if plan is not None:
+                # 기존 설명까지 합친 응답을 저장해 두어, 재개 시 비교를 다시 하지 않고 그대로 저장합니다.
+                ai_response = annotation_diff.merge_carried(plan, ai_response)
+            self.repository.save_ai_response(job.id, json.dumps(ai_response, ensure_ascii=False))
+
+        self.repository.update_phase(job.id, AnnotationJobPhaseEnum.persist, "어노테이션을 저장하고 있습니다.")
+        return self.annotation_service.save_annotation(ai_response, db_profile, full_schema_info)
+
+    def _request_ai(self, job_id: str, db_profile: AllDBProfileInfo, tables: list[TableInfo]) -> dict:
+        """샘플 데이터를 조회하고 AI 서버에 어노테이션을 요청합니다."""
+        self.repository.update_phase(
+            job_id, AnnotationJobPhaseEnum.sample, f"{len(tables)}개 테이블의 샘플 데이터를 조회하고 있습니다."
+        )
+        sample_rows = self.annotation_service.user_db_service.get_sample_rows(db_profile, tables)
+
+        self.repository.update_phase(job_id, AnnotationJobPhaseEnum.ai, "AI 서버에 어노테이션을 요청하고 있습니다.")
+        return asyncio.run(
+            self.annotation_service.request_ai_annotation(
+                db_profile, tables, sample_rows, on_progress=partial(self._report_ai_progress, job_id)
+            )
+        )
+
+    def _report_ai_progress(self, job_id: str, completed: int, total: int) -> None:
+        """AI 요청이 여러 개로 나뉜 경우, 끝난 요청 수에 비례해 AI 단계의 진행률을 갱신합니다."""
+        start = AnnotationJobPhaseEnum.ai.start_progress
+        end = AnnotationJobPhaseEnum.persist.start_progress
+        progress = start + (end - start) * completed // total
+        self.repository.update_progress(job_id, progress, f"AI 어노테이션 요청 {completed}/{total}개를 완료했습니다.")
+
+
+annotation_job_service = AnnotationJobService()
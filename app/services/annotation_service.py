@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import os
 import sqlite3
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
@@ -10,8 +12,11 @@ from fastapi import Depends
 from app.core.enum.constraint_type import ConstraintTypeEnum
 from app.core.enum.db_key_prefix_name import DBSaveIdEnum
 from app.core.exceptions import APIException
+from app.core.executors import Workload, executors
 from app.core.status import CommonCode
-from app.core.utils import generate_prefixed_uuid, get_db_path
+from app.core.utils import generate_prefixed_uuid, get_env_number
+from app.db.local_storage import local_storage
+from app.repository.annotation_cache_repository import AnnotationCacheRepository, annotation_cache_repository
 from app.repository.annotation_repository import AnnotationRepository, annotation_repository
 from app.schemas.annotation.ai_model import (
     AIAnnotationRequest,
@@ -36,14 +41,27 @@ from app.schemas.annotation.request_model import AnnotationCreateRequest
 from app.schemas.annotation.response_model import AnnotationDeleteResponse, FullAnnotationResponse
 from app.schemas.user_db.db_profile_model import AllDBProfileInfo
 from app.schemas.user_db.result_model import TableInfo as UserDBTableInfo
+from app.services import annotation_cache, annotation_chunk_planner, annotation_diff
+from app.services.annotation_chunk_planner import AnnotationChunk
+from app.services.annotation_diff import ReannotationPlan
 from app.services.user_db_service import UserDbService, user_db_service
 
 user_db_service_dependency = Depends(lambda: user_db_service)
 
+# 어노테이션 요청을 나눠 보낼 때 동시에 보내는 최대 요청 수. ENV_ANNOTATION_AI_CONCURRENCY 로 덮어씁니다.
+DEFAULT_AI_CONCURRENCY = 4
+# AI 서버 요청 실패(연결 오류, 429, 5xx) 시 재시도 횟수와 첫 재시도 대기 시간(초, 재시도마다 2배)
+# 재시도 횟수는 ENV_ANNOTATION_AI_MAX_RETRIES 로 덮어씁니다.
+DEFAULT_AI_MAX_RETRIES = 2
+AI_RETRY_BACKOFF_SEC = 1.0
+
 
 class AnnotationService:
     def __init__(
-        self, repository: AnnotationRepository = annotation_repository, user_db_serv: UserDbService = user_db_service
+        self,
+        repository: AnnotationRepository = annotation_repository,
+        user_db_serv: UserDbService = user_db_service,
+        cache_repository: AnnotationCacheRepository = annotation_cache_repository,
     ):
         """
         AnnotationService를 초기화합니다.
@@ -51,9 +69,11 @@ class AnnotationService:
         Args:
             repository (AnnotationRepository): 어노테이션 레포지토리 의존성 주입.
             user_db_serv (UserDbService): 사용자 DB 서비스 의존성 주입.
+            cache_repository (AnnotationCacheRepository): 테이블 단위 어노테이션 캐시 레포지토리 의존성 주입.
         """
         self.repository = repository
         self.user_db_service = user_db_serv
+        self.cache_repository = cache_repository
         self._ai_server_url = None
 
     def _get_ai_server_url(self) -> str:
@@ -73,6 +93,9 @@ class AnnotationService:
         2. AI 서버에 요청할 데이터 모델 생성
         3. AI 서버에 요청
         4. 트랜잭션 내에서 전체 어노테이션 정보 저장 및 DB 프로필 업데이트
+        `incremental` 요청이면 기존 어노테이션과 비교해 새로 생기거나 바뀐 테이블만 AI에 요청하고,
+        나머지 테이블의 설명은 그대로 옮겨 저장합니다. 바뀐 것이 없으면 기존 어노테이션을 그대로 반환합니다.
+        동기 방식의 DB 조회/저장은 이벤트 루프를 막지 않도록 작업 종류별 풀(LOCAL_STORAGE, CATALOG)에서 실행합니다.
         """
         logging.info(f"Starting annotation creation for db_profile_id: {request.db_profile_id}")
         try:
@@ -81,59 +104,158 @@ class AnnotationService:
             raise APIException(CommonCode.INVALID_ANNOTATION_REQUEST, detail=str(e)) from e
 
         # 1. DB 프로필, 전체 스키마 정보, 샘플 데이터 조회
-        db_profile = self.user_db_service.find_profile(request.db_profile_id)
+        db_profile = await executors.run(
+            Workload.LOCAL_STORAGE, self.user_db_service.find_profile, request.db_profile_id
+        )
         logging.info("Successfully fetched DB profile.")
 
-        full_schema_info = self.user_db_service.get_full_schema_info(db_profile)
+        full_schema_info = await executors.run(Workload.CATALOG, self.user_db_service.get_full_schema_info, db_profile)
         logging.info(f"Successfully fetched full schema info with {len(full_schema_info)} tables.")
 
-        sample_rows = self.user_db_service.get_sample_rows(db_profile, full_schema_info)
-        logging.info(f"Successfully fetched sample rows for {len(sample_rows)} tables.")
+        plan = None
+        if request.incremental:
+            plan = await executors.run(Workload.LOCAL_STORAGE, self.plan_reannotation, db_profile, full_schema_info)
+            if plan is not None and not plan.has_changes:
+                logging.info("Schema has not changed since the last annotation. Keeping the existing annotation.")
+                return await executors.run(Workload.LOCAL_STORAGE, self.get_full_annotation, db_profile.annotation_id)
+        target_tables = plan.changed_tables if plan is not None else full_schema_info
+
+        # 2, 3. AI 서버에 요청
+        ai_response = {}
+        if target_tables:
+            sample_rows = await executors.run(
+                Workload.CATALOG, self.user_db_service.get_sample_rows, db_profile, target_tables
+            )
+            logging.info(f"Successfully fetched sample rows for {len(sample_rows)} tables.")
+            ai_response = await self.request_ai_annotation(db_profile, target_tables, sample_rows)
+        if plan is not None:
+            ai_response = annotation_diff.merge_carried(plan, ai_response)
+
+        # 4. 트랜잭션 내에서 전체 어노테이션 정보 저장 및 DB 프로필 업데이트
+        annotation_id = await executors.run(
+            Workload.LOCAL_STORAGE, self.save_annotation, ai_response, db_profile, full_schema_info
+        )
+        logging.info(f"Annotation creation process completed for annotation_id: {annotation_id}")
+        return await executors.run(Workload.LOCAL_STORAGE, self.get_full_annotation, annotation_id)
 
-        # 2. AI 서버에 요청할 데이터 모델 생성
+    async def request_ai_annotation(
+        self,
+        db_profile: AllDBProfileInfo,
+        full_schema_info: list[UserDBTableInfo],
+        sample_rows: dict[str, list[dict[str, Any]]],
+        on_progress: Callable[[int, int], None] | None = None,
+    ) -> dict:
+        """
+        스키마 정보와 샘플 데이터로 AI 서버 요청 본문을 만들어 어노테이션을 요청합니다.
+        테이블 정의 해시로 캐시를 먼저 확인하여, 캐시에 없는 테이블만 AI 서버에 요청하고 받은 결과를 캐시에 저장합니다.
+        """
         ai_request_body = self._prepare_ai_request_body(db_profile, full_schema_info, sample_rows)
-        logging.info("Prepared AI request body.")
-        logging.info(f"AI Request Body: {ai_request_body.model_dump_json(indent=2)}")
+        hashes = annotation_cache.table_hashes(ai_request_body)
+        cached = await executors.run(
+            Workload.LOCAL_STORAGE, self.cache_repository.find_payloads, sorted(set(hashes.values()))
+        )
+        hit_tables = {name for name, table_hash in hashes.items() if table_hash in cached}
+        logging.info(f"Annotation cache: {len(hit_tables)} hit(s), {len(hashes) - len(hit_tables)} miss(es).")
+
+        ai_response = {}
+        if len(hit_tables) < len(hashes):
+            request_body = annotation_cache.without_tables(ai_request_body, hit_tables)
+            ai_response = await self._request_ai_in_chunks(request_body, on_progress)
+            await executors.run(
+                Workload.LOCAL_STORAGE,
+                self.cache_repository.save_payloads,
+                annotation_cache.cache_entries(hashes, ai_response),
+            )
+        return annotation_cache.merge_cached([cached[hashes[name]] for name in hit_tables], ai_response)
+
+    async def _request_ai_in_chunks(
+        self, ai_request_body: AIAnnotationRequest, on_progress: Callable[[int, int], None] | None
+    ) -> dict:
+        """
+        스키마가 크면 FK로 연결된 테이블 묶음 단위의 요청 여러 개로 나눠 동시에(최대 `ENV_ANNOTATION_AI_CONCURRENCY`개) 보내고,
+        응답을 하나로 합쳐 반환합니다. `on_progress(완료한 요청 수, 전체 요청 수)`는 요청이 하나 끝날 때마다 호출됩니다.
+        """
+        chunks = annotation_chunk_planner.plan_chunks(ai_request_body)
+        logging.info(f"Prepared AI request body in {len(chunks)} chunk(s).")
+
+        semaphore = asyncio.Semaphore(
+            max(1, get_env_number("ENV_ANNOTATION_AI_CONCURRENCY", int, DEFAULT_AI_CONCURRENCY))
+        )
+        completed = 0
+
+        async with httpx.AsyncClient() as client:
 
-        # 3. AI 서버에 요청
-        ai_response = await self._request_annotation_to_ai_server(ai_request_body)
+            async def request_chunk(chunk: AnnotationChunk) -> dict:
+                nonlocal completed
+                async with semaphore:
+                    response = await self._request_annotation_to_ai_server(chunk.request, client)
+                completed += 1
+                if on_progress:
+                    on_progress(completed, len(chunks))
+                return response
+
+            tasks = [asyncio.create_task(request_chunk(chunk)) for chunk in chunks]
+            try:
+                responses = await asyncio.gather(*tasks)
+            except BaseException:
+                # 하나라도 실패하면 아직 끝나지 않은 요청은 취소합니다.
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+        ai_response = annotation_chunk_planner.merge_responses(chunks, list(responses))
         logging.info("Received AI response.")
         logging.info(f"AI Response: {ai_response}")
+        return ai_response
 
-        # 4. 트랜잭션 내에서 전체 어노테이션 정보 저장 및 DB 프로필 업데이트
-        db_path = get_db_path()
-        conn = None
-        try:
-            conn = sqlite3.connect(str(db_path), timeout=10)
-            conn.execute("BEGIN")
+    def plan_reannotation(
+        self, db_profile: AllDBProfileInfo, full_schema_info: list[UserDBTableInfo]
+    ) -> ReannotationPlan | None:
+        """
+        현재 스키마를 프로필에 연결된 기존 어노테이션과 비교합니다.
+        기존 어노테이션이 없으면 None 을 반환하며, 이 경우 전체 테이블을 새로 요청합니다.
+        """
+        if not db_profile.annotation_id:
+            return None
+        previous = self.repository.find_full_annotation_by_id(db_profile.annotation_id)
+        if previous is None:
+            return None
+        plan = annotation_diff.plan_reannotation(full_schema_info, previous)
+        logging.info(
+            f"Reannotation plan: {len(plan.changed_tables)} changed, {len(plan.unchanged_tables)} unchanged, "
+            f"{len(plan.removed_tables)} removed tables."
+        )
+        return plan
 
-            db_models = self._transform_ai_response_to_db_models(
-                ai_response, db_profile, request.db_profile_id, full_schema_info
-            )
-            logging.info("Transformed AI response to DB models.")
-            self.repository.create_full_annotation(db_conn=conn, **db_models)
-            logging.info("Successfully saved full annotation to the database.")
+    def save_annotation(
+        self, ai_response: dict[str, Any], db_profile: AllDBProfileInfo, full_schema_info: list[UserDBTableInfo]
+    ) -> str:
+        """
+        AI 응답을 어노테이션으로 변환하여 저장하고 DB 프로필에 연결합니다. (하나의 트랜잭션)
+        저장된 어노테이션 ID를 반환합니다.
+        """
+        try:
+            with local_storage.transaction() as conn:
+                db_models = self._transform_ai_response_to_db_models(
+                    ai_response, db_profile, db_profile.id, full_schema_info
+                )
+                logging.info("Transformed AI response to DB models.")
+                self.repository.create_full_annotation(db_conn=conn, **db_models)
+                logging.info("Successfully saved full annotation to the database.")
 
-            annotation_id = db_models["db_annotation"].id
-            self.repository.update_db_profile_annotation_id(
-                db_conn=conn, db_profile_id=request.db_profile_id, annotation_id=annotation_id
-            )
-            logging.info(f"Updated db_profile with new annotation_id: {annotation_id}")
+                annotation_id = db_models["db_annotation"].id
+                self.repository.update_db_profile_annotation_id(
+                    db_conn=conn, db_profile_id=db_profile.id, annotation_id=annotation_id
+                )
+                logging.info(f"Updated db_profile with new annotation_id: {annotation_id}")
 
-            conn.commit()
             logging.info("Database transaction committed.")
 
         except sqlite3.Error as e:
-            if conn:
-                conn.rollback()
             logging.error("Database transaction failed and rolled back.", exc_info=True)
             raise APIException(CommonCode.FAIL_CREATE_ANNOTATION, detail=f"Database transaction failed: {e}") from e
-        finally:
-            if conn:
-                conn.close()
-
-        logging.info(f"Annotation creation process completed for annotation_id: {annotation_id}")
-        return self.get_full_annotation(annotation_id)
+        return annotation_id
 
     def get_annotation_by_db_profile_id(self, db_profile_id: str) -> FullAnnotationResponse:
         """
@@ -489,15 +611,22 @@ class AnnotationService:
         except sqlite3.Error as e:
             raise APIException(CommonCode.FAIL_DELETE_ANNOTATION) from e
 
-    async def _request_annotation_to_ai_server(self, ai_request: AIAnnotationRequest) -> dict:
-        """AI 서버에 스키마 정보를 보내고 어노테이션을 받아옵니다."""
+    async def _request_annotation_to_ai_server(
+        self, ai_request: AIAnnotationRequest, client: httpx.AsyncClient
+    ) -> dict:
+        """
+        AI 서버에 스키마 정보를 보내고 어노테이션을 받아옵니다.
+        연결 오류와 일시적인 서버 오류(429, 5xx)는 최대 `ENV_ANNOTATION_AI_MAX_RETRIES`번까지 간격을 늘려가며 다시 요청합니다.
+        """
         ai_server_url = self._get_ai_server_url()
         request_body = ai_request.model_dump()
 
         logging.info(f"Requesting annotation to AI server at {ai_server_url}")
         logging.info(f"Request Body: {request_body}")
 
-        async with httpx.AsyncClient() as client:
+        max_retries = max(0, get_env_number("ENV_ANNOTATION_AI_MAX_RETRIES", int, DEFAULT_AI_MAX_RETRIES))
+        for attempt in range(max_retries + 1):
+            is_last_attempt = attempt == max_retries
             try:
                 response = await client.post(ai_server_url, json=request_body, timeout=60.0)
                 response.raise_for_status()
@@ -507,14 +636,18 @@ class AnnotationService:
                 return ai_response
             except httpx.HTTPStatusError as e:
                 logging.error(f"AI server returned an error: {e.response.status_code} - {e.response.text}")
-                raise APIException(
-                    CommonCode.FAIL_AI_SERVER_PROCESSING, detail=f"AI server error: {e.response.text}"
-                ) from e
+                if is_last_attempt or not _is_retryable_status(e.response.status_code):
+                    raise APIException(
+                        CommonCode.FAIL_AI_SERVER_PROCESSING, detail=f"AI server error: {e.response.text}"
+                    ) from e
             except httpx.RequestError as e:
                 logging.error(f"Failed to connect to AI server: {e}")
-                raise APIException(
-                    CommonCode.FAIL_AI_SERVER_CONNECTION, detail=f"AI server connection failed: {e}"
-                ) from e
+                if is_last_attempt:
+                    raise APIException(
+                        CommonCode.FAIL_AI_SERVER_CONNECTION, detail=f"AI server connection failed: {e}"
+                    ) from e
+            await asyncio.sleep(AI_RETRY_BACKOFF_SEC * 2**attempt)
+        raise APIException(CommonCode.FAIL_AI_SERVER_CONNECTION)
 
     def _get_mock_ai_response(self, ai_request: AIAnnotationRequest) -> dict:
         """테스트를 위한 Mock AI 서버 응답 생성"""
@@ -567,4 +700,8 @@ class AnnotationService:
         return mock_response
 
 
+def _is_retryable_status(status_code: int) -> bool:
+    return status_code == 429 or status_code >= 500
+
+
 annotation_service = AnnotationService()
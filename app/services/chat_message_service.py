@@ -7,6 +7,7 @@ from fastapi import Depends
 from app.core.enum.db_key_prefix_name import DBSaveIdEnum
 from app.core.enum.sender import SenderEnum
 from app.core.exceptions import APIException
+from app.core.executors import Workload, executors
 from app.core.status import CommonCode
 from app.core.utils import generate_prefixed_uuid
 from app.repository.chat_message_repository import ChatMessageRepository, chat_message_repository
@@ -28,6 +29,9 @@ class ChatMessageService:
     ):
         self.repository = repository
         self.chat_tab_repository = chat_tab_repo
+        # 비동기 흐름(create_chat_message)에서 이벤트 루프를 막지 않도록 로컬 저장소 작업 풀에서 실행하는 래퍼
+        self._async_repository = executors.facade(repository, Workload.LOCAL_STORAGE)
+        self._async_chat_tab_repository = executors.facade(chat_tab_repo, Workload.LOCAL_STORAGE)
         self._ai_server_url = None
 
     def _get_ai_server_url(self) -> str:
@@ -57,11 +61,11 @@ class ChatMessageService:
         # 1. tab_id, message 유효성 검사 및 유무 확인
         request.validate()
 
-        self.repository.get_chat_tab_by_id(request.chat_tab_id)
+        await self._async_repository.get_chat_tab_by_id(request.chat_tab_id)
 
         # 2. 사용자 질의 저장
         try:
-            self._transform_user_request_to_db_models(request)
+            await executors.run(Workload.LOCAL_STORAGE, self._transform_user_request_to_db_models, request)
         except sqlite3.Error as e:
             raise APIException(CommonCode.FAIL) from e
 
@@ -69,10 +73,12 @@ class ChatMessageService:
         ai_response = await self._request_chat_message_to_ai_server(request)
 
         # 4. AI 서버 응답 저장
-        response = self._transform_ai_response_to_db_models(request, ai_response)
+        response = await executors.run(
+            Workload.LOCAL_STORAGE, self._transform_ai_response_to_db_models, request, ai_response
+        )
 
         # 5. 채팅 탭의 updated_at 갱신
-        self.chat_tab_repository.update_tab_timestamp(request.chat_tab_id)
+        await self._async_chat_tab_repository.update_tab_timestamp(request.chat_tab_id)
 
         return response
 
@@ -118,7 +124,7 @@ class ChatMessageService:
     async def _request_chat_message_to_ai_server(self, request: ChatMessagesReqeust) -> dict:
         """AI 서버에 사용자 질의를 보내고 답변을 받아옵니다."""
         # 1. DB에서 해당 탭의 모든 메시지 조회
-        chat_tab_with_messages = self.repository.get_chat_tab_and_messages_by_id(request.chat_tab_id)
+        chat_tab_with_messages = await self._async_repository.get_chat_tab_and_messages_by_id(request.chat_tab_id)
         messages: list[ChatMessagesResponse] = chat_tab_with_messages.messages
 
         if not messages:
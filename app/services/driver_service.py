@@ -4,6 +4,7 @@ import logging
 import os
 import sqlite3
 
+from app.core.enum.db_driver import DBTypesEnum
 from app.core.exceptions import APIException
 from app.core.status import CommonCode
 from app.schemas.driver.driver_info_model import DriverInfo
@@ -43,5 +44,16 @@ class DriverService:
             logger.exception(f"error: {e}")
             raise APIException(CommonCode.FAIL) from e
 
+    def warm_up_drivers(self) -> None:
+        """
+        지원하는 DB 드라이버 모듈을 미리 import 합니다.
+        첫 연결 요청에서 드라이버 로딩 시간이 더해지지 않도록 시작 단계에서 호출됩니다.
+        """
+        for db_type in DBTypesEnum:
+            try:
+                importlib.import_module(db_type.value)
+            except ImportError:
+                logger.info(f"Driver not installed, skip warm-up: {db_type.value}")
+
 
 driver_service = DriverService()
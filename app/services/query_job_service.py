@@ -0,0 +1,215 @@
+# app/services/query_job_service.py
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime
+
+from app.core.enum.db_key_prefix_name import DBSaveIdEnum
+from app.core.enum.query_job_status import QueryJobStatusEnum
+from app.core.enum.result_format import ResultFormatEnum
+from app.core.exceptions import APIException
+from app.core.executors import Workload, executors
+from app.core.status import CommonCode
+from app.core.utils import generate_prefixed_uuid, get_env_number
+from app.db.query_handles import query_handles
+from app.schemas.query.query_model import RequestExecutionQuery
+from app.schemas.query.result_model import QueryJob
+from app.schemas.user_db.db_profile_model import AllDBProfileInfo
+from app.schemas.user_db.result_model import BasicResult
+from app.services.query_service import QueryService, query_service
+
+# 완료된 작업의 결과를 보관하는 시간(초). ENV_QUERY_JOB_TTL_SEC 로 덮어씁니다.
+DEFAULT_JOB_TTL = 600.0
+# 대기 + 실행 중인 작업의 최대 수 (넘으면 새 요청을 거절합니다). ENV_QUERY_JOB_MAX_ACTIVE 로 덮어씁니다.
+DEFAULT_MAX_ACTIVE_JOBS = 50
+
+
+class _QueryJob:
+    __slots__ = (
+        "job_id",
+        "status",
+        "submitted_at",
+        "started_at",
+        "finished_at",
+        "result",
+        "future",
+        "finished",
+        "cancel_requested",
+    )
+
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.status = QueryJobStatusEnum.pending
+        self.submitted_at = datetime.now()
+        self.started_at: datetime | None = None
+        self.finished_at: datetime | None = None
+        self.result: BasicResult | None = None
+        self.future: Future | None = None
+        # 보관 기간 계산용 (time.monotonic)
+        self.finished: float | None = None
+        # 실행 시작 전(또는 쿼리가 DB에 전달되기 전)에 취소 요청을 받았는지 여부
+        self.cancel_requested = False
+
+    def to_model(self) -> QueryJob:
+        result = self.result
+        return QueryJob(
+            job_id=self.job_id,
+            status=self.status,
+            submitted_at=self.submitted_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+            code=result.code.code if result and result.code else None,
+            message=result.code.get_message() if result and result.code else None,
+            result=getattr(result, "data", None) if result and result.is_successful else None,
+        )
+
+
+class QueryJobService:
+    """
+    쿼리를 HTTP 요청 스레드가 아닌 별도의 제한된 풀(Workload.QUERY_JOB)에서 실행하는 비동기 작업을 관리합니다.
+    - 요청 즉시 작업 Key를 반환하고, 상태와 결과는 작업 Key로 조회합니다.
+    - 작업 Key는 실행 핸들 Key로도 사용되므로 실행 중인 작업은 DB에서 쿼리를 중단시켜 취소합니다.
+    - 완료된 작업은 TTL 동안 결과를 보관한 뒤 삭제됩니다.
+    """
+
+    def __init__(self, ttl: float | None = None, max_active_jobs: int | None = None):
+        self._ttl = ttl
+        self._max_active_jobs = max(1, max_active_jobs) if max_active_jobs is not None else None
+        self._jobs: dict[str, _QueryJob] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def ttl(self) -> float:
+        """
+        완료 작업 보관 시간을 최초 사용 시점에 환경 변수에서 읽어옵니다.
+        (.env 로드가 모듈 import 이후에 일어나므로 생성자에서 읽지 않습니다.)
+        """
+        if self._ttl is None:
+            self._ttl = get_env_number("ENV_QUERY_JOB_TTL_SEC", float, DEFAULT_JOB_TTL)
+        return self._ttl
+
+    @property
+    def max_active_jobs(self) -> int:
+        """대기 + 실행 중인 작업의 최대 수를 최초 사용 시점에 환경 변수에서 읽어옵니다."""
+        if self._max_active_jobs is None:
+            self._max_active_jobs = max(1, get_env_number("ENV_QUERY_JOB_MAX_ACTIVE", int, DEFAULT_MAX_ACTIVE_JOBS))
+        return self._max_active_jobs
+
+    def submit(
+        self,
+        query_info: RequestExecutionQuery,
+        db_info: AllDBProfileInfo,
+        result_format: ResultFormatEnum = ResultFormatEnum.dict,
+        use_cache: bool = False,
+        service: QueryService = query_service,
+    ) -> QueryJob:
+        """쿼리 실행 작업을 등록하고 바로 반환합니다."""
+        if result_format is ResultFormatEnum.arrow:
+            raise APIException(CommonCode.ARROW_FORMAT_NOT_ALLOWED)
+        self.evict_expired()
+
+        job = _QueryJob(query_info.handle_id or generate_prefixed_uuid(DBSaveIdEnum.query_job.value))
+        query_info = query_info.model_copy(update={"handle_id": job.job_id})
+        with self._lock:
+            active = sum(1 for j in self._jobs.values() if not j.status.is_finished)
+            if active >= self.max_active_jobs:
+                raise APIException(CommonCode.TOO_MANY_QUERY_JOBS)
+            self._jobs[job.job_id] = job
+
+        job.future = executors.submit(
+            Workload.QUERY_JOB, self._run, job, query_info, db_info, result_format, use_cache, service
+        )
+        return job.to_model()
+
+    def find_job(self, job_id: str) -> QueryJob:
+        """작업 상태를 조회합니다. 작업이 없거나 만료되었으면 NO_QUERY_JOB 예외를 발생시킵니다."""
+        self.evict_expired()
+        return self._get(job_id).to_model()
+
+    def cancel_job(self, job_id: str) -> QueryJob:
+        """
+        작업을 취소합니다. 대기 중이면 실행하지 않고, 실행 중이면 DB에서 쿼리를 중단시킵니다.
+        워커가 작업을 꺼냈지만 쿼리가 아직 DB에 전달되지 않았으면(커넥션 대기 등) 전달되는 시점에 중단됩니다.
+        이미 끝난 작업은 그대로 반환합니다.
+        """
+        job = self._get(job_id)
+        with self._lock:
+            if job.status.is_finished:
+                return job.to_model()
+            if job.status is QueryJobStatusEnum.pending and job.future and job.future.cancel():
+                self._finish(job, QueryJobStatusEnum.canceled, _canceled_result())
+                return job.to_model()
+            job.cancel_requested = True
+
+        query_handles.request_cancel(job_id)
+        with self._lock:
+            if job.status.is_finished:
+                # 예약하는 사이에 작업이 끝났으면 남은 예약을 해제합니다.
+                query_handles.discard_cancel(job_id)
+        return job.to_model()
+
+    def evict_expired(self) -> None:
+        """보관 기간이 지난 완료 작업을 삭제합니다."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [j.job_id for j in self._jobs.values() if j.finished is not None and now - j.finished > self.ttl]
+            for job_id in expired:
+                del self._jobs[job_id]
+
+    def _get(self, job_id: str) -> _QueryJob:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            raise APIException(CommonCode.NO_QUERY_JOB)
+        return job
+
+    def _run(
+        self,
+        job: _QueryJob,
+        query_info: RequestExecutionQuery,
+        db_info: AllDBProfileInfo,
+        result_format: ResultFormatEnum,
+        use_cache: bool,
+        service: QueryService,
+    ) -> None:
+        with self._lock:
+            if job.cancel_requested:
+                self._finish(job, QueryJobStatusEnum.canceled, _canceled_result())
+                query_handles.discard_cancel(job.job_id)
+                return
+            job.status = QueryJobStatusEnum.running
+            job.started_at = datetime.now()
+
+        try:
+            result = service.execution(query_info, db_info, result_format, use_cache)
+        except APIException as e:
+            result = BasicResult(is_successful=False, code=e.code_enum)
+        except Exception as e:
+            logging.error(f"Query job {job.job_id} failed: {e}")
+            result = BasicResult(is_successful=False, code=CommonCode.FAIL)
+
+        if result.is_successful:
+            status = QueryJobStatusEnum.succeeded
+        elif result.code is CommonCode.QUERY_CANCELED:
+            status = QueryJobStatusEnum.canceled
+        else:
+            status = QueryJobStatusEnum.failed
+        with self._lock:
+            self._finish(job, status, result)
+            query_handles.discard_cancel(job.job_id)
+
+    @staticmethod
+    def _finish(job: _QueryJob, status: QueryJobStatusEnum, result: BasicResult) -> None:
+        job.status = status
+        job.result = result
+        job.finished_at = datetime.now()
+        job.finished = time.monotonic()
+
+
+def _canceled_result() -> BasicResult:
+    return BasicResult(is_successful=False, code=CommonCode.QUERY_CANCELED)
+
+
+query_job_service = QueryJobService()
@@ -1,20 +1,32 @@
 # app/service/query_service.py
 
 import importlib
+import logging
 import sqlite3
+from collections.abc import Iterator
 from typing import Any
 
 from fastapi import Depends
 
+from app.core import serialization, sql_classifier
 from app.core.enum.db_driver import DBTypesEnum
+from app.core.enum.db_key_prefix_name import DBSaveIdEnum
+from app.core.enum.result_format import ResultFormatEnum
+from app.core.enum.stream_format import StreamFormatEnum
 from app.core.exceptions import APIException
 from app.core.status import CommonCode
-from app.repository.query_repository import QueryRepository, query_repository
+from app.core.utils import generate_prefixed_uuid, get_env_number
+from app.db.query_handles import QueryHandle, RunningQuery, default_query_timeout_sec, query_handles
+from app.db.query_result_cache import query_result_cache
+from app.repository.query_plan_repository import QueryPlanRepository, query_plan_repository
+from app.repository.query_repository import QueryRepository, QueryStream, query_repository
 from app.schemas.query.query_model import ExecutionQuery, QueryInfo, RequestExecutionQuery
 from app.schemas.query.result_model import (
     BasicResult,
     ExecutionResult,
+    ExecutionScriptResult,
     ExecutionSelectResult,
+    QueryPlanResult,
     QueryTestResult,
     SelectQueryHistoryResult,
 )
@@ -22,37 +34,210 @@ from app.schemas.user_db.db_profile_model import AllDBProfileInfo, DBProfileInfo
 
 query_repository_dependency = Depends(lambda: query_repository)
 
+# 스트리밍 실행 시 한 번에 읽어 전송하는 기본 행 수
+DEFAULT_STREAM_FETCH_SIZE = 1000
+# 쿼리 테스트(미리보기) 시 반환하는 최대 행 수 / 최대 크기(바이트)
+# ENV_QUERY_TEST_MAX_ROWS / ENV_QUERY_TEST_MAX_BYTES 로 덮어씁니다.
+DEFAULT_TEST_MAX_ROWS = 1000
+DEFAULT_TEST_MAX_BYTES = 5 * 1024 * 1024
+
 
 class QueryService:
     def execution(
         self,
         query_info: RequestExecutionQuery,
         db_info: AllDBProfileInfo,
+        result_format: ResultFormatEnum = ResultFormatEnum.dict,
+        use_cache: bool = False,
         repository: QueryRepository = query_repository,
     ) -> ExecutionSelectResult | ExecutionResult | BasicResult:
         """
         쿼리 수행 후 결과를 저장합니다.
+        `use_cache`이면 같은 프로필/DB에서 같은 조회 쿼리의 결과가 캐시에 있을 때 실행하지 않고 재사용합니다.
+        데이터를 바꾸는 쿼리가 실행되면 프로필의 캐시된 결과를 모두 무효화합니다.
         """
         driver_module = self._get_driver_module(db_info.type)
+        script = sql_classifier.classify(query_info.query_text, driver_module.__name__)
+        use_cache = use_cache and script.is_read_only
+        cache_args = (db_info.id, query_info.database, query_info.query_text, result_format)
+        if use_cache:
+            cached = query_result_cache.get(*cache_args)
+            if cached is not None:
+                logging.info(f"Serving query result for db_profile {db_info.id} from cache.")
+                self._save_query_history(query_info, db_info, True, repository)
+                return ExecutionSelectResult(is_successful=True, code=CommonCode.SUCCESS_EXECUTION, data=cached)
+
         connect_kwargs = self._prepare_connection_args(db_info, query_info.database)
-        result = repository.execution(query_info.query_text, driver_module, **connect_kwargs)
-        try:
-            query_history_info = ExecutionQuery.from_query_info(query_info, db_info.type, result.is_successful, None)
-            sql, data = self._get_create_query_and_data(query_history_info)
-            repository.create_query_history(sql, data, query_history_info.query_text)
-        except Exception as e:
-            raise APIException(CommonCode.FAIL) from e
+        handle = self._create_handle(query_info, db_info)
+        generation = query_result_cache.generation(db_info.id)
+        result = repository.execution(query_info.query_text, driver_module, result_format, handle, **connect_kwargs)
+        if not script.is_read_only:
+            query_result_cache.invalidate_profile(db_info.id)
+        elif use_cache and isinstance(result, ExecutionSelectResult):
+            query_result_cache.put(*cache_args, result.data, generation)
+        self._save_query_history(query_info, db_info, result.is_successful, repository)
         return result
 
+    def execute_script(
+        self,
+        query_info: RequestExecutionQuery,
+        db_info: AllDBProfileInfo,
+        result_format: ResultFormatEnum = ResultFormatEnum.dict,
+        repository: QueryRepository = query_repository,
+    ) -> ExecutionScriptResult:
+        """
+        스크립트를 문장 단위로 나누어 하나의 트랜잭션으로 실행하고, 문장별 결과를 반환합니다.
+        실행 이력은 스크립트 전체를 하나로 저장합니다.
+        """
+        if result_format is ResultFormatEnum.arrow:
+            raise APIException(CommonCode.ARROW_FORMAT_NOT_ALLOWED)
+        driver_module = self._get_driver_module(db_info.type)
+        script = sql_classifier.classify(query_info.query_text, driver_module.__name__)
+        if not script.statements:
+            raise APIException(CommonCode.NO_QUERY)
+        if any(statement.is_transaction_control for statement in script.statements):
+            raise APIException(CommonCode.SCRIPT_TRANSACTION_CONTROL)
+
+        connect_kwargs = self._prepare_connection_args(db_info, query_info.database)
+        handle = self._create_handle(query_info, db_info)
+        result = repository.execute_script(script.statements, driver_module, result_format, handle, **connect_kwargs)
+        if not script.is_read_only:
+            query_result_cache.invalidate_profile(db_info.id)
+        self._save_query_history(query_info, db_info, result.is_successful, repository)
+        return result
+
+    def execution_stream(
+        self,
+        query_info: RequestExecutionQuery,
+        db_info: AllDBProfileInfo,
+        fetch_size: int = DEFAULT_STREAM_FETCH_SIZE,
+        repository: QueryRepository = query_repository,
+    ) -> QueryStream:
+        """
+        쿼리를 실행하고, 결과를 `fetch_size` 행씩 나누어 읽는 스트림을 반환합니다.
+        스트림이 닫힐 때까지 실행 중인 쿼리로 조회/취소할 수 있고, 제한 시간이 적용됩니다.
+        실행 이력은 실행(첫 배치 조회) 성공 여부로 저장됩니다.
+        """
+        driver_module = self._get_driver_module(db_info.type)
+        connect_kwargs = self._prepare_connection_args(db_info, query_info.database)
+        handle = self._create_handle(query_info, db_info)
+        try:
+            stream = repository.open_stream(query_info.query_text, driver_module, fetch_size, handle, **connect_kwargs)
+        except APIException:
+            self._save_query_history(query_info, db_info, False, repository)
+            raise
+        if not sql_classifier.classify(query_info.query_text, driver_module.__name__).is_read_only:
+            query_result_cache.invalidate_profile(db_info.id)
+
+        try:
+            self._save_query_history(query_info, db_info, True, repository)
+        except APIException:
+            stream.close()
+            raise
+        return stream
+
+    def render_stream(self, stream: QueryStream, stream_format: StreamFormatEnum) -> Iterator[bytes]:
+        """
+        스트림을 응답 본문 조각으로 직렬화합니다. 행은 컬럼 순서를 따르는 배열로 전송됩니다.
+        - ndjson: 첫 줄 `{"columns": [...]}`, 이후 한 줄에 한 행, 마지막 줄 `{"row_count": n}`
+        - json: `{"code", "message", "data": {"columns", "rows", "row_count"}}` 형태를 나누어 전송
+        전송 중 오류가 발생하면 `error` 항목을 덧붙이고 종료합니다.
+        """
+        if stream_format is StreamFormatEnum.ndjson:
+            return self._render_ndjson(stream)
+        return self._render_json(stream)
+
+    def _render_ndjson(self, stream: QueryStream) -> Iterator[bytes]:
+        yield serialization.encode_ndjson_lines([{"columns": stream.columns}])
+        try:
+            for batch in stream.batches():
+                yield serialization.encode_ndjson_lines(batch)
+        except Exception:
+            logging.error("Failed to stream query result as NDJSON", exc_info=True)
+            yield serialization.encode_ndjson_lines([{"error": self._stream_error(stream)}])
+            return
+        yield serialization.encode_ndjson_lines([{"row_count": stream.row_count}])
+
+    def _render_json(self, stream: QueryStream) -> Iterator[bytes]:
+        code = CommonCode.SUCCESS_EXECUTION
+        yield (
+            f'{{"code":{serialization.dumps(code.code)},"message":{serialization.dumps(code.get_message())},'
+            f'"data":{{"columns":{serialization.dumps(stream.columns)},"rows":['
+        ).encode()
+        error = None
+        try:
+            for index, batch in enumerate(stream.batches()):
+                yield serialization.encode_json_rows(batch, leading_comma=index > 0)
+        except Exception:
+            logging.error("Failed to stream query result as JSON", exc_info=True)
+            error = self._stream_error(stream)
+        trailer = f'],"row_count":{stream.row_count}'
+        if error:
+            trailer += f',"error":{serialization.dumps(error)}'
+        yield f"{trailer}}}}}".encode()
+
+    def _stream_error(self, stream: QueryStream) -> dict[str, str]:
+        code = stream.failure_code(CommonCode.FAIL)
+        return {"code": code.code, "message": code.get_message()}
+
     def execution_test(
-        self, query_info: QueryInfo, db_info: AllDBProfileInfo, repository: QueryRepository = query_repository
+        self,
+        query_info: QueryInfo,
+        db_info: AllDBProfileInfo,
+        result_format: ResultFormatEnum = ResultFormatEnum.dict,
+        max_rows: int | None = None,
+        max_bytes: int | None = None,
+        repository: QueryRepository = query_repository,
     ) -> QueryTestResult:
         """
-        쿼리 수행 후 결과를 저장합니다.
+        쿼리를 실행해 보고 롤백합니다. 조회 결과는 `max_rows`행 / `max_bytes`바이트까지만 반환합니다.
+        지정하지 않으면 환경 변수(ENV_QUERY_TEST_MAX_ROWS / ENV_QUERY_TEST_MAX_BYTES) 또는 기본값을 사용합니다.
         """
+        if max_rows is None:
+            max_rows = get_env_number("ENV_QUERY_TEST_MAX_ROWS", int, DEFAULT_TEST_MAX_ROWS)
+        if max_bytes is None:
+            max_bytes = get_env_number("ENV_QUERY_TEST_MAX_BYTES", int, DEFAULT_TEST_MAX_BYTES)
         driver_module = self._get_driver_module(db_info.type)
         connect_kwargs = self._prepare_connection_args(db_info, query_info.database)
-        return repository.execution_test(query_info.query_text, driver_module, **connect_kwargs)
+        handle = self._create_handle(query_info, db_info)
+        return repository.execution_test(
+            query_info.query_text,
+            driver_module,
+            result_format,
+            handle,
+            max_rows=max_rows,
+            max_bytes=max_bytes,
+            **connect_kwargs,
+        )
+
+    def explain(
+        self,
+        query_info: QueryInfo,
+        db_info: AllDBProfileInfo,
+        repository: QueryPlanRepository = query_plan_repository,
+    ) -> QueryPlanResult:
+        """
+        쿼리를 실행하지 않고 실행 계획(예상 행 수/비용 포함)만 조회합니다.
+        DB가 계획을 세우지 못하면(문법 오류, 없는 테이블 등) 오류 메시지와 함께 실패 결과를 반환하므로,
+        실제 실행 없이 쿼리의 유효성을 검사하는 데 사용할 수 있습니다.
+        """
+        driver_module = self._get_driver_module(db_info.type)
+        script = sql_classifier.classify(query_info.query_text, driver_module.__name__)
+        if len(script.statements) != 1:
+            raise APIException(CommonCode.EXPLAIN_SINGLE_STATEMENT)
+
+        connect_kwargs = self._prepare_connection_args(db_info, query_info.database)
+        handle = self._create_handle(query_info, db_info)
+        return repository.explain(script.statements[0].text, driver_module, db_info.type, handle, **connect_kwargs)
+
+    def cancel(self, handle_id: str) -> None:
+        """실행 중인 쿼리를 취소합니다. 실행 중인 쿼리가 없으면 NO_RUNNING_QUERY 예외를 발생시킵니다."""
+        if not query_handles.cancel(handle_id):
+            raise APIException(CommonCode.NO_RUNNING_QUERY)
+
+    def find_running(self, db_profile_id: str | None = None) -> list[RunningQuery]:
+        """실행 중인 쿼리 목록을 조회합니다."""
+        return query_handles.find_running(db_profile_id)
 
     def find_query_history(
         self, chat_tab_id: int, repository: QueryRepository = query_repository
@@ -65,6 +250,28 @@ class QueryService:
         except Exception as e:
             raise APIException(CommonCode.FAIL) from e
 
+    def _create_handle(self, query_info: QueryInfo, db_info: AllDBProfileInfo) -> QueryHandle:
+        """실행 핸들을 만듭니다. 제한 시간은 프로필 설정을, 설정이 없으면 기본값을 사용합니다."""
+        timeout_sec = db_info.query_timeout_sec
+        if timeout_sec is None:
+            timeout_sec = default_query_timeout_sec()
+        handle_id = query_info.handle_id or generate_prefixed_uuid(DBSaveIdEnum.query.value)
+        return QueryHandle(handle_id, db_info.id, query_info.query_text, timeout_sec)
+
+    def _save_query_history(
+        self,
+        query_info: RequestExecutionQuery,
+        db_info: AllDBProfileInfo,
+        is_successful: bool,
+        repository: QueryRepository,
+    ) -> None:
+        try:
+            query_history_info = ExecutionQuery.from_query_info(query_info, db_info.type, is_successful, None)
+            sql, data = self._get_create_query_and_data(query_history_info)
+            repository.create_query_history(sql, data, query_history_info.query_text)
+        except Exception as e:
+            raise APIException(CommonCode.FAIL) from e
+
     def _get_driver_module(self, db_type: str):
         """
         DB 타입에 따라 동적으로 드라이버 모듈을 로드합니다.
@@ -0,0 +1,212 @@
+# app/services/query_session_service.py
+
+import logging
+import threading
+import time
+
+from app.core.enum.db_key_prefix_name import DBSaveIdEnum
+from app.core.exceptions import APIException
+from app.core.status import CommonCode
+from app.core.utils import generate_prefixed_uuid, get_env_number
+from app.repository.query_repository import QueryStream
+from app.schemas.query.query_model import RequestExecutionQuery
+from app.schemas.query.result_model import QuerySessionPage
+from app.schemas.user_db.db_profile_model import AllDBProfileInfo
+from app.services.query_service import QueryService, query_service
+
+# 마지막 조회 이후 이 시간(초)이 지난 세션은 닫습니다. ENV_QUERY_SESSION_TTL_SEC 로 덮어씁니다.
+DEFAULT_SESSION_TTL = 300.0
+# 프로필별로 동시에 유지할 최대 세션 수 (세션마다 사용자 DB 커넥션을 하나씩 점유합니다)
+# ENV_QUERY_SESSION_MAX_PER_PROFILE 로 덮어씁니다.
+DEFAULT_MAX_SESSIONS_PER_PROFILE = 2
+# 한 페이지의 기본 행 수
+DEFAULT_PAGE_SIZE = 500
+# 만료된 세션을 정리하는 최대 주기(초). TTL이 더 짧으면 TTL의 절반마다 정리합니다.
+MAX_SWEEP_INTERVAL_SEC = 30.0
+
+
+class _QuerySession:
+    __slots__ = ("session_id", "profile_id", "stream", "carry", "offset", "last_used", "lock")
+
+    def __init__(self, session_id: str, profile_id: str, stream: QueryStream):
+        self.session_id = session_id
+        self.profile_id = profile_id
+        self.stream = stream
+        # 다음 페이지 존재 여부를 알기 위해 미리 읽어 둔 행
+        self.carry: list = []
+        self.offset = 0
+        self.last_used = time.monotonic()
+        self.lock = threading.RLock()
+
+
+class QuerySessionService:
+    """
+    쿼리를 한 번만 실행하고, 열린 커서에서 페이지 단위로 결과를 읽어가는 결과 세션을 관리합니다.
+    - 세션은 마지막 조회 후 TTL이 지나면 닫히며, 프로필별 세션 수가 상한을 넘으면 가장 오래 쉰 세션부터 닫습니다.
+    - 결과를 끝까지 읽은 세션은 즉시 닫히고 커넥션이 반납됩니다.
+    - `start_sweeper()`로 만료된 세션을 주기적으로 닫아, 새 요청이 없어도 버려진 세션의 커넥션이 반납됩니다.
+    """
+
+    def __init__(self, ttl: float | None = None, max_sessions_per_profile: int | None = None):
+        self._ttl = ttl
+        self._max_sessions_per_profile = (
+            max(1, max_sessions_per_profile) if max_sessions_per_profile is not None else None
+        )
+        self._sessions: dict[str, _QuerySession] = {}
+        self._lock = threading.Lock()
+        self._sweeper_stop = threading.Event()
+        self._sweeper_thread: threading.Thread | None = None
+
+    @property
+    def ttl(self) -> float:
+        """
+        세션 TTL을 최초 사용 시점에 환경 변수에서 읽어옵니다.
+        (.env 로드가 모듈 import 이후에 일어나므로 생성자에서 읽지 않습니다.)
+        """
+        if self._ttl is None:
+            self._ttl = get_env_number("ENV_QUERY_SESSION_TTL_SEC", float, DEFAULT_SESSION_TTL)
+        return self._ttl
+
+    @property
+    def max_sessions_per_profile(self) -> int:
+        """프로필별 최대 세션 수를 최초 사용 시점에 환경 변수에서 읽어옵니다."""
+        if self._max_sessions_per_profile is None:
+            self._max_sessions_per_profile = max(
+                1, get_env_number("ENV_QUERY_SESSION_MAX_PER_PROFILE", int, DEFAULT_MAX_SESSIONS_PER_PROFILE)
+            )
+        return self._max_sessions_per_profile
+
+    def open_session(
+        self,
+        query_info: RequestExecutionQuery,
+        db_info: AllDBProfileInfo,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        service: QueryService = query_service,
+    ) -> QuerySessionPage:
+        """
+        쿼리를 실행하고 첫 페이지를 반환합니다. 남은 결과가 있으면 세션 Key를 함께 반환합니다.
+        """
+        self.evict_expired()
+        self._make_room(db_info.id)
+
+        stream = service.execution_stream(query_info, db_info, fetch_size=page_size + 1)
+        session = _QuerySession(generate_prefixed_uuid(DBSaveIdEnum.query_session.value), db_info.id, stream)
+        with session.lock:
+            page = self._read_page(session, page_size)
+            if page.has_more:
+                with self._lock:
+                    self._sessions[session.session_id] = session
+        return page
+
+    def fetch_next_page(self, session_id: str, page_size: int = DEFAULT_PAGE_SIZE) -> QuerySessionPage:
+        """세션에서 다음 페이지를 읽습니다. 세션이 없거나 만료되었으면 NO_QUERY_SESSION 예외를 발생시킵니다."""
+        self.evict_expired()
+        with self._lock:
+            session = self._sessions.get(session_id)
+        if session is None:
+            raise APIException(CommonCode.NO_QUERY_SESSION)
+
+        with session.lock:
+            try:
+                page = self._read_page(session, page_size)
+            except Exception as e:
+                self._forget(session)
+                raise APIException(session.stream.failure_code(CommonCode.FAIL_CONNECT_DB)) from e
+        if not page.has_more:
+            self._forget(session)
+        return page
+
+    def close_session(self, session_id: str) -> bool:
+        """세션을 닫고 커넥션을 반납합니다. 세션이 있었으면 True를 반환합니다."""
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        self._close(session)
+        return True
+
+    def evict_expired(self) -> None:
+        """TTL이 지난 세션을 닫습니다."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [s for s in self._sessions.values() if now - s.last_used > self.ttl]
+            for session in expired:
+                del self._sessions[session.session_id]
+        for session in expired:
+            logging.info(f"Closing expired query session: {session.session_id}")
+            self._close(session)
+
+    def start_sweeper(self) -> None:
+        """만료된 세션을 주기적으로 닫는 작업을 백그라운드 스레드로 시작합니다."""
+        if self._sweeper_thread and self._sweeper_thread.is_alive():
+            return
+        interval = max(1.0, min(self.ttl / 2, MAX_SWEEP_INTERVAL_SEC))
+
+        self._sweeper_stop.clear()
+
+        def _loop():
+            while not self._sweeper_stop.wait(interval):
+                try:
+                    self.evict_expired()
+                except Exception:
+                    logging.warning("만료된 쿼리 결과 세션을 정리하는 중 오류가 발생했습니다.", exc_info=True)
+
+        self._sweeper_thread = threading.Thread(target=_loop, name="query-session-sweeper", daemon=True)
+        self._sweeper_thread.start()
+
+    def stop_sweeper(self) -> None:
+        """만료 세션 정리 작업을 중지합니다."""
+        self._sweeper_stop.set()
+        if self._sweeper_thread:
+            self._sweeper_thread.join(timeout=MAX_SWEEP_INTERVAL_SEC)
+            self._sweeper_thread = None
+
+    def close_all(self) -> None:
+        """모든 세션을 닫습니다. (애플리케이션 종료 시 사용)"""
+        with self._lock:
+            sessions, self._sessions = list(self._sessions.values()), {}
+        for session in sessions:
+            self._close(session)
+
+    def _make_room(self, profile_id: str) -> None:
+        """새 세션을 위해, 프로필의 세션 수가 상한에 도달했으면 가장 오래 쉰 세션부터 닫습니다."""
+        with self._lock:
+            sessions = sorted(
+                (s for s in self._sessions.values() if s.profile_id == profile_id), key=lambda s: s.last_used
+            )
+            overflow = sessions[: max(0, len(sessions) - self.max_sessions_per_profile + 1)]
+            for session in overflow:
+                del self._sessions[session.session_id]
+        for session in overflow:
+            logging.info(f"Closing query session {session.session_id} to stay within the per-profile limit.")
+            self._close(session)
+
+    def _read_page(self, session: _QuerySession, page_size: int) -> QuerySessionPage:
+        rows = session.carry + session.stream.fetch(page_size + 1 - len(session.carry))
+        page_rows, session.carry = rows[:page_size], rows[page_size:]
+        columns = session.stream.columns
+
+        page = QuerySessionPage(
+            session_id=session.session_id if session.carry else None,
+            columns=columns,
+            data=[dict(zip(columns, row, strict=False)) for row in page_rows],
+            offset=session.offset,
+            has_more=bool(session.carry),
+        )
+        session.offset += len(page_rows)
+        session.last_used = time.monotonic()
+        return page
+
+    def _forget(self, session: _QuerySession) -> None:
+        with self._lock:
+            self._sessions.pop(session.session_id, None)
+        self._close(session)
+
+    @staticmethod
+    def _close(session: _QuerySession) -> None:
+        with session.lock:
+            session.carry = []
+            session.stream.close()
+
+
+query_session_service = QuerySessionService()
@@ -6,28 +6,51 @@ import sqlite3
 from typing import Any
 
 from fastapi import Depends
+from pydantic import TypeAdapter
 
 from app.core.enum.db_driver import DBTypesEnum
 from app.core.enum.db_key_prefix_name import DBSaveIdEnum
 from app.core.exceptions import APIException
+from app.core.executors import Workload, executors
 from app.core.status import CommonCode
 from app.core.utils import generate_prefixed_uuid
+from app.db.query_result_cache import query_result_cache
+from app.db.user_db_pool import user_db_pool
+from app.repository.catalog_repository import catalog_repository
+from app.repository.schema_cache_repository import schema_cache_repository
+from app.repository.schema_snapshot_repository import schema_snapshot_repository
 from app.repository.user_db_repository import UserDbRepository, user_db_repository
 from app.schemas.user_db.db_profile_model import AllDBProfileInfo, DBProfileInfo, UpdateOrCreateDBProfile
 from app.schemas.user_db.result_model import (
     AllDBProfileResult,
     BasicResult,
     ChangeProfileResult,
+    ColumnInfo,
     ColumnListResult,
     DBDetail,
+    SchemaChangeSet,
     SchemaDetail,
     SchemaInfoResult,
+    SchemaListResult,
+    SchemaRescanResult,
     TableInfo,
     TableListResult,
 )
 
 user_db_repository_dependency = Depends(lambda: user_db_repository)
 
+# 스키마 캐시 직렬화/역직렬화에 사용하는 어댑터
+_STR_LIST_ADAPTER = TypeAdapter(list[str])
+_COLUMN_LIST_ADAPTER = TypeAdapter(list[ColumnInfo])
+_TABLE_LIST_ADAPTER = TypeAdapter(list[TableInfo])
+_DB_DETAIL_LIST_ADAPTER = TypeAdapter(list[DBDetail])
+_FINGERPRINT_MAP_ADAPTER = TypeAdapter(dict[str, str])
+# 변경 내역 조회 기준은 지문 비교 없이 항상 사용하므로, 캐시 항목의 지문 자리에 고정 값을 둡니다.
+_CHANGE_BASELINE_FINGERPRINT = "baseline"
+
+# 하나의 프로필에 대해 동시에 실행할 스키마 조회 작업 수 (사용자 DB 커넥션 풀 크기와 맞춥니다)
+SCHEMA_SCAN_CONCURRENCY_PER_PROFILE = 4
+
 
 class UserDbService:
     def connection_test(self, db_info: DBProfileInfo, repository: UserDbRepository = user_db_repository) -> BasicResult:
@@ -67,9 +90,17 @@ class UserDbService:
         """
         DB 연결 정보를 업데이트 후 결과를 반환합니다.
         """
+        previous_profile = self._find_profile_or_none(update_db_info.id, repository)
         try:
             sql, data = self._get_update_query_and_data(update_db_info)
-            return repository.update_profile(sql, data, update_db_info)
+            result = repository.update_profile(sql, data, update_db_info)
+            if result.is_successful:
+                # 변경 전 접속 정보로 열려 있던 커넥션과 조회 결과 캐시는 더 이상 사용하지 않도록 정리합니다.
+                self._invalidate_connection_pool(previous_profile)
+                query_result_cache.invalidate_profile(update_db_info.id)
+                schema_cache_repository.delete_by_profile(update_db_info.id)
+                schema_snapshot_repository.delete_by_profile(update_db_info.id)
+            return result
         except APIException:
             raise
         except Exception as e:
@@ -79,9 +110,14 @@ class UserDbService:
         """
         DB 연결 정보를 삭제 후 결과를 반환합니다.
         """
+        previous_profile = self._find_profile_or_none(profile_id, repository)
         try:
             sql, data = self._get_delete_query_and_data(profile_id)
-            return repository.delete_profile(sql, data, profile_id)
+            result = repository.delete_profile(sql, data, profile_id)
+            if result.is_successful:
+                self._invalidate_connection_pool(previous_profile)
+                query_result_cache.invalidate_profile(profile_id)
+            return result
         except APIException:
             raise
         except Exception as e:
@@ -116,22 +152,35 @@ class UserDbService:
             raise APIException(CommonCode.FAIL_FIND_PROFILE) from e
 
     def find_schemas(
-        self, db_info: AllDBProfileInfo, repository: UserDbRepository = user_db_repository
+        self, db_info: AllDBProfileInfo, refresh: bool = False, repository: UserDbRepository = user_db_repository
     ) -> SchemaInfoResult:
         """
         DB 스키마 정보를 조회를 수행합니다.
+        스키마 지문이 같으면 캐시된 결과를 반환하며, `refresh`가 True이면 항상 새로 조회합니다.
         """
         try:
             driver_module = self._get_driver_module(db_info.type)
             connect_kwargs = self._prepare_connection_args(db_info)
             schema_query = self._get_schema_query(db_info.type)
 
-            return repository.find_schemas(driver_module, schema_query, **connect_kwargs)
+            fingerprint = self._get_schema_fingerprint(db_info, driver_module, connect_kwargs, repository)
+            cached = self._read_schema_cache(db_info, "schemas", fingerprint, _STR_LIST_ADAPTER, refresh)
+            if cached is not None:
+                return SchemaListResult(is_successful=True, code=CommonCode.SUCCESS_FIND_SCHEMAS, schemas=cached)
+
+            result = repository.find_schemas(driver_module, schema_query, **connect_kwargs)
+            if result.is_successful:
+                self._write_schema_cache(db_info, "schemas", fingerprint, _STR_LIST_ADAPTER, result.schemas)
+            return result
         except Exception as e:
             raise APIException(CommonCode.FAIL) from e
 
     def find_tables(
-        self, db_info: AllDBProfileInfo, schema_name: str, repository: UserDbRepository = user_db_repository
+        self,
+        db_info: AllDBProfileInfo,
+        schema_name: str,
+        refresh: bool = False,
+        repository: UserDbRepository = user_db_repository,
     ) -> TableListResult:
         """
         특정 스키마 내의 테이블 정보를 조회합니다.
@@ -141,7 +190,18 @@ class UserDbService:
             connect_kwargs = self._prepare_connection_args(db_info)
             table_query = self._get_table_query(db_info.type, for_all_schemas=False)
 
-            return repository.find_tables(driver_module, table_query, schema_name, **connect_kwargs)
+            cache_key = f"tables:{schema_name}"
+            fingerprint = self._get_schema_fingerprint(
+                db_info, driver_module, connect_kwargs, repository, schema_name=schema_name
+            )
+            cached = self._read_schema_cache(db_info, cache_key, fingerprint, _STR_LIST_ADAPTER, refresh)
+            if cached is not None:
+                return TableListResult(is_successful=True, code=CommonCode.SUCCESS_FIND_TABLES, tables=cached)
+
+            result = repository.find_tables(driver_module, table_query, schema_name, **connect_kwargs)
+            if result.is_successful:
+                self._write_schema_cache(db_info, cache_key, fingerprint, _STR_LIST_ADAPTER, result.tables)
+            return result
         except Exception as e:
             raise APIException(CommonCode.FAIL) from e
 
@@ -150,6 +210,7 @@ class UserDbService:
         db_info: AllDBProfileInfo,
         schema_name: str,
         table_name: str,
+        refresh: bool = False,
         repository: UserDbRepository = user_db_repository,
     ) -> ColumnListResult:
         """
@@ -161,14 +222,25 @@ class UserDbService:
             column_query = self._get_column_query(db_info.type)
             db_type = db_info.type
 
-            return repository.find_columns(
+            cache_key = f"columns:{schema_name}.{table_name}"
+            fingerprint = self._get_schema_fingerprint(
+                db_info, driver_module, connect_kwargs, repository, schema_name=schema_name
+            )
+            cached = self._read_schema_cache(db_info, cache_key, fingerprint, _COLUMN_LIST_ADAPTER, refresh)
+            if cached is not None:
+                return ColumnListResult(is_successful=True, code=CommonCode.SUCCESS_FIND_COLUMNS, columns=cached)
+
+            result = repository.find_columns(
                 driver_module, column_query, schema_name, db_type, table_name, **connect_kwargs
             )
+            if result.is_successful:
+                self._write_schema_cache(db_info, cache_key, fingerprint, _COLUMN_LIST_ADAPTER, result.columns)
+            return result
         except Exception as e:
             raise APIException(CommonCode.FAIL) from e
 
     def get_full_schema_info(
-        self, db_info: AllDBProfileInfo, repository: UserDbRepository = user_db_repository
+        self, db_info: AllDBProfileInfo, refresh: bool = False, repository: UserDbRepository = user_db_repository
     ) -> list[TableInfo]:
         """
         DB 프로필 정보를 받아 해당 데이터베이스의 전체 스키마 정보
@@ -178,31 +250,23 @@ class UserDbService:
         try:
             driver_module = self._get_driver_module(db_info.type)
             connect_kwargs = self._prepare_connection_args(db_info)
-            schemas_to_scan = self._get_schemas_to_scan(db_info, repository, driver_module, connect_kwargs)
-
-            full_schema_info = []
-            for schema_name in schemas_to_scan:
-                tables_result = repository.find_tables(
-                    driver_module, self._get_table_query(db_info.type), schema_name, **connect_kwargs
-                )
-                logging.info(
-                    f"Found {len(tables_result.tables)} tables in schema '{schema_name}': {tables_result.tables}"
-                )
-
-                if not tables_result.is_successful:
-                    logging.warning(f"Failed to find tables for schema '{schema_name}'. Skipping.")
-                    continue
-
-                for table_name in tables_result.tables:
-                    table_info = self._get_table_details(
-                        driver_module, db_info, schema_name, table_name, connect_kwargs, repository
-                    )
-                    full_schema_info.append(table_info)
+
+            schema_name = db_info.username if db_info.type.lower() == "oracle" else None
+            fingerprint = self._get_schema_fingerprint(
+                db_info, driver_module, connect_kwargs, repository, schema_name=schema_name
+            )
+            cached = self._read_schema_cache(db_info, "all-schemas", fingerprint, _TABLE_LIST_ADAPTER, refresh)
+            if cached is not None:
+                logging.info(f"Serving schema scan for db_profile {db_info.id} from cache.")
+                return cached
+
+            full_schema_info = self._rescan_schemas(db_info, driver_module, connect_kwargs, repository).tables
 
             logging.info(
                 f"Finished schema scan. Total tables found: {len(full_schema_info)}. "
                 f"Table names: {[t.name for t in full_schema_info]}"
             )
+            self._write_schema_cache(db_info, "all-schemas", fingerprint, _TABLE_LIST_ADAPTER, full_schema_info)
             return full_schema_info
         except APIException:
             raise
@@ -210,8 +274,30 @@ class UserDbService:
             logging.error("An unexpected error occurred in get_full_schema_info", exc_info=True)
             raise APIException(CommonCode.FAIL) from e
 
-    def get_hierarchical_schema_info(
+    def rescan_schema(
         self, db_info: AllDBProfileInfo, repository: UserDbRepository = user_db_repository
+    ) -> SchemaRescanResult:
+        """
+        직전 스냅샷과 비교하여 전체 스키마 정보를 증분 재조회합니다.
+        추가되었거나 정의가 바뀐 테이블만 상세 조회하며, 스키마별 변경 내역을 함께 반환합니다.
+        스냅샷은 다른 조회(전체/계층 조회)에서도 갱신되므로, 변경 내역은 이 메서드 전용 기준(직전 호출 시점의
+        테이블별 지문)과 비교하여 다시 계산합니다.
+        """
+        logging.info(f"Starting incremental schema re-scan for db_profile: {db_info.id}")
+        try:
+            driver_module = self._get_driver_module(db_info.type)
+            connect_kwargs = self._prepare_connection_args(db_info)
+            result = self._rescan_schemas(db_info, driver_module, connect_kwargs, repository)
+            result.changes = [self._diff_against_change_baseline(db_info, change_set) for change_set in result.changes]
+            return result
+        except APIException:
+            raise
+        except Exception as e:
+            logging.error("An unexpected error occurred in rescan_schema", exc_info=True)
+            raise APIException(CommonCode.FAIL) from e
+
+    def get_hierarchical_schema_info(
+        self, db_info: AllDBProfileInfo, refresh: bool = False, repository: UserDbRepository = user_db_repository
     ) -> list[DBDetail]:
         """
         DB 프로필 정보를 받아 해당 DBMS의 전체 데이터베이스 및 스키마 정보를
@@ -229,13 +315,19 @@ class UserDbService:
             if not databases_result.is_successful:
                 raise APIException(CommonCode.FAIL_FIND_DATABASES)
 
-            all_db_details = []
-            for db_name in sorted(databases_result.databases):
-                db_detail = self._get_db_schema_details(db_name, db_info, driver_module, repository)
-                if db_detail:
-                    all_db_details.append(db_detail)
+            db_names = sorted(databases_result.databases)
+            fingerprint = self._get_hierarchical_fingerprint(
+                db_names, db_info, driver_module, initial_connect_kwargs, repository
+            )
+            cached = self._read_schema_cache(db_info, "hierarchical", fingerprint, _DB_DETAIL_LIST_ADAPTER, refresh)
+            if cached is not None:
+                logging.info(f"Serving hierarchical schema scan for db_profile {db_info.id} from cache.")
+                return cached
+
+            all_db_details = self._scan_databases(db_names, db_info, driver_module, repository)
 
             logging.info(f"Finished hierarchical schema scan. Total databases found: {len(all_db_details)}.")
+            self._write_schema_cache(db_info, "hierarchical", fingerprint, _DB_DETAIL_LIST_ADAPTER, all_db_details)
             return all_db_details
         except APIException:
             raise
@@ -243,14 +335,287 @@ class UserDbService:
             logging.error("An unexpected error occurred in get_hierarchical_schema_info", exc_info=True)
             raise APIException(CommonCode.FAIL) from e
 
-    def _get_db_schema_details(
+    # ─────────────────────────────
+    # 스키마 캐시
+    # ─────────────────────────────
+    def _get_schema_fingerprint(
+        self,
+        db_info: AllDBProfileInfo,
+        driver_module: Any,
+        connect_kwargs: dict[str, Any],
+        repository: UserDbRepository,
+        schema_name: str | None = None,
+    ) -> str | None:
+        """
+        프로필이 가리키는 DB의 스키마 지문을 조회합니다.
+        Oracle은 스키마(소유자) 단위로, MySQL/MariaDB는 지정한 스키마 또는 프로필이 스캔하는 스키마(DB 이름, 사용자)만 조회합니다.
+        """
+        db_type = db_info.type.lower()
+        schema_names = None
+        if db_type == "oracle" and schema_name:
+            schema_names = [schema_name]
+        elif db_type in ("mysql", "mariadb"):
+            schema_names = [schema_name] if schema_name else sorted({n for n in (db_info.name, db_info.username) if n})
+        return repository.find_schema_fingerprint(driver_module, db_info.type, schema_names, **connect_kwargs)
+
+    def _get_hierarchical_fingerprint(
+        self,
+        db_names: list[str],
+        db_info: AllDBProfileInfo,
+        driver_module: Any,
+        connect_kwargs: dict[str, Any],
+        repository: UserDbRepository,
+    ) -> str | None:
+        """
+        계층 조회 대상 전체의 지문을 구성합니다.
+        PostgreSQL은 카탈로그가 데이터베이스마다 분리되어 있으므로 데이터베이스별 지문을 모두 이어 붙입니다.
+        """
+        db_type = db_info.type.lower()
+        if db_type in ("mysql", "mariadb"):
+            # 계층 조회는 프로필의 스키마가 아니라 조회된 모든 데이터베이스를 대상으로 합니다.
+            return repository.find_schema_fingerprint(driver_module, db_info.type, db_names, **connect_kwargs)
+        if db_type != "postgresql":
+            return self._get_schema_fingerprint(db_info, driver_module, connect_kwargs, repository)
+
+        fingerprints = executors.map_ordered(
+            Workload.SCHEMA_SCAN,
+            lambda db_name: self._get_schema_fingerprint(
+                db_info,
+                driver_module,
+                self._prepare_connection_args(db_info.model_copy(update={"name": db_name})),
+                repository,
+            ),
+            db_names,
+            max_concurrency=SCHEMA_SCAN_CONCURRENCY_PER_PROFILE,
+        )
+        if any(fingerprint is None for fingerprint in fingerprints):
+            return None
+        return "|".join(f"{db_name}={fp}" for db_name, fp in zip(db_names, fingerprints, strict=True))
+
+    def _read_schema_cache(
+        self, db_info: AllDBProfileInfo, object_key: str, fingerprint: str | None, adapter: TypeAdapter, refresh: bool
+    ) -> Any | None:
+        """지문이 일치하는 캐시가 있으면 역직렬화하여 반환합니다. 지문이 없거나 새로고침 요청이면 None을 반환합니다."""
+        if fingerprint is None or refresh:
+            return None
+        try:
+            cached = schema_cache_repository.find_cache(db_info.id, object_key)
+            if cached is None or cached[0] != fingerprint:
+                return None
+            return adapter.validate_json(cached[1])
+        except (sqlite3.Error, ValueError) as e:
+            logging.warning(f"Failed to read schema cache '{object_key}' for db_profile {db_info.id}: {e}")
+            return None
+
+    def _write_schema_cache(
+        self, db_info: AllDBProfileInfo, object_key: str, fingerprint: str | None, adapter: TypeAdapter, value: Any
+    ) -> None:
+        """조회 결과를 조회 직전에 읽은 지문과 함께 저장합니다. 저장 실패는 응답에 영향을 주지 않습니다."""
+        if fingerprint is None:
+            return
+        try:
+            schema_cache_repository.save_cache(db_info.id, object_key, fingerprint, adapter.dump_json(value).decode())
+        except sqlite3.Error as e:
+            logging.warning(f"Failed to write schema cache '{object_key}' for db_profile {db_info.id}: {e}")
+
+    # ─────────────────────────────
+    # 증분 재조회
+    # ─────────────────────────────
+    def _rescan_schemas(
+        self,
+        db_info: AllDBProfileInfo,
+        driver_module: Any,
+        connect_kwargs: dict[str, Any],
+        repository: UserDbRepository,
+    ) -> SchemaRescanResult:
+        """프로필의 스캔 대상 스키마를 차례로 증분 재조회합니다."""
+        db_name = "main" if db_info.type.lower() == "sqlite" else (db_info.name or "")
+        result = SchemaRescanResult()
+        for schema_name in sorted(self._get_schemas_to_scan(db_info, repository, driver_module, connect_kwargs)):
+            tables_result = repository.find_tables(
+                driver_module, self._get_table_query(db_info.type), schema_name, **connect_kwargs
+            )
+            logging.info(f"Found {len(tables_result.tables)} tables in schema '{schema_name}': {tables_result.tables}")
+
+            if not tables_result.is_successful:
+                logging.warning(f"Failed to find tables for schema '{schema_name}'. Skipping.")
+                continue
+
+            tables, change_set = self._rescan_schema_tables(
+                driver_module, db_info, db_name, schema_name, tables_result.tables, connect_kwargs, repository
+            )
+            result.tables.extend(tables)
+            result.changes.append(change_set)
+        return result
+
+    def _rescan_schema_tables(
         self,
+        driver_module: Any,
+        db_info: AllDBProfileInfo,
         db_name: str,
+        schema_name: str,
+        table_names: list[str],
+        connect_kwargs: dict[str, Any],
+        repository: UserDbRepository,
+    ) -> tuple[list[TableInfo], SchemaChangeSet]:
+        """
+        테이블별 DDL 지문을 직전 스냅샷과 비교하여, 추가되었거나 정의가 바뀐 테이블만 상세 조회합니다.
+        - 바뀌지 않은 테이블은 스냅샷에서 복원하고, 사라진 테이블의 스냅샷은 제거합니다.
+        - 지문을 조회할 수 없는 DB는 모든 테이블을 다시 조회하며, 스냅샷을 남기지 않습니다.
+        """
+        fingerprints = None
+        if catalog_repository.supports(db_info.type):
+            fingerprints = catalog_repository.find_table_fingerprints(
+                driver_module, db_info.type, schema_name, **connect_kwargs
+            )
+        snapshots = self._find_snapshots(db_info, db_name, schema_name)
+
+        change_set = SchemaChangeSet(db_name=db_name, schema_name=schema_name, fingerprints=fingerprints or {})
+        reused: dict[str, TableInfo] = {}
+        for table_name in table_names:
+            snapshot = snapshots.get(table_name)
+            if snapshot is None:
+                change_set.added.append(table_name)
+            elif snapshot[0] == change_set.fingerprints.get(table_name) and (
+                table_info := self._restore_snapshot(snapshot[1])
+            ):
+                reused[table_name] = table_info
+                change_set.unchanged.append(table_name)
+            else:
+                change_set.altered.append(table_name)
+        change_set.removed = sorted(set(snapshots) - set(table_names))
+
+        to_fetch = change_set.added + change_set.altered
+        fetched = dict(
+            zip(
+                to_fetch,
+                self._get_schema_table_details(
+                    driver_module, db_info, schema_name, to_fetch, connect_kwargs, repository
+                ),
+                strict=True,
+            )
+        )
+        logging.info(
+            f"Re-scanned schema '{db_name}.{schema_name}': added={len(change_set.added)}, "
+            f"altered={len(change_set.altered)}, removed={len(change_set.removed)}, "
+            f"unchanged={len(change_set.unchanged)}"
+        )
+
+        if fingerprints is not None:
+            upserts = [
+                (table_name, fingerprints[table_name], table_info.model_dump_json())
+                for table_name, table_info in fetched.items()
+                if table_name in fingerprints
+            ]
+            self._save_snapshots(db_info, db_name, schema_name, upserts, change_set.removed)
+
+        return [reused.get(table_name) or fetched[table_name] for table_name in table_names], change_set
+
+    def _diff_against_change_baseline(self, db_info: AllDBProfileInfo, change_set: SchemaChangeSet) -> SchemaChangeSet:
+        """
+        변경 내역 조회 전용 기준과 비교한 변경 내역을 반환하고, 현재 지문을 다음 비교의 기준으로 저장합니다.
+        기준이 없으면(첫 조회) 모든 테이블을 추가된 것으로 보며, 지문을 조회할 수 없는 DB는 스냅샷 기준 결과를 그대로 반환합니다.
+        """
+        current = change_set.fingerprints
+        if not current:
+            return change_set
+        object_key = f"schema-changes:{change_set.db_name}.{change_set.schema_name}"
+        baseline = (
+            self._read_schema_cache(db_info, object_key, _CHANGE_BASELINE_FINGERPRINT, _FINGERPRINT_MAP_ADAPTER, False)
+            or {}
+        )
+
+        table_names = change_set.added + change_set.altered + change_set.unchanged
+        diffed = SchemaChangeSet(
+            db_name=change_set.db_name,
+            schema_name=change_set.schema_name,
+            fingerprints=current,
+            added=[name for name in table_names if name not in baseline],
+            altered=[name for name in table_names if name in baseline and baseline[name] != current.get(name)],
+            unchanged=[name for name in table_names if name in baseline and baseline[name] == current.get(name)],
+            removed=sorted(set(baseline) - set(table_names)),
+        )
+        self._write_schema_cache(
+            db_info,
+            object_key,
+            _CHANGE_BASELINE_FINGERPRINT,
+            _FINGERPRINT_MAP_ADAPTER,
+            {name: current[name] for name in table_names if name in current},
+        )
+        return diffed
+
+    def _find_snapshots(self, db_info: AllDBProfileInfo, db_name: str, schema_name: str) -> dict[str, tuple[str, str]]:
+        try:
+            return schema_snapshot_repository.find_snapshots(db_info.id, db_name, schema_name)
+        except sqlite3.Error as e:
+            logging.warning(f"Failed to read schema snapshot '{db_name}.{schema_name}' for {db_info.id}: {e}")
+            return {}
+
+    def _restore_snapshot(self, payload: str) -> TableInfo | None:
+        try:
+            return TableInfo.model_validate_json(payload)
+        except ValueError:
+            return None
+
+    def _save_snapshots(
+        self,
+        db_info: AllDBProfileInfo,
+        db_name: str,
+        schema_name: str,
+        upserts: list[tuple[str, str, str]],
+        removed: list[str],
+    ) -> None:
+        try:
+            schema_snapshot_repository.apply_changes(db_info.id, db_name, schema_name, upserts, removed)
+        except sqlite3.Error as e:
+            logging.warning(f"Failed to save schema snapshot '{db_name}.{schema_name}' for {db_info.id}: {e}")
+
+    def _scan_databases(
+        self,
+        db_names: list[str],
         db_info: AllDBProfileInfo,
         driver_module: Any,
         repository: UserDbRepository,
-    ) -> DBDetail | None:
-        """특정 데이터베이스의 모든 스키마와 테이블 정보를 조회하여 DBDetail 모델을 반환합니다."""
+    ) -> list[DBDetail]:
+        """
+        여러 데이터베이스의 스키마 정보를 병렬로 조회하여, 입력 순서(정렬 순서)대로 DBDetail 목록을 반환합니다.
+        1) 데이터베이스별 스키마 목록 조회 2) (데이터베이스, 스키마) 단위의 테이블 상세 조회를 각각 병렬로 실행합니다.
+        두 단계 모두 같은 풀을 사용하므로, 작업 안에서 다시 작업을 기다리지 않도록 단위를 평탄화하여 제출합니다.
+        """
+        plans = executors.map_ordered(
+            Workload.SCHEMA_SCAN,
+            lambda db_name: self._plan_db_scan(db_name, db_info, driver_module, repository),
+            db_names,
+            max_concurrency=SCHEMA_SCAN_CONCURRENCY_PER_PROFILE,
+        )
+
+        units = [(plan, schema_name) for plan in plans if plan for schema_name in plan["schemas"]]
+        schema_details = executors.map_ordered(
+            Workload.SCHEMA_SCAN,
+            lambda unit: self._scan_schema(unit[0], unit[1], driver_module, repository),
+            units,
+            max_concurrency=SCHEMA_SCAN_CONCURRENCY_PER_PROFILE,
+        )
+
+        details_by_db: dict[str, list[SchemaDetail]] = {}
+        for (plan, _), schema_detail in zip(units, schema_details, strict=True):
+            if schema_detail:
+                details_by_db.setdefault(plan["db_name"], []).append(schema_detail)
+
+        return [
+            DBDetail(db_name=plan["db_name"], db_type=db_info.type, schemas=details_by_db[plan["db_name"]])
+            for plan in plans
+            if plan and details_by_db.get(plan["db_name"])
+        ]
+
+    def _plan_db_scan(
+        self,
+        db_name: str,
+        db_info: AllDBProfileInfo,
+        driver_module: Any,
+        repository: UserDbRepository,
+    ) -> dict[str, Any] | None:
+        """특정 데이터베이스의 접속 정보와 조회할 스키마 목록(정렬됨)을 구성합니다. 실패 시 None을 반환합니다."""
         db_type = db_info.type.lower()
         if db_type == "sqlite":
             current_db_info = db_info
@@ -270,34 +635,43 @@ class UserDbService:
         if db_type == "sqlite" and not schemas_to_scan:
             schemas_to_scan = ["main"]
 
-        schema_details = []
-        for schema_name in sorted(schemas_to_scan):
-            effective_schema_name = schema_name.upper() if db_type == "oracle" else schema_name
-            table_query = self._get_table_query(db_type)
-            tables_result = repository.find_tables(driver_module, table_query, effective_schema_name, **connect_kwargs)
-
-            if not tables_result.is_successful:
-                logging.warning(f"Failed to find tables for schema '{effective_schema_name}'. Skipping.")
-                continue
-
-            table_details = [
-                self._get_table_details(
-                    driver_module,
-                    current_db_info,
-                    effective_schema_name,
-                    table_name,
-                    connect_kwargs,
-                    repository,
-                )
-                for table_name in tables_result.tables
-            ]
+        return {
+            "db_name": db_name,
+            "db_info": current_db_info,
+            "connect_kwargs": connect_kwargs,
+            "schemas": sorted(schemas_to_scan),
+        }
 
-            if table_details:
-                schema_details.append(SchemaDetail(schema_name=schema_name, tables=table_details))
+    def _scan_schema(
+        self,
+        plan: dict[str, Any],
+        schema_name: str,
+        driver_module: Any,
+        repository: UserDbRepository,
+    ) -> SchemaDetail | None:
+        """단일 스키마의 테이블 상세 정보를 조회하여 SchemaDetail 모델을 반환합니다."""
+        db_type = plan["db_info"].type.lower()
+        connect_kwargs = plan["connect_kwargs"]
+        effective_schema_name = schema_name.upper() if db_type == "oracle" else schema_name
+        table_query = self._get_table_query(db_type)
+        tables_result = repository.find_tables(driver_module, table_query, effective_schema_name, **connect_kwargs)
+
+        if not tables_result.is_successful:
+            logging.warning(f"Failed to find tables for schema '{effective_schema_name}'. Skipping.")
+            return None
 
-        if schema_details:
-            return DBDetail(db_name=db_name, db_type=db_info.type, schemas=schema_details)
+        table_details, _ = self._rescan_schema_tables(
+            driver_module,
+            plan["db_info"],
+            plan["db_name"],
+            effective_schema_name,
+            tables_result.tables,
+            connect_kwargs,
+            repository,
+        )
 
+        if table_details:
+            return SchemaDetail(schema_name=schema_name, tables=table_details)
         return None
 
     def _get_schemas_to_scan(
@@ -329,6 +703,35 @@ class UserDbService:
         logging.info(f"Final schemas to scan: {list(schemas_to_scan)}")
         return schemas_to_scan
 
+    def _get_schema_table_details(
+        self,
+        driver_module: Any,
+        db_info: AllDBProfileInfo,
+        schema_name: str,
+        table_names: list[str],
+        connect_kwargs: dict[str, Any],
+        repository: UserDbRepository,
+    ) -> list[TableInfo]:
+        """
+        스키마에 속한 테이블들의 상세 정보를 조회합니다.
+        일괄 조회를 지원하는 DB는 커넥션 하나로 컬럼/제약조건/인덱스를 한 번씩만 조회하고,
+        그 외 DB는 테이블 단위로 조회합니다.
+        """
+        if not table_names:
+            return []
+
+        if catalog_repository.supports(db_info.type):
+            table_infos = catalog_repository.find_schema_tables(
+                driver_module, db_info.type, schema_name, table_names, **connect_kwargs
+            )
+            logging.info(f"Fetched details for {len(table_infos)} tables in schema '{schema_name}' in bulk.")
+            return table_infos
+
+        return [
+            self._get_table_details(driver_module, db_info, schema_name, table_name, connect_kwargs, repository)
+            for table_name in table_names
+        ]
+
     def _get_table_details(
         self,
         driver_module: Any,
@@ -396,6 +799,24 @@ class UserDbService:
         except Exception as e:
             raise APIException(CommonCode.FAIL_FIND_SAMPLE_ROWS) from e
 
+    def _find_profile_or_none(self, profile_id: str | None, repository: UserDbRepository) -> AllDBProfileInfo | None:
+        """풀 무효화를 위해 변경 전 프로필을 조회합니다. 조회에 실패해도 본 작업은 계속 진행합니다."""
+        if not profile_id:
+            return None
+        try:
+            return self.find_profile(profile_id, repository)
+        except APIException:
+            return None
+
+    def _invalidate_connection_pool(self, profile: AllDBProfileInfo | None) -> None:
+        """프로필의 접속 대상과 일치하는 사용자 DB 커넥션 풀을 모두 닫습니다."""
+        if profile is None:
+            return
+        if profile.type.lower() == DBTypesEnum.sqlite.name:
+            user_db_pool.invalidate_matching(path=profile.name)
+        else:
+            user_db_pool.invalidate_matching(host=profile.host, port=profile.port, user=profile.username)
+
     def _get_driver_module(self, db_type: str):
         """
         DB 타입에 따라 동적으로 드라이버 모듈을 로드합니다.
@@ -570,7 +991,10 @@ class UserDbService:
         return sql, data
 
     def _get_find_all_query(self) -> str:
-        return "SELECT id, type, host, port, name, username, view_name, created_at, updated_at FROM db_profile"
+        return (
+            "SELECT id, type, host, port, name, username, view_name, query_timeout_sec, created_at, updated_at "
+            "FROM db_profile"
+        )
 
     def _get_find_one_query_and_data(self, profile_id: str) -> tuple[str, tuple]:
         sql = "SELECT * FROM db_profile WHERE id = ?"